@@ -57,6 +57,10 @@ class EquivalenceLibrary():
 
         self._map = {}
 
+        # Incremented on every change to the library, so that results derived
+        # from it (e.g. by the BasisTranslator) can be invalidated.
+        self._version = 0
+
     def add_equivalence(self, gate, equivalent_circuit):
         """Add a new equivalence to the library. Future queries for the Gate
         will include the given circuit, in addition to all existing equivalences
@@ -85,6 +89,7 @@ class EquivalenceLibrary():
             self._map[key] = Entry(search_base=True, equivalences=[])
 
         self._map[key].equivalences.append(equiv)
+        self._version += 1
 
     def has_entry(self, gate):
         """Check if a library contains any decompositions for gate.
@@ -130,6 +135,7 @@ class EquivalenceLibrary():
 
         self._map[key] = Entry(search_base=False,
                                equivalences=equivs)
+        self._version += 1
 
     def get_entry(self, gate):
         """Gets the set of QuantumCircuits circuits from the library which
@@ -224,6 +230,13 @@ class EquivalenceLibrary():
                             if base_key not in self._map
                             or self._map[base_key].search_base}
 
+    def _get_version(self):
+        """Return a value which changes whenever this library, or one of its
+        bases, is changed."""
+        base_version = self._base._get_version() if self._base is not None else ()
+
+        return (self._version,) + base_version
+
     def _get_equivalences(self, key):
         search_base, equivalences = self._map.get(key, (True, []))
 
@@ -13,6 +13,7 @@
 ParameterExpression Class to enable creating simple expressions of Parameters.
 """
 
+import functools
 import numbers
 import operator
 
@@ -37,6 +38,8 @@ class ParameterExpression():
         """
         self._parameter_symbols = symbol_map
         self._symbol_expr = expr
+        # Numeric function of the expression, compiled on first evaluation.
+        self._numeric = None
 
     @property
     def parameters(self):
@@ -69,6 +72,20 @@ class ParameterExpression():
         self._raise_if_passed_unknown_parameters(parameter_values.keys())
         self._raise_if_passed_non_real_value(parameter_values)
 
+        if len(parameter_values) == len(self._parameter_symbols):
+            # Fully bound, evaluate numerically instead of substituting symbolically.
+            from sympy import sympify
+            try:
+                value = self.evaluate(parameter_values)
+            except ZeroDivisionError:
+                value = numpy.inf
+            if not numpy.isfinite(value):
+                raise ZeroDivisionError('Binding provided for expression '
+                                        'results in division by zero '
+                                        '(Expression: {}, Bindings: {}).'.format(
+                                            self, parameter_values))
+            return ParameterExpression({}, sympify(value))
+
         symbol_values = {self._parameter_symbols[parameter]: value
                          for parameter, value in parameter_values.items()}
         bound_symbol_expr = self._symbol_expr.subs(symbol_values)
@@ -90,6 +107,46 @@ class ParameterExpression():
 
         return ParameterExpression(free_parameter_symbols, bound_symbol_expr)
 
+    def evaluate(self, parameter_values):
+        """Numerically evaluate the expression.
+
+        The expression is compiled to a numeric function the first time it is
+        evaluated, and later evaluations only call that function. The values
+        can be numpy arrays, in which case the expression is evaluated
+        elementwise for all of them at once.
+
+        Args:
+            parameter_values (dict): Mapping of every Parameter of the expression
+                to its value, a number or an array of numbers.
+
+        Raises:
+            CircuitError: If parameter_values does not contain exactly the
+                Parameters of the expression.
+
+        Returns:
+            complex or float or numpy.ndarray: the value of the expression.
+        """
+        parameters, function = self._numeric_function()
+        if parameter_values.keys() != self._parameter_symbols.keys():
+            self._raise_if_passed_unknown_parameters(parameter_values.keys())
+            raise CircuitError('Cannot evaluate the expression without values for '
+                               'the Parameters ({}).'.format(
+                                   [str(p) for p in self.parameters - parameter_values.keys()]))
+        return function([parameter_values[parameter] for parameter in parameters])
+
+    def _numeric_function(self):
+        """Return the parameters of the expression and its numeric function.
+
+        The function takes the list of the values of the parameters, in the
+        order of the returned parameters.
+        """
+        if self._numeric is None:
+            parameters = tuple(self._parameter_symbols)
+            indices = {self._parameter_symbols[parameter]: index
+                       for index, parameter in enumerate(parameters)}
+            self._numeric = (parameters, _compile(self._symbol_expr, indices))
+        return self._numeric
+
     def subs(self, parameter_map):
         """Returns a new Expression with replacement Parameters.
 
@@ -261,8 +318,63 @@ class ParameterExpression():
     def __deepcopy__(self, memo=None):
         return self
 
+    def __getstate__(self):
+        # The compiled numeric function cannot be pickled.
+        state = self.__dict__.copy()
+        state['_numeric'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__dict__.setdefault('_numeric', None)
+
     def __eq__(self, other):
-        from sympy import srepr
+        if self is other:
+            return True
         return (isinstance(other, ParameterExpression)
-                and self.parameters == other.parameters
-                and srepr(self._symbol_expr) == srepr(other._symbol_expr))
+                and self._parameter_symbols.keys() == other._parameter_symbols.keys()
+                and self._symbol_expr == other._symbol_expr)
+
+
+def _compile(expr, indices):
+    """Compile a sympy expression into a numeric function.
+
+    Args:
+        expr (sympy.Expr): the expression to compile.
+        indices (dict): mapping of the symbols of ``expr`` to the index of their
+            value in the list passed to the function.
+
+    Returns:
+        callable: a function of the list of the values of the symbols, which
+        accepts numbers as well as numpy arrays.
+    """
+    if expr.is_Symbol:
+        return operator.itemgetter(indices[expr])
+    if expr.is_number:
+        if expr.is_Integer:
+            constant = int(expr)
+        else:
+            constant = complex(expr)
+            if constant.imag == 0:
+                constant = constant.real
+        return lambda values: constant
+    if expr.is_Add or expr.is_Mul:
+        reduction = operator.add if expr.is_Add else operator.mul
+        terms = [_compile(arg, indices) for arg in expr.args]
+        return lambda values: functools.reduce(reduction, [term(values) for term in terms])
+    if expr.is_Pow:
+        base, exponent = (_compile(arg, indices) for arg in expr.args)
+        return lambda values: _power(base(values), exponent(values))
+    # Anything else, e.g. functions, goes through sympy's code generation.
+    from sympy import lambdify
+    symbols = sorted(indices, key=indices.get)
+    function = lambdify(symbols, expr, modules='numpy')
+    return lambda values: function(*values)
+
+
+def _power(base, exponent):
+    """Raise ``base`` to ``exponent``, evaluating numpy integers as floats, since
+    numpy does not allow integers to negative integer powers."""
+    if isinstance(base, (numpy.ndarray, numpy.integer)) and base.dtype.kind in 'biu':
+        base = base.astype(float)
+    return base ** exponent
@@ -17,6 +17,104 @@ from collections.abc import MutableMapping
 from .instruction import Instruction
 
 
+class ParameterReferences:
+    """The places, in a circuit, where a parameter is used.
+
+    A collection of unique ``(instruction, parameter_index)`` pairs, in
+    insertion order, each with the number of times the instruction appears in
+    the circuit. Membership tests, additions and removals take constant time.
+    """
+
+    __slots__ = ['_references']
+
+    def __init__(self, instr_params=()):
+        """
+        Args:
+            instr_params (iterable): ``(instruction, parameter_index)`` pairs.
+        """
+        self._references = {}
+        for instruction, param_index in instr_params:
+            self.add(instruction, param_index)
+
+    def add(self, instruction, param_index, count=1):
+        """Add ``count`` references to the parameter at ``param_index`` of ``instruction``."""
+        assert isinstance(instruction, Instruction)
+        assert isinstance(param_index, int)
+        key = (id(instruction), param_index)
+        reference = self._references.get(key)
+        if reference is None:
+            self._references[key] = [instruction, param_index, count]
+        else:
+            reference[2] += count
+
+    def discard(self, instruction, param_index):
+        """Remove one reference to the parameter at ``param_index`` of ``instruction``."""
+        key = (id(instruction), param_index)
+        reference = self._references.get(key)
+        if reference is not None:
+            reference[2] -= 1
+            if reference[2] <= 0:
+                del self._references[key]
+
+    def update(self, other):
+        """Add the references of another ``ParameterReferences`` which are not already present."""
+        for key, (instruction, param_index, count) in other._references.items():
+            if key not in self._references:
+                self.add(instruction, param_index, count)
+
+    def copy(self, instruction_map=None):
+        """Return a copy of the references.
+
+        Args:
+            instruction_map (dict): mapping of the ``id`` of the instructions
+                to the instructions referenced by the copy, e.g. copies of the
+                instructions. Defaults to the same instructions.
+
+        Returns:
+            ParameterReferences: the copy.
+        """
+        references = ParameterReferences()
+        if instruction_map is None:
+            references._references = {key: reference.copy()
+                                      for key, reference in self._references.items()}
+        else:
+            for instruction, param_index, count in self._references.values():
+                references.add(instruction_map[id(instruction)], param_index, count)
+        return references
+
+    def __getstate__(self):
+        # The references are keyed by the ids of the instructions, which are
+        # not preserved by copies and pickling.
+        return list(self._references.values())
+
+    def __setstate__(self, state):
+        self._references = {}
+        for instruction, param_index, count in state:
+            self.add(instruction, param_index, count)
+
+    def __contains__(self, instr_param):
+        instruction, param_index = instr_param
+        return (id(instruction), param_index) in self._references
+
+    def __getitem__(self, index):
+        return list(self)[index]
+
+    def __iter__(self):
+        return ((instruction, param_index)
+                for instruction, param_index, _ in self._references.values())
+
+    def __len__(self):
+        return len(self._references)
+
+    def __eq__(self, other):
+        if isinstance(other, ParameterReferences):
+            return list(self) == list(other)
+        return list(self) == other
+
+    def __repr__(self):
+        return repr(list(self))
+
+
 class ParameterTable(MutableMapping):
     """Class for managing and setting circuit parameters"""
 
@@ -25,11 +123,15 @@ class ParameterTable(MutableMapping):
     def __init__(self, *args, **kwargs):
         """
         the structure of _table is,
-           {var_object: [(instruction_object, parameter_index), ...]}
+           {var_object: ParameterReferences([(instruction_object, parameter_index), ...])}
+
+        The table also indexes the parameters by name.
         """
-        self._table = dict(*args, **kwargs)
-        self._keys = set(self._table)
-        self._names = {x.name for x in self._table}
+        self._table = {}
+        self._keys = set()
+        self._names = {}
+        for parameter, instr_params in dict(*args, **kwargs).items():
+            self[parameter] = instr_params
 
     def __getitem__(self, key):
         return self._table[key]
@@ -42,13 +144,72 @@ class ParameterTable(MutableMapping):
             instr_params (list): List of (Instruction, int) tuples. Int is the
               parameter index at which the parameter appears in the instruction.
         """
-
-        for instruction, param_index in instr_params:
-            assert isinstance(instruction, Instruction)
-            assert isinstance(param_index, int)
+        if not isinstance(instr_params, ParameterReferences):
+            instr_params = ParameterReferences(instr_params)
+        if parameter not in self._table:
+            self._keys.add(parameter)
+            self._names[parameter.name] = parameter
         self._table[parameter] = instr_params
-        self._keys.add(parameter)
-        self._names.add(parameter.name)
+
+    def add_reference(self, parameter, instruction, param_index):
+        """Record that ``parameter`` is used at ``param_index`` of ``instruction``.
+
+        Args:
+            parameter (Parameter): the parameter.
+            instruction (Instruction): the instruction using the parameter.
+            param_index (int): the index of the instruction parameter which
+                depends on ``parameter``.
+        """
+        if parameter in self._table:
+            self._table[parameter].add(instruction, param_index)
+        else:
+            self[parameter] = ParameterReferences([(instruction, param_index)])
+
+    def discard_references(self, instruction):
+        """Remove one reference to each parameter used by ``instruction``.
+
+        Parameters which are no longer used by any instruction are removed
+        from the table.
+
+        Args:
+            instruction (Instruction): an instruction removed from the circuit.
+        """
+        for param_index, param in enumerate(instruction.params):
+            for parameter in getattr(param, 'parameters', ()):
+                if parameter in self._table:
+                    references = self._table[parameter]
+                    references.discard(instruction, param_index)
+                    if not references:
+                        del self[parameter]
+
+    def merge(self, parameter, instr_params):
+        """Add references to ``parameter``, creating its entry if needed.
+
+        Args:
+            parameter (Parameter): the parameter.
+            instr_params (ParameterReferences): the references to add.
+        """
+        if parameter in self._table:
+            self._table[parameter].update(instr_params)
+        else:
+            self[parameter] = instr_params.copy()
+
+    def remap(self, instruction_map):
+        """Return a copy of the table referencing other instructions.
+
+        Args:
+            instruction_map (dict): mapping of the ``id`` of every instruction in
+                the table to the instruction replacing it, e.g. its copy.
+
+        Returns:
+            ParameterTable: the copy.
+        """
+        table = ParameterTable()
+        table._table = {parameter: references.copy(instruction_map)
+                        for parameter, references in self._table.items()}
+        table._keys = self._keys.copy()
+        table._names = self._names.copy()
+        return table
 
     def get_keys(self):
         """Return a set of all keys in the parameter table
@@ -64,12 +225,25 @@ class ParameterTable(MutableMapping):
         Returns:
             set: A set of all the names in the parameter table
         """
-        return self._names
+        return self._names.keys()
+
+    def get_parameter(self, name):
+        """Return the parameter with the given name.
+
+        Args:
+            name (str): the name of the parameter.
+
+        Returns:
+            Parameter: the parameter, or ``None`` if the table has no parameter
+            with that name.
+        """
+        return self._names.get(name)
 
     def __delitem__(self, key):
         del self._table[key]
         self._keys.discard(key)
-        self._names.discard(key.name)
+        if self._names.get(key.name) is key:
+            del self._names[key.name]
 
     def __iter__(self):
         return iter(self._table)
@@ -225,7 +225,8 @@ class QuantumCircuit:
 
         # TODO: remove the DAG from this function
         from qiskit.converters import circuit_to_dag
-        return circuit_to_dag(self) == circuit_to_dag(other)
+        return (circuit_to_dag(self, copy_operations=False)
+                == circuit_to_dag(other, copy_operations=False))
 
     @classmethod
     def _increment_instances(cls):
@@ -848,24 +849,14 @@ class QuantumCircuit:
                 current_parameters = self._parameter_table
 
                 for parameter in param.parameters:
-                    if parameter in current_parameters:
-                        if not self._check_dup_param_spec(self._parameter_table[parameter],
-                                                          instruction, param_index):
-                            self._parameter_table[parameter].append((instruction, param_index))
-                    else:
-                        if parameter.name in self._parameter_table.get_names():
-                            raise CircuitError(
-                                'Name conflict on adding parameter: {}'.format(parameter.name))
-                        self._parameter_table[parameter] = [(instruction, param_index)]
+                    existing = current_parameters.get_parameter(parameter.name)
+                    if existing is not None and existing != parameter:
+                        raise CircuitError(
+                            'Name conflict on adding parameter: {}'.format(parameter.name))
+                    current_parameters.add_reference(parameter, instruction, param_index)
 
         return instruction
 
-    def _check_dup_param_spec(self, parameter_spec_list, instruction, param_index):
-        for spec in parameter_spec_list:
-            if spec[0] is instruction and spec[1] == param_index:
-                return True
-        return False
-
     def add_register(self, *regs):
         """Add registers."""
         if not regs:
@@ -966,7 +957,7 @@ class QuantumCircuit:
         from qiskit.converters.dag_to_circuit import dag_to_circuit
         pass_ = Decompose()
         decomposed_dag = pass_.run(circuit_to_dag(self))
-        return dag_to_circuit(decomposed_dag)
+        return dag_to_circuit(decomposed_dag, copy_operations=False)
 
     def _check_compatible_regs(self, rhs):
         """Raise exception if the circuits are defined on incompatible registers"""
@@ -1561,11 +1552,7 @@ class QuantumCircuit:
         instr_copies = {id_: instr.copy()
                         for id_, instr in instr_instances.items()}
 
-        cpy._parameter_table = ParameterTable({
-            param: [(instr_copies[id(instr)], param_index)
-                    for instr, param_index in self._parameter_table[param]]
-            for param in self._parameter_table
-        })
+        cpy._parameter_table = self._parameter_table.remap(instr_copies)
 
         cpy._data = [(instr_copies[id(inst)], qargs.copy(), cargs.copy())
                      for inst, qargs, cargs in self._data]
@@ -1826,12 +1813,15 @@ class QuantumCircuit:
                 [str(p) for p in param_dict.keys() - self._parameter_table]))
 
         # replace the parameters with a new Parameter ("substitute") or numeric value ("bind")
-        for parameter, value in unrolled_param_dict.items():
-            if isinstance(value, ParameterExpression):
-                bound_circuit._substitute_parameter(parameter, value)
-            else:
-                bound_circuit._bind_parameter(parameter, value)
-                del bound_circuit._parameter_table[parameter]  # clear evaluated expressions
+        if not any(isinstance(value, ParameterExpression)
+                   for value in unrolled_param_dict.values()):
+            bound_circuit._bind_parameters(unrolled_param_dict)
+        else:
+            for parameter, value in unrolled_param_dict.items():
+                if isinstance(value, ParameterExpression):
+                    bound_circuit._substitute_parameter(parameter, value)
+                else:
+                    bound_circuit._bind_parameters({parameter: value})
 
         return None if inplace else bound_circuit
 
@@ -1861,13 +1851,122 @@ class QuantumCircuit:
             raise CircuitError('Cannot bind parameters ({}) not present in the circuit.'.format(
                 [str(p) for p in value_dict.keys() - self._parameter_table.keys()]))
 
-        # replace the parameters with a new Parameter ("substitute") or numeric value ("bind")
-        for parameter, value in unrolled_value_dict.items():
-            bound_circuit._bind_parameter(parameter, value)
-            del bound_circuit._parameter_table[parameter]  # clear evaluated expressions
+        bound_circuit._bind_parameters(unrolled_value_dict)
 
         return bound_circuit
 
+    def bind_many(self, values, parameters=None):
+        """Bind many sets of numeric values to the parameters, yielding one circuit per set.
+
+        This is the fast path for binding many parameter sets into the same
+        circuit, for example a parameterized circuit that has been transpiled
+        once and is then run for many parameter values. Each parameter
+        expression of the circuit is compiled once into a numeric function,
+        evaluated for all the sets at once with numpy, and the results are
+        written into copies of the circuit without going through the symbolic
+        binding of :meth:`bind_parameters`.
+
+        Unlike :meth:`bind_parameters`, the circuit is not deep-copied for every
+        set of values: the instructions which do not depend on the parameters are
+        shared by this circuit and all the bound circuits, and only the
+        parameterized instructions are copied. The shared instructions must not
+        be modified in place; :meth:`copy` a bound circuit first if needed.
+
+        Args:
+            values (array_like): A 2-D array of shape ``(num_sets, num_parameters)``,
+                each row is a set of values for ``parameters``.
+            parameters (list or ParameterVector): The parameters corresponding to
+                the columns of ``values``. Must contain every parameter of the
+                circuit. Defaults to the parameters of the circuit sorted by name.
+
+        Returns:
+            list[QuantumCircuit]: One circuit per row of ``values``, with all the
+            parameters bound.
+
+        Raises:
+            CircuitError: If ``values`` does not have one column per parameter,
+                or if ``parameters`` is not the set of parameters of the circuit.
+            ZeroDivisionError: If binding a set of values requires division by zero.
+
+        Examples:
+
+            >>> from qiskit import transpile
+            >>> from qiskit.circuit import QuantumCircuit, Parameter
+            >>> import numpy as np
+            >>> theta, phi = Parameter('theta'), Parameter('phi')
+            >>> circuit = QuantumCircuit(2)
+            >>> circuit.ry(theta, 0)
+            >>> circuit.crx(2 * phi, 0, 1)
+            >>> template = transpile(circuit, basis_gates=['u3', 'cx'])
+            >>> bound_circuits = template.bind_many(np.random.rand(1000, 2), [theta, phi])
+        """
+        if parameters is None:
+            parameters = sorted(self.parameters, key=lambda param: param.name)
+        parameters = list(parameters)
+        values = np.asarray(values)
+        if values.dtype.kind in 'biu':
+            values = values.astype(float)
+        if values.ndim != 2 or values.shape[1] != len(parameters):
+            raise CircuitError('Expected a 2-D array of values with {} columns, got shape '
+                               '{}.'.format(len(parameters), values.shape))
+        if set(parameters) != self._parameter_table.keys() or \
+                len(set(parameters)) != len(parameters):
+            raise CircuitError('The parameters to bind ({}) must be the parameters of the '
+                               'circuit ({}).'.format([str(p) for p in parameters],
+                                                      [str(p) for p in self.parameters]))
+        num_sets = values.shape[0]
+        columns = {parameter: values[:, index] for index, parameter in enumerate(parameters)}
+
+        # Evaluate every parameterized instruction parameter for all the sets at once.
+        instructions = {}
+        for instruction_params in self._parameter_table.values():
+            for instruction, param_index in instruction_params:
+                instructions.setdefault(id(instruction), (instruction, {}))[1].setdefault(
+                    param_index, None)
+        for instruction, evaluated in instructions.values():
+            for param_index in evaluated:
+                evaluated[param_index] = _evaluate_many(instruction.params[param_index],
+                                                        columns, num_sets)
+        positions = defaultdict(list)
+        for position, (instruction, _, _) in enumerate(self._data):
+            if id(instruction) in instructions:
+                positions[id(instruction)].append(position)
+        global_phases = None
+        if isinstance(self.global_phase, ParameterExpression):
+            global_phases = _evaluate_many(self.global_phase, columns, num_sets)
+
+        bound_circuits = []
+        for row in range(num_sets):
+            # The circuit is not copied: only the parameterized instructions are,
+            # the others are shared by the template and all the bound circuits.
+            bound_circuit = copy.copy(self)
+            bound_circuit.qregs = self.qregs.copy()
+            bound_circuit.cregs = self.cregs.copy()
+            bound_circuit._qubits = self._qubits.copy()
+            bound_circuit._clbits = self._clbits.copy()
+            bound_circuit._parameter_table = ParameterTable()
+            bound_circuit._data = data = self._data.copy()
+            for key, (instruction, evaluated) in instructions.items():
+                if instruction._definition is None:
+                    bound_instruction = copy.copy(instruction)
+                    bound_instruction._params = instruction._params.copy()
+                else:
+                    bound_instruction = instruction.copy()
+                for param_index, param_values in evaluated.items():
+                    parameter_expr = bound_instruction._params[param_index]
+                    bound_instruction._params[param_index] = param_values[row]
+                    if bound_instruction._definition is not None:
+                        for parameter in parameter_expr.parameters:
+                            bound_circuit._rebind_definition(bound_instruction, parameter,
+                                                             columns[parameter][row].item())
+                for position in positions[key]:
+                    _, qargs, cargs = data[position]
+                    data[position] = (bound_instruction, qargs, cargs)
+            if global_phases is not None:
+                bound_circuit.global_phase = global_phases[row]
+            bound_circuits.append(bound_circuit)
+        return bound_circuits
+
     def _unroll_param_dict(self, value_dict):
         unrolled_value_dict = {}
         for (param, value) in value_dict.items():
@@ -1881,19 +1980,30 @@ class QuantumCircuit:
                 unrolled_value_dict.update(zip(param, value))
         return unrolled_value_dict
 
-    def _bind_parameter(self, parameter, value):
-        """Assigns a parameter value to matching instructions in-place."""
-        for (instr, param_index) in self._parameter_table[parameter]:
-            instr.params[param_index] = instr.params[param_index].bind({parameter: value})
-
-            # For instructions which have already been defined (e.g. composite
-            # instructions), search the definition for instances of the
-            # parameter which also need to be bound.
-            self._rebind_definition(instr, parameter, value)
+    def _bind_parameters(self, value_dict):
+        """Assigns numeric parameter values to matching instructions in-place."""
+        # Every instruction parameter is bound once to the values of all its
+        # parameters, so that fully bound expressions are evaluated numerically.
+        bound = set()
+        for parameter, value in value_dict.items():
+            for (instr, param_index) in self._parameter_table[parameter]:
+                if (id(instr), param_index) not in bound:
+                    bound.add((id(instr), param_index))
+                    expression = instr.params[param_index]
+                    instr.params[param_index] = expression.bind(
+                        {p: value_dict[p] for p in expression.parameters if p in value_dict})
+
+                # For instructions which have already been defined (e.g. composite
+                # instructions), search the definition for instances of the
+                # parameter which also need to be bound.
+                self._rebind_definition(instr, parameter, value)
+            del self._parameter_table[parameter]  # clear evaluated expressions
         # bind circuit's phase
-        if (isinstance(self.global_phase, ParameterExpression) and
-                parameter in self.global_phase.parameters):
-            self.global_phase = self.global_phase.bind({parameter: value})
+        if isinstance(self.global_phase, ParameterExpression):
+            phase_values = {p: value_dict[p] for p in self.global_phase.parameters
+                            if p in value_dict}
+            if phase_values:
+                self.global_phase = self.global_phase.bind(phase_values)
 
     def _substitute_parameter(self, old_parameter, new_parameter_expr):
         """Substitute an existing parameter in all circuit instructions and the parameter table."""
@@ -1904,7 +2014,7 @@ class QuantumCircuit:
 
         entry = self._parameter_table.pop(old_parameter)
         for new_parameter in new_parameter_expr.parameters:
-            self._parameter_table[new_parameter] = entry
+            self._parameter_table.merge(new_parameter, entry)
         if (isinstance(self.global_phase, ParameterExpression)
                 and old_parameter in self.global_phase.parameters):
             self.global_phase = self.global_phase.subs({old_parameter: new_parameter_expr})
@@ -2290,4 +2400,36 @@ def _circuit_from_qasm(qasm):
     from qiskit.converters import dag_to_circuit
     ast = qasm.parse()
     dag = ast_to_dag(ast)
-    return dag_to_circuit(dag)
+    return dag_to_circuit(dag, copy_operations=False)
+
+
+def _evaluate_many(expression, columns, num_sets):
+    """Evaluate a parameter expression for many sets of values at once.
+
+    Args:
+        expression (ParameterExpression): the expression to evaluate.
+        columns (dict): mapping of each parameter to the array of its values.
+        num_sets (int): the number of sets of values.
+
+    Returns:
+        list[ParameterExpression]: the ``num_sets`` values of the expression, as
+        fully bound expressions like those returned by
+        :meth:`ParameterExpression.bind`.
+
+    Raises:
+        ZeroDivisionError: If any set of values requires division by zero.
+    """
+    from sympy import sympify
+    parameter_values = {parameter: columns[parameter] for parameter in expression.parameters}
+    with np.errstate(divide='ignore', invalid='ignore'):
+        evaluated = np.broadcast_to(expression.evaluate(parameter_values), (num_sets,))
+    if not np.all(np.isfinite(evaluated)):
+        row = np.flatnonzero(~np.isfinite(evaluated))[0]
+        raise ZeroDivisionError('Binding provided for expression '
+                                'results in division by zero '
+                                '(Expression: {}, Bindings: {}).'.format(
+                                    expression,
+                                    {parameter: column[row]
+                                     for parameter, column in parameter_values.items()}))
+    return [ParameterExpression({}, sympify(value))
+            for value in np.real_if_close(evaluated).tolist()]
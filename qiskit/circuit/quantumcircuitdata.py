@@ -57,8 +57,11 @@ class QuantumCircuitData(MutableSequence):
         self._circuit._check_qargs(qargs)
         self._circuit._check_cargs(cargs)
 
+        old_instruction = self._circuit._data[key]
         self._circuit._data[key] = (instruction, qargs, cargs)
 
+        if old_instruction is not None:
+            self._circuit._parameter_table.discard_references(old_instruction[0])
         self._circuit._update_parameter_table(instruction)
 
     def insert(self, index, value):
@@ -66,7 +69,13 @@ class QuantumCircuitData(MutableSequence):
         self[index] = value
 
     def __delitem__(self, i):
+        if isinstance(i, slice):
+            removed = self._circuit._data[i]
+        else:
+            removed = [self._circuit._data[i]]
         del self._circuit._data[i]
+        for instruction, _, _ in removed:
+            self._circuit._parameter_table.discard_references(instruction)
 
     def __len__(self):
         return len(self._circuit._data)
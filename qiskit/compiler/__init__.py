@@ -26,9 +26,10 @@ Circuit and Pulse Compilation Functions
    assemble
    schedule
    transpile
+   transpile_iter
 
 """
 
 from .assemble import assemble
-from .transpile import transpile
+from .transpile import transpile, transpile_iter
 from .schedule import schedule
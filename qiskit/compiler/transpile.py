@@ -14,15 +14,15 @@
 import logging
 from time import time
 import warnings
-from typing import List, Union, Dict, Callable, Any, Optional, Tuple
+from typing import List, Union, Dict, Callable, Any, Optional, Tuple, Iterable, Iterator
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.providers import BaseBackend
 from qiskit.providers.models import BackendProperties
 from qiskit.providers.models.backendproperties import Gate
-from qiskit.transpiler import Layout, CouplingMap, PropertySet, PassManager
+from qiskit.transpiler import Layout, CouplingMap, PropertySet, PassManager, TranspileCache
 from qiskit.transpiler.basepasses import BasePass
 from qiskit.dagcircuit import DAGCircuit
-from qiskit.tools.parallel import parallel_map
+from qiskit.tools.parallel import parallel_map, parallel_imap
 from qiskit.transpiler.passmanager_config import PassManagerConfig
 from qiskit.pulse import Schedule
 from qiskit.circuit.quantumregister import Qubit
@@ -53,8 +53,9 @@ def transpile(circuits: Union[QuantumCircuit, List[QuantumCircuit]],
               pass_manager: Optional[PassManager] = None,
               callback: Optional[Callable[[BasePass, DAGCircuit, float,
                                            PropertySet, int], Any]] = None,
-              output_name: Optional[Union[str, List[str]]] = None) -> Union[QuantumCircuit,
-                                                                            List[QuantumCircuit]]:
+              output_name: Optional[Union[str, List[str]]] = None,
+              cache: Optional[TranspileCache] = None) -> Union[QuantumCircuit,
+                                                               List[QuantumCircuit]]:
     """Transpile one or more circuits, according to some desired transpilation targets.
 
     All arguments may be given as either a singleton or list. In case of a list,
@@ -160,6 +161,10 @@ def transpile(circuits: Union[QuantumCircuit, List[QuantumCircuit]],
 
         output_name: A list with strings to identify the output circuits. The length of
             the list should be exactly the length of the ``circuits`` parameter.
+        cache: A :class:`~qiskit.transpiler.TranspileCache` to look the circuits up in
+            before transpiling them. Circuits which are not in the cache are
+            transpiled and added to it. Circuits transpiled with a ``callback``
+            bypass the cache. It cannot be combined with ``pass_manager``.
 
     Returns:
         The transpiled circuit(s).
@@ -194,7 +199,7 @@ def transpile(circuits: Union[QuantumCircuit, List[QuantumCircuit]],
                                     initial_layout=initial_layout, layout_method=layout_method,
                                     routing_method=routing_method,
                                     translation_method=translation_method,
-                                    backend=backend)
+                                    backend=backend, cache=cache is not None)
 
         warnings.warn("The parameter pass_manager in transpile is being deprecated. "
                       "The preferred way to tranpile a circuit using a custom pass manager is"
@@ -216,7 +221,10 @@ def transpile(circuits: Union[QuantumCircuit, List[QuantumCircuit]],
     _check_circuits_coupling_map(circuits, transpile_args, backend)
 
     # Transpile circuits in parallel
-    circuits = parallel_map(_transpile_circuit, list(zip(circuits, transpile_args)))
+    if cache is None:
+        circuits = parallel_map(_transpile_circuit, list(zip(circuits, transpile_args)))
+    else:
+        circuits = _transpile_with_cache(circuits, transpile_args, cache)
 
     if len(circuits) == 1:
         end_time = time()
@@ -227,6 +235,152 @@ def transpile(circuits: Union[QuantumCircuit, List[QuantumCircuit]],
     return circuits
 
 
+def transpile_iter(circuits: Iterable[QuantumCircuit],
+                   backend: Optional[BaseBackend] = None,
+                   basis_gates: Optional[List[str]] = None,
+                   coupling_map: Optional[Union[CouplingMap, List[List[int]]]] = None,
+                   backend_properties: Optional[BackendProperties] = None,
+                   initial_layout: Optional[Union[Layout, Dict, List]] = None,
+                   layout_method: Optional[str] = None,
+                   routing_method: Optional[str] = None,
+                   translation_method: Optional[str] = None,
+                   seed_transpiler: Optional[int] = None,
+                   optimization_level: Optional[int] = None,
+                   callback: Optional[Callable[[BasePass, DAGCircuit, float,
+                                                PropertySet, int], Any]] = None,
+                   ordered: bool = True,
+                   chunk_size: int = 1,
+                   max_in_flight: Optional[int] = None) -> Iterator[QuantumCircuit]:
+    """Transpile circuits from an iterable, yielding each one as soon as it is transpiled.
+
+    This is the streaming counterpart of :func:`transpile`: ``circuits`` is only
+    consumed as worker processes become available and the transpiled circuits
+    are yielded while the rest of them are still being compiled, so the
+    assembly or submission of the first results can overlap with the
+    compilation of the others. At most ``max_in_flight`` chunks of
+    ``chunk_size`` circuits are held at the same time.
+
+    The options are the same as in :func:`transpile`, but they must be given as
+    singletons since they apply to every circuit of the (possibly unbounded)
+    iterable.
+
+    Args:
+        circuits: Circuits to transpile.
+        backend: See :func:`transpile`.
+        basis_gates: See :func:`transpile`.
+        coupling_map: See :func:`transpile`.
+        backend_properties: See :func:`transpile`.
+        initial_layout: See :func:`transpile`.
+        layout_method: See :func:`transpile`.
+        routing_method: See :func:`transpile`.
+        translation_method: See :func:`transpile`.
+        seed_transpiler: See :func:`transpile`.
+        optimization_level: See :func:`transpile`.
+        callback: See :func:`transpile`.
+        ordered: If ``True``, the circuits are yielded in the order of ``circuits``.
+            Otherwise they are yielded as soon as they are transpiled.
+        chunk_size: Number of circuits sent to a worker process at once.
+        max_in_flight: Maximum number of chunks being transpiled and not yet
+            yielded. Defaults to twice the number of worker processes.
+
+    Returns:
+        An iterator over the transpiled circuits.
+
+    Raises:
+        TranspilerError: if an option is given per circuit, in case of bad inputs
+            to transpiler (like conflicting parameters) or errors in passes.
+    """
+    per_circuit = [name for name, value in (('backend', backend),
+                                            ('backend_properties', backend_properties),
+                                            ('layout_method', layout_method),
+                                            ('routing_method', routing_method),
+                                            ('translation_method', translation_method),
+                                            ('seed_transpiler', seed_transpiler),
+                                            ('optimization_level', optimization_level),
+                                            ('callback', callback))
+                   if isinstance(value, list)]
+    if isinstance(basis_gates, list) and not all(isinstance(i, str) for i in basis_gates):
+        per_circuit.append('basis_gates')
+    if isinstance(coupling_map, list) and \
+            not all(isinstance(i, list) and len(i) == 2 and all(isinstanceint(j) for j in i)
+                    for i in coupling_map):
+        per_circuit.append('coupling_map')
+    if isinstance(initial_layout, list) and \
+            any(isinstance(i, (list, dict)) for i in initial_layout):
+        per_circuit.append('initial_layout')
+    if per_circuit:
+        raise TranspilerError("transpile_iter does not support options given per circuit: "
+                              "{}.".format(', '.join(per_circuit)))
+
+    if optimization_level is None:
+        # Take optimization level from the configuration or 1 as default.
+        config = user_config.get_config()
+        optimization_level = config.get('transpile_optimization_level', 1)
+
+    # Query the backend only once, the resolved options are shared by all the circuits.
+    basis_gates = _parse_basis_gates(basis_gates, backend, [None])[0]
+    coupling_map = _parse_coupling_map(coupling_map, backend, 1)[0]
+    backend_properties = _parse_backend_properties(backend_properties, backend, 1)[0]
+    backend_num_qubits = _parse_backend_num_qubits(backend, 1)[0]
+    faulty_qubits_map = _parse_faulty_qubits_map(backend, 1)[0]
+
+    def _circuit_config_tuples():
+        for circuit in circuits:
+            if len(circuit.calibrations) != 0:
+                warnings.warn("Transpiling with calibrations are not supported currently.",
+                              UserWarning)
+            transpile_args = _parse_transpile_args([circuit], None, basis_gates, coupling_map,
+                                                   backend_properties, initial_layout,
+                                                   layout_method, routing_method,
+                                                   translation_method, seed_transpiler,
+                                                   optimization_level, callback, None)
+            transpile_args[0]['backend_num_qubits'] = backend_num_qubits
+            transpile_args[0]['faulty_qubits_map'] = faulty_qubits_map
+            _check_circuits_coupling_map([circuit], transpile_args, backend)
+            yield circuit, transpile_args[0]
+
+    return parallel_imap(_transpile_circuit, _circuit_config_tuples(), chunk_size=chunk_size,
+                         max_in_flight=max_in_flight, ordered=ordered)
+
+
+def _transpile_with_cache(circuits, transpile_args, cache):
+    """Look the circuits up in ``cache`` and transpile, in parallel, those which are not."""
+    results = [None] * len(circuits)
+    misses = []
+    duplicates = []
+    pending = {}
+    for index, (circuit, args) in enumerate(zip(circuits, transpile_args)):
+        if args['callback'] is not None:
+            misses.append((index, None, None))
+            continue
+        key, parameters = cache.key(circuit, args)
+        if key in pending:
+            # Structurally identical to a circuit of this batch already being transpiled.
+            duplicates.append((index, key, parameters))
+            continue
+        result = cache.get(key, parameters, args['output_name'])
+        if result is None:
+            pending[key] = (index, parameters)
+            misses.append((index, key, parameters))
+        else:
+            results[index] = result
+
+    transpiled = parallel_map(_transpile_circuit,
+                              [(circuits[index], transpile_args[index])
+                               for index, _, _ in misses])
+    for (index, key, parameters), circuit in zip(misses, transpiled):
+        if key is not None:
+            cache.put(key, parameters, circuit)
+        results[index] = circuit
+    # The duplicates are copied from the circuit transpiled for their first
+    # occurrence, which the cache may already have evicted.
+    for index, key, parameters in duplicates:
+        first_index, first_parameters = pending[key]
+        results[index] = cache.hit(results[first_index], first_parameters, parameters,
+                                   transpile_args[index]['output_name'])
+    return results
+
+
 def _check_conflicting_argument(**kargs):
     conflicting_args = [arg for arg, value in kargs.items() if value]
     if conflicting_args:
@@ -360,10 +514,10 @@ def _remap_circuit_faulty_backend(circuit, num_qubits, backend_prop, faulty_qubi
         physical_layout_dict[qubit] = faulty_qubits_map_reverse[qubit.index]
     for qubit in faulty_qreg[:] + disconnected_qreg[:]:
         physical_layout_dict[qubit] = new_layout[qubit]
-    dag_circuit = circuit_to_dag(circuit)
+    dag_circuit = circuit_to_dag(circuit, copy_operations=False)
     apply_layout_pass = ApplyLayout()
     apply_layout_pass.property_set['layout'] = Layout(physical_layout_dict)
-    circuit = dag_to_circuit(apply_layout_pass.run(dag_circuit))
+    circuit = dag_to_circuit(apply_layout_pass.run(dag_circuit), copy_operations=False)
     circuit._layout = new_layout
     return circuit
 
@@ -15,11 +15,16 @@
 from qiskit.dagcircuit.dagcircuit import DAGCircuit
 
 
-def circuit_to_dag(circuit):
+def circuit_to_dag(circuit, copy_operations=True):
     """Build a ``DAGCircuit`` object from a ``QuantumCircuit``.
 
     Args:
         circuit (QuantumCircuit): the input circuit.
+        copy_operations (bool): copy the instructions of the circuit for the
+            DAG. If ``False``, the DAG shares the instructions of the circuit,
+            so that changes to the instructions of one are reflected in the
+            other: this should only be used if the circuit is not used anymore,
+            or if neither the circuit nor the DAG are modified.
 
     Return:
         DAGCircuit: the DAG representing the input circuit.
@@ -52,6 +57,9 @@ def circuit_to_dag(circuit):
     for register in circuit.cregs:
         dagcircuit.add_creg(register)
 
-    for instruction, qargs, cargs in circuit.data:
-        dagcircuit.apply_operation_back(instruction.copy(), qargs, cargs)
+    if copy_operations:
+        dagcircuit._apply_operations_back((instruction.copy(), qargs, cargs)
+                                          for instruction, qargs, cargs in circuit.data)
+    else:
+        dagcircuit._apply_operations_back(circuit.data)
     return dagcircuit
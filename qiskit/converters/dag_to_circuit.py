@@ -14,11 +14,16 @@
 from qiskit.circuit import QuantumCircuit
 
 
-def dag_to_circuit(dag):
+def dag_to_circuit(dag, copy_operations=True):
     """Build a ``QuantumCircuit`` object from a ``DAGCircuit``.
 
     Args:
         dag (DAGCircuit): the input dag.
+        copy_operations (bool): copy the instructions of the DAG for the
+            circuit. If ``False``, the circuit shares the instructions of the
+            DAG, and only copies those whose condition differs from the one of
+            their node: this should only be used if the DAG is not used
+            anymore, or if neither the DAG nor the circuit are modified.
 
     Return:
         QuantumCircuit: the circuit representing the input dag.
@@ -51,8 +56,10 @@ def dag_to_circuit(dag):
 
     for node in dag.topological_op_nodes():
         # Get arguments for classical control (if any)
-        inst = node.op.copy()
-        inst.condition = node.condition
+        inst = node.op
+        if copy_operations or inst.condition != node.condition:
+            inst = inst.copy()
+            inst.condition = node.condition
         circuit._append(inst, node.qargs, node.cargs)
 
     return circuit
@@ -34,6 +34,7 @@ from qiskit.circuit.classicalregister import ClassicalRegister, Clbit
 from qiskit.circuit.gate import Gate
 from qiskit.dagcircuit.exceptions import DAGCircuitError
 from qiskit.dagcircuit.dagnode import DAGNode
+from qiskit.dagcircuit.daglayer import DAGLayer
 
 
 class DAGCircuit:
@@ -91,6 +92,26 @@ class DAGCircuit:
 
         self._global_phase = 0
 
+        # Incremented by every change to the graph. The results derived from
+        # the graph, such as its topological order, are cached in _cache with
+        # the version they were computed for.
+        self._version = 0
+        self._cache = {}
+
+        # Characters encoding the wires in the sort keys of the nodes, and a
+        # unique id of this encoding, stored with the keys cached on the nodes
+        self._wire_keys = {}
+        self._wire_keys_id = None
+
+    def _get_cached(self, key, compute):
+        """Return the value cached under ``key``, calling ``compute()`` to
+        (re)compute it if the graph changed since it was cached."""
+        version, value = self._cache.get(key, (None, None))
+        if version != self._version:
+            value = compute()
+            self._cache[key] = (self._version, value)
+        return value
+
     def to_networkx(self):
         """Returns a copy of the DAGCircuit in networkx format."""
         G = nx.MultiDiGraph()
@@ -234,6 +255,7 @@ class DAGCircuit:
                                        outp_node._node_id,
                                        {'name': wire_name,
                                         'wire': wire})
+            self._version += 1
         else:
             raise DAGCircuitError("duplicate wire %s" % (wire,))
 
@@ -295,6 +317,7 @@ class DAGCircuit:
                            cargs=cargs)
         node_index = self._multi_graph.add_node(new_node)
         new_node._node_id = node_index
+        self._version += 1
         return node_index
 
     def apply_operation_back(self, op, qargs=None, cargs=None, condition=None):
@@ -350,6 +373,72 @@ class DAGCircuit:
 
         return self._multi_graph.get_node_data(node_index)
 
+    def _apply_operations_back(self, instructions):
+        """Apply a sequence of operations to the output of the circuit.
+
+        This is equivalent to calling :meth:`apply_operation_back` on each
+        operation in turn, but the arguments are checked once for the whole
+        sequence, and the nodes and edges are added to the graph in bulk
+        instead of rewiring the output nodes for each operation.
+
+        Args:
+            instructions (Iterable[tuple]): the ``(op, qargs, cargs)`` tuples
+                of the operations, in order.
+
+        Raises:
+            DAGCircuitError: if a (qu)bit or a condition register is not in the
+                circuit, or if a leaf node is connected to multiple outputs.
+        """
+        new_nodes = []
+        nodes_wires = []
+        for op, qargs, cargs in instructions:
+            qargs = qargs or []
+            cargs = cargs or []
+            self._check_condition(op.name, op.condition)
+            all_cbits = set(self._bits_in_condition(op.condition)).union(cargs)
+            new_nodes.append(DAGNode(type="op", op=op, name=op.name, qargs=qargs,
+                                     cargs=cargs))
+            nodes_wires.append(list(itertools.chain(qargs, all_cbits)))
+
+        # Check the wires, and find the last node on each of them, before the
+        # graph is changed, so that an invalid operation leaves it untouched.
+        all_wires = dict.fromkeys(itertools.chain.from_iterable(nodes_wires))
+        self._check_bits(all_wires, self.output_map)
+
+        # the last node on each wire: before, then after the new operations
+        last_ids = {}
+        final_ids = {}
+        # the edges of a wire share their (read-only) data
+        edges_data = {}
+        for wire in all_wires:
+            pred_ids = self._multi_graph.predecessor_indices(self.output_map[wire]._node_id)
+            if len(pred_ids) != 1:
+                raise DAGCircuitError("output node has multiple in-edges")
+            last_ids[wire] = pred_ids[0]
+            edges_data[wire] = {'name': "%s[%s]" % (wire.register.name, wire.index),
+                                'wire': wire}
+
+        node_ids = self._multi_graph.add_nodes_from(new_nodes)
+        self._version += 1
+        for node, node_index, wires in zip(new_nodes, node_ids, nodes_wires):
+            node._node_id = node_index
+            for wire in wires:
+                final_ids[wire] = node_index
+        self._multi_graph.remove_edges_from(
+            [(last_ids[wire], self.output_map[wire]._node_id) for wire in final_ids])
+
+        # Add the edges in the order apply_operation_back would leave them in
+        # the graph, so that the successors of each node are ordered alike.
+        edges = []
+        for node_index, wires in zip(node_ids, nodes_wires):
+            for wire in wires:
+                edges.append((last_ids[wire], node_index, edges_data[wire]))
+                if final_ids[wire] == node_index:
+                    edges.append((node_index, self.output_map[wire]._node_id,
+                                  edges_data[wire]))
+                last_ids[wire] = node_index
+        self._multi_graph.add_edges_from(edges)
+
     def apply_operation_front(self, op, qargs, cargs, condition=None):
         """Apply an operation to the input of the circuit.
 
@@ -657,6 +746,9 @@ class DAGCircuit:
         Raises:
             DAGCircuitError: if not a directed acyclic graph
         """
+        return self._get_cached('depth', self._compute_depth)
+
+    def _compute_depth(self):
         if not rx.is_directed_acyclic_graph(self._multi_graph):
             raise DAGCircuitError("not a DAG")
 
@@ -789,11 +881,31 @@ class DAGCircuit:
             generator(DAGNode): node in topological order
         """
 
+        return iter(self._get_cached('topological_nodes', self._compute_topological_nodes))
+
+    def _compute_topological_nodes(self):
+        # The nodes are ordered by their qargs, like by DAGNode.sort_key, but
+        # without formatting them: each bit is encoded as a single character,
+        # in the order of the repr of the bits, and the keys end with a
+        # character greater than all the bits, so that a list of bits sorts
+        # before its prefixes, as when comparing the str of the lists. The
+        # keys are cached on the nodes until wires are added.
+        if len(self._wire_keys) != len(self._wires):
+            wires = sorted(self._wires, key=repr)
+            self._wire_keys = {wire: _key_char(rank) for rank, wire in enumerate(wires)}
+            self._wire_keys_id = next(_WIRE_KEYS_IDS)
+        wire_keys = self._wire_keys
+        wire_keys_id = self._wire_keys_id
+        end_key = _key_char(len(wire_keys))
+
         def _key(x):
-            return x.sort_key
+            dag_sort_key = x._dag_sort_key
+            if dag_sort_key is None or dag_sort_key[0] != wire_keys_id:
+                dag_sort_key = x._dag_sort_key = (
+                    wire_keys_id, ''.join([wire_keys[qarg] for qarg in x.qargs]) + end_key)
+            return dag_sort_key[1]
 
-        return iter(rx.lexicographical_topological_sort(
-            self._multi_graph, key=_key))
+        return rx.lexicographical_topological_sort(self._multi_graph, key=_key)
 
     def topological_op_nodes(self):
         """
@@ -887,6 +999,7 @@ class DAGCircuit:
 
         # Now that we know the connections, delete node
         self._multi_graph.remove_node(node._node_id)
+        self._version += 1
 
         # Iterate over nodes of input_circuit
         for sorted_node in in_dag.topological_op_nodes():
@@ -963,6 +1076,7 @@ class DAGCircuit:
                     node.op.num_qubits, node.op.num_clbits,
                     op.num_qubits, op.num_clbits))
 
+        self._version += 1
         if inplace:
             node.op = op
             node.name = op.name
@@ -1173,6 +1287,7 @@ class DAGCircuit:
 
         # remove from graph and map
         self._multi_graph.remove_node(node._node_id)
+        self._version += 1
 
         for w in pred_map.keys():
             self._multi_graph.add_edge(pred_map[w], succ_map[w],
@@ -1230,10 +1345,13 @@ class DAGCircuit:
         a layer has depth 1. The total number of layers equals the
         circuit depth d. The layers are indexed from 0 to d-1 with the
         earliest layer at index 0. The layers are constructed using a
-        greedy algorithm. Each returned layer is a dict containing
+        greedy algorithm. Each returned layer is a :class:`~.DAGLayer`, which
+        can be read as a dict containing
         {"graph": circuit graph, "partition": list of qubit lists}.
 
-        The returned layer contains new (but semantically equivalent) DAGNodes.
+        The op nodes of the layer (:attr:`.DAGLayer.nodes`) are nodes of this
+        DAGCircuit. The circuit graph of the layer is only built when it is
+        accessed, and contains new (but semantically equivalent) DAGNodes.
         These are not the same as nodes of the original dag, but are equivalent
         via DAGNode.semantic_eq(node1, node2).
 
@@ -1263,65 +1381,59 @@ class DAGCircuit:
             if not op_nodes:
                 return
 
-            # Construct a shallow copy of self
-            new_layer = DAGCircuit()
-            new_layer.name = self.name
-
-            # add in the registers - this adds the input/output nodes
-            for creg in self.cregs.values():
-                new_layer.add_creg(creg)
-            for qreg in self.qregs.values():
-                new_layer.add_qreg(qreg)
-
-            for node in op_nodes:
-                # this creates new DAGNodes in the new_layer
-                new_layer.apply_operation_back(node.op,
-                                               node.qargs,
-                                               node.cargs)
-
             # The quantum registers that have an operation in this layer.
             support_list = [
                 op_node.qargs
-                for op_node in new_layer.op_nodes()
+                for op_node in op_nodes
                 if op_node.name not in {"barrier", "snapshot", "save", "load", "noise"}
             ]
 
-            yield {"graph": new_layer, "partition": support_list}
+            yield DAGLayer(self, op_nodes, support_list)
 
     def serial_layers(self):
         """Yield a layer for all gates of this circuit.
 
         A serial layer is a circuit with one gate. The layers have the
-        same structure as in layers().
+        same structure as in layers(), and their circuit graph contains a
+        copy of the operation of the gate.
         """
         for next_node in self.topological_op_nodes():
-            new_layer = DAGCircuit()
-            for qreg in self.qregs.values():
-                new_layer.add_qreg(qreg)
-            for creg in self.cregs.values():
-                new_layer.add_creg(creg)
-            # Save the support of the operation we add to the layer
+            # Save the support of the operation in the layer
             support_list = []
-            # Operation data
-            op = copy.copy(next_node.op)
-            qa = copy.copy(next_node.qargs)
-            ca = copy.copy(next_node.cargs)
-            co = copy.copy(next_node.condition)
-            _ = self._bits_in_condition(co)
-
-            # Add node to new_layer
-            new_layer.apply_operation_back(op, qa, ca)
-            # Add operation to partition
             if next_node.name not in ["barrier",
                                       "snapshot", "save", "load", "noise"]:
-                support_list.append(list(qa))
-            l_dict = {"graph": new_layer, "partition": support_list}
-            yield l_dict
+                support_list.append(list(next_node.qargs))
+            yield DAGLayer(self, [next_node], support_list, copy_operations=True)
+
+    def _layer_graph(self, op_nodes, copy_operations):
+        """Return a new DAGCircuit with the registers of this one and the given op nodes."""
+        new_layer = DAGCircuit()
+        new_layer.name = self.name
+
+        # add in the registers - this adds the input/output nodes
+        for creg in self.cregs.values():
+            new_layer.add_creg(creg)
+        for qreg in self.qregs.values():
+            new_layer.add_qreg(qreg)
+
+        for node in op_nodes:
+            # this creates new DAGNodes in the new_layer
+            if copy_operations:
+                new_layer.apply_operation_back(copy.copy(node.op),
+                                               copy.copy(node.qargs),
+                                               copy.copy(node.cargs))
+            else:
+                new_layer.apply_operation_back(node.op, node.qargs, node.cargs)
+        return new_layer
 
     def multigraph_layers(self):
         """Yield layers of the multigraph."""
+        return (list(layer) for layer in self._get_cached('multigraph_layers',
+                                                          self._compute_multigraph_layers))
+
+    def _compute_multigraph_layers(self):
         first_layer = [x._node_id for x in self.input_map.values()]
-        return iter(rx.layers(self._multi_graph, first_layer))
+        return rx.layers(self._multi_graph, first_layer)
 
     def collect_runs(self, namelist):
         """Return a set of non-conditional runs of "op" nodes with the given names.
@@ -1373,25 +1485,25 @@ class DAGCircuit:
         Raises:
             DAGCircuitError: if the given wire doesn't exist in the DAG
         """
-        current_node = self.input_map.get(wire, None)
-
-        if not current_node:
+        if wire not in self.input_map:
             raise DAGCircuitError('The given wire %s is not present in the circuit'
                                   % str(wire))
 
-        more_nodes = True
-        while more_nodes:
-            more_nodes = False
+        for node in self._get_cached('wire_nodes', self._compute_wire_nodes)[wire]:
             # allow user to just get ops on the wire - not the input/output nodes
-            if current_node.type == 'op' or not only_ops:
-                yield current_node
-
-            try:
-                current_node = self._multi_graph.find_adjacent_node_by_edge(
-                    current_node._node_id, lambda x: wire == x['wire'])
-                more_nodes = True
-            except rx.NoSuitableNeighbors:
-                pass
+            if node.type == 'op' or not only_ops:
+                yield node
+
+    def _compute_wire_nodes(self):
+        """Return the nodes of each wire, in order, as a dict keyed by wire."""
+        wire_nodes = {wire: [] for wire in self.input_map}
+        for node in self.topological_nodes():
+            if node.type == 'in':
+                wire_nodes[node.wire].append(node)
+            else:
+                for _, _, data in self._multi_graph.in_edges(node._node_id):
+                    wire_nodes[data['wire']].append(node)
+        return wire_nodes
 
     def count_ops(self):
         """Count the occurrences of operation names.
@@ -1454,3 +1566,12 @@ class DAGCircuit:
         """
         from qiskit.visualization.dag_visualization import dag_drawer
         return dag_drawer(dag=self, scale=scale, filename=filename, style=style)
+
+
+_WIRE_KEYS_IDS = itertools.count()
+
+
+def _key_char(rank):
+    """Return the character encoding a rank in the sort keys of the nodes,
+    skipping the surrogate code points, which can not be passed to retworkx."""
+    return chr(rank if rank < 0xD800 else rank + 0x800)
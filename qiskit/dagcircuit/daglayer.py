@@ -0,0 +1,85 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Object to represent a layer of a DAGCircuit."""
+
+from collections.abc import Mapping
+
+
+class DAGLayer(Mapping):
+    """Object to represent a layer of a DAGCircuit.
+
+    It is the value yielded by :meth:`.DAGCircuit.layers` and
+    :meth:`.DAGCircuit.serial_layers`. The layer is a view on op nodes of the
+    circuit: the :class:`.DAGCircuit` of the layer is only built when it is
+    accessed.
+
+    For backwards compatibility, the layer can also be read like a dict with
+    the keys ``"graph"`` and ``"partition"``.
+    """
+
+    __slots__ = ['_dag', '_nodes', '_partition', '_copy_operations', '_graph']
+
+    def __init__(self, dag, nodes, partition, copy_operations=False):
+        """Create a layer.
+
+        Args:
+            dag (DAGCircuit): the circuit the nodes belong to.
+            nodes (list[DAGNode]): the op nodes of the layer, in the order they
+                were added to the circuit.
+            partition (list[list[Qubit]]): the qubits of each op of the layer,
+                except the directives (barrier, snapshot, save, load, noise).
+            copy_operations (bool): if True, the graph of the layer is built
+                with copies of the operations of the nodes.
+        """
+        self._dag = dag
+        self._nodes = nodes
+        self._partition = partition
+        self._copy_operations = copy_operations
+        self._graph = None
+
+    @property
+    def nodes(self):
+        """Returns the op nodes of the layer, which are nodes of the circuit."""
+        return self._nodes
+
+    @property
+    def partition(self):
+        """Returns the list of the qubit lists of the ops of the layer."""
+        return self._partition
+
+    @property
+    def graph(self):
+        """Returns the layer as a DAGCircuit, built on first access.
+
+        The DAGCircuit has the registers of the circuit and contains new (but
+        semantically equivalent) DAGNodes, which are not the nodes of the layer.
+        """
+        if self._graph is None:
+            self._graph = self._dag._layer_graph(self._nodes, self._copy_operations)
+        return self._graph
+
+    def __getitem__(self, key):
+        if key == 'graph':
+            return self.graph
+        if key == 'partition':
+            return self._partition
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(('graph', 'partition'))
+
+    def __len__(self):
+        return 2
+
+    def __repr__(self):
+        return "DAGLayer(nodes=%s, partition=%s)" % (self._nodes, self._partition)
@@ -27,7 +27,7 @@ class DAGNode:
     """
 
     __slots__ = ['type', '_op', 'name', '_qargs', 'cargs', 'condition', '_wire',
-                 'sort_key', '_node_id']
+                 '_sort_key', '_dag_sort_key', '_node_id']
 
     def __init__(self, type=None, op=None, name=None, qargs=None, cargs=None,
                  condition=None, wire=None, nid=-1):
@@ -65,7 +65,9 @@ class DAGNode:
             self.condition = self._op.condition if self._op is not None else None
             self._wire = wire
         self._node_id = nid
-        self.sort_key = str(self._qargs)
+        self._sort_key = None
+        # (wire keys id, key) cached by DAGCircuit.topological_nodes
+        self._dag_sort_key = None
 
     @property
     def op(self):
@@ -89,7 +91,19 @@ class DAGNode:
     def qargs(self, new_qargs):
         """Sets the qargs to be the given list of qargs."""
         self._qargs = new_qargs
-        self.sort_key = str(new_qargs)
+        self._sort_key = None
+        self._dag_sort_key = None
+
+    @property
+    def sort_key(self):
+        """Returns a string ordering the node by its qargs, computed on first use."""
+        if self._sort_key is None:
+            self._sort_key = str(self._qargs)
+        return self._sort_key
+
+    @sort_key.setter
+    def sort_key(self, data):
+        self._sort_key = data
 
     @property
     def wire(self):
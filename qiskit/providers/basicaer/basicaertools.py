@@ -14,6 +14,7 @@
 
 """
 
+from functools import lru_cache
 from string import ascii_uppercase, ascii_lowercase
 import numpy as np
 from qiskit.exceptions import QiskitError
@@ -127,6 +128,41 @@ def einsum_vecmul_index(gate_indices, number_of_qubits):
                                             tens_lout=tens_lout)
 
 
+@lru_cache(maxsize=None)
+def tensordot_vecmul_plan(gate_indices, number_of_qubits):
+    """Return the axes to perform a matrix-vector multiplication with Numpy.tensordot.
+
+    The returned axes are to perform the same multiplication A.v as the
+    Numpy.einsum indices of :func:`einsum_vecmul_index`, with ``A`` reshaped
+    to a rank-2M tensor and ``v`` to a rank-N tensor, as::
+
+        np.transpose(np.tensordot(A, v, axes=(gate_axes, vector_axes)), permutation)
+
+    The plans are cached, so they are only computed once for each set of
+    gate indices.
+
+    Args:
+        gate_indices (tuple[int]): the indices of the right matrix subsystems
+                                   to contract with the left matrix.
+        number_of_qubits (int): the total number of qubits for the right matrix.
+
+    Returns:
+        tuple: (gate_axes, vector_axes, permutation) where ``gate_axes`` and
+        ``vector_axes`` are the contracted axes of the matrix and vector
+        tensors and ``permutation`` the transposition of the contracted tensor
+        restoring the order of the subsystems.
+    """
+    num_indices = len(gate_indices)
+    gate_axes = tuple(range(num_indices, 2 * num_indices))
+    vector_axes = tuple(number_of_qubits - 1 - idx for idx in reversed(gate_indices))
+    # The contracted tensor has the output axes of the matrix first, followed
+    # by the axes of the vector which were not contracted.
+    contracted_axes = list(vector_axes) + [axis for axis in range(number_of_qubits)
+                                           if axis not in vector_axes]
+    permutation = tuple(int(axis) for axis in np.argsort(contracted_axes))
+    return gate_axes, vector_axes, permutation
+
+
 def _einsum_matmul_index_helper(gate_indices, number_of_qubits):
     """Return the index string for Numpy.einsum matrix multiplication.
 
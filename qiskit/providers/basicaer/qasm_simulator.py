@@ -37,18 +37,49 @@ from collections import Counter
 import numpy as np
 
 from qiskit.util import local_hardware_info
+from qiskit.tools.parallel import parallel_map, CPU_COUNT
 from qiskit.providers.models import QasmBackendConfiguration
 from qiskit.result import Result
 from qiskit.providers import BaseBackend
 from qiskit.providers.basicaer.basicaerjob import BasicAerJob
+from qiskit.qobj import QasmQobjInstruction
 from .exceptions import BasicAerError
 from .basicaertools import single_gate_matrix
 from .basicaertools import cx_gate_matrix
-from .basicaertools import einsum_vecmul_index
+from .basicaertools import tensordot_vecmul_plan
 
 logger = logging.getLogger(__name__)
 
 
+def _run_experiment_task(task, backend):
+    """Run ``shots`` shots of an experiment seeded with ``seed_simulator``."""
+    experiment, seed_simulator, shots = task
+    return backend._run_experiment(experiment, seed_simulator, shots)
+
+
+def _expand_matrix(matrix, qubits, target_qubits):
+    """Return the matrix of a gate on ``qubits`` acting on ``target_qubits``.
+
+    Args:
+        matrix (ndarray): the matrix of a 1 or 2-qubit gate.
+        qubits (list[int]): the qubits of the gate.
+        target_qubits (list[int]): at most two qubits, including ``qubits``.
+
+    Returns:
+        ndarray: the matrix of the gate on ``target_qubits``, with identities
+        on the qubits not in ``qubits``.
+    """
+    if list(qubits) == list(target_qubits):
+        return matrix
+    if len(qubits) == 1:
+        identity = np.eye(2, dtype=complex)
+        if qubits[0] == target_qubits[0]:
+            return np.kron(identity, matrix)
+        return np.kron(matrix, identity)
+    # The gate acts on the same two qubits in the reverse order.
+    return np.reshape(np.transpose(np.reshape(matrix, (2, 2, 2, 2)), (1, 0, 3, 2)), (4, 4))
+
+
 class QasmSimulatorPy(BaseBackend):
     """Python implementation of a qasm simulator."""
 
@@ -104,7 +135,11 @@ class QasmSimulatorPy(BaseBackend):
 
     DEFAULT_OPTIONS = {
         "initial_statevector": None,
-        "chop_threshold": 1e-15
+        "chop_threshold": 1e-15,
+        "max_parallel_experiments": 1,
+        "max_parallel_shots": 1,
+        "fusion_enable": True,
+        "fusion_threshold": 14
     }
 
     # Class level variable to return the final state at the end of simulation
@@ -127,6 +162,10 @@ class QasmSimulatorPy(BaseBackend):
         self._memory = False
         self._initial_statevector = self.DEFAULT_OPTIONS["initial_statevector"]
         self._chop_threshold = self.DEFAULT_OPTIONS["chop_threshold"]
+        self._max_parallel_experiments = self.DEFAULT_OPTIONS["max_parallel_experiments"]
+        self._max_parallel_shots = self.DEFAULT_OPTIONS["max_parallel_shots"]
+        self._fusion_enable = self.DEFAULT_OPTIONS["fusion_enable"]
+        self._fusion_threshold = self.DEFAULT_OPTIONS["fusion_threshold"]
         self._qobj_config = None
         # TEMP
         self._sample_measure = False
@@ -140,14 +179,85 @@ class QasmSimulatorPy(BaseBackend):
         """
         # Get the number of qubits
         num_qubits = len(qubits)
-        # Compute einsum index string for 1-qubit matrix multiplication
-        indexes = einsum_vecmul_index(qubits, self._number_of_qubits)
+        # Get the (cached) axes for the matrix multiplication
+        gate_axes, vector_axes, permutation = tensordot_vecmul_plan(tuple(qubits),
+                                                                    self._number_of_qubits)
         # Convert to complex rank-2N tensor
-        gate_tensor = np.reshape(np.array(gate, dtype=complex),
+        gate_tensor = np.reshape(np.asarray(gate, dtype=complex),
                                  num_qubits * [2, 2])
         # Apply matrix multiplication
-        self._statevector = np.einsum(indexes, gate_tensor, self._statevector,
-                                      dtype=complex, casting='no')
+        self._statevector = np.transpose(np.tensordot(gate_tensor, self._statevector,
+                                                      axes=(gate_axes, vector_axes)),
+                                         permutation)
+
+    def _fuse_instructions(self, instructions):
+        """Fuse the gates of an experiment in unitaries on at most two qubits.
+
+        Unconditional gates are accumulated in blocks of at most two qubits.
+        A gate is merged with the blocks open on its qubits if they act on at
+        most two qubits together, otherwise these blocks are closed and a new
+        block is opened with the gate. The blocks on the qubits of any other
+        instruction are closed before it. Closed blocks are replaced by a
+        single ``unitary`` instruction, so the statevector is updated once per
+        block instead of once per gate.
+
+        Args:
+            instructions (list[QasmQobjInstruction]): the instructions of an
+                experiment.
+
+        Returns:
+            list[QasmQobjInstruction]: the instructions with fused gates.
+        """
+        fused = []
+        # Open block, as a [qubits, matrix] pair, acting on each qubit.
+        blocks = {}
+
+        def close_blocks(qubits):
+            for qubit in qubits:
+                block = blocks.get(qubit)
+                if block is not None:
+                    for block_qubit in block[0]:
+                        del blocks[block_qubit]
+                    fused.append(QasmQobjInstruction(name='unitary', qubits=block[0],
+                                                     params=[block[1]]))
+
+        for operation in instructions:
+            if operation.name in ('id', 'u0', 'barrier'):
+                continue
+            matrix = None
+            if getattr(operation, 'conditional', None) is None:
+                if operation.name in ('U', 'u1', 'u2', 'u3'):
+                    matrix = single_gate_matrix(operation.name, operation.params)
+                elif operation.name in ('CX', 'cx'):
+                    matrix = cx_gate_matrix()
+                elif operation.name == 'unitary' and len(operation.qubits) <= 2:
+                    matrix = np.asarray(operation.params[0], dtype=complex)
+            qubits = getattr(operation, 'qubits', [])
+            if matrix is None:
+                close_blocks(qubits)
+                fused.append(operation)
+                continue
+
+            open_blocks = []
+            for qubit in qubits:
+                if qubit in blocks and blocks[qubit] not in open_blocks:
+                    open_blocks.append(blocks[qubit])
+            block_qubits = list(qubits) + [qubit for block in open_blocks
+                                           for qubit in block[0] if qubit not in qubits]
+            if len(block_qubits) > 2:
+                close_blocks(qubits)
+                open_blocks = []
+                block_qubits = list(qubits)
+            # The open blocks act on distinct qubits, so they commute.
+            block_matrix = np.eye(2 ** len(block_qubits), dtype=complex)
+            for open_qubits, open_matrix in open_blocks:
+                block_matrix = _expand_matrix(open_matrix, open_qubits, block_qubits) \
+                    @ block_matrix
+            block = [block_qubits, _expand_matrix(matrix, qubits, block_qubits) @ block_matrix]
+            for qubit in block_qubits:
+                blocks[qubit] = block
+        close_blocks(list(blocks))
+        return fused
 
     def _get_measure_outcome(self, qubit):
         """Simulate the outcome of measurement of a qubit.
@@ -278,6 +388,10 @@ class QasmSimulatorPy(BaseBackend):
         # Reset default options
         self._initial_statevector = self.DEFAULT_OPTIONS["initial_statevector"]
         self._chop_threshold = self.DEFAULT_OPTIONS["chop_threshold"]
+        self._max_parallel_experiments = self.DEFAULT_OPTIONS["max_parallel_experiments"]
+        self._max_parallel_shots = self.DEFAULT_OPTIONS["max_parallel_shots"]
+        self._fusion_enable = self.DEFAULT_OPTIONS["fusion_enable"]
+        self._fusion_threshold = self.DEFAULT_OPTIONS["fusion_threshold"]
         if backend_options is None:
             backend_options = {}
 
@@ -301,6 +415,29 @@ class QasmSimulatorPy(BaseBackend):
             self._chop_threshold = backend_options['chop_threshold']
         elif hasattr(qobj_config, 'chop_threshold'):
             self._chop_threshold = qobj_config.chop_threshold
+        # Check for the number of experiments and shot chunks run in parallel
+        if 'max_parallel_experiments' in backend_options:
+            self._max_parallel_experiments = backend_options['max_parallel_experiments']
+        elif hasattr(qobj_config, 'max_parallel_experiments'):
+            self._max_parallel_experiments = qobj_config.max_parallel_experiments
+        if 'max_parallel_shots' in backend_options:
+            self._max_parallel_shots = backend_options['max_parallel_shots']
+        elif hasattr(qobj_config, 'max_parallel_shots'):
+            self._max_parallel_shots = qobj_config.max_parallel_shots
+        for option in ('max_parallel_experiments', 'max_parallel_shots'):
+            value = getattr(self, '_' + option)
+            if not isinstance(value, int) or value < 0:
+                raise BasicAerError('{} must be a non-negative integer, '
+                                    'got {}.'.format(option, value))
+        # Check for gate fusion options
+        if 'fusion_enable' in backend_options:
+            self._fusion_enable = backend_options['fusion_enable']
+        elif hasattr(qobj_config, 'fusion_enable'):
+            self._fusion_enable = qobj_config.fusion_enable
+        if 'fusion_threshold' in backend_options:
+            self._fusion_threshold = backend_options['fusion_threshold']
+        elif hasattr(qobj_config, 'fusion_threshold'):
+            self._fusion_threshold = qobj_config.fusion_threshold
 
     def _initialize_statevector(self):
         """Set the initial statevector for simulation"""
@@ -374,16 +511,34 @@ class QasmSimulatorPy(BaseBackend):
         Additional Information:
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_statevector": vector_like
+                * "max_parallel_experiments": int
+                * "max_parallel_shots": int
+                * "fusion_enable": bool
+                * "fusion_threshold": int
 
             The "initial_statevector" option specifies a custom initial
             initial statevector for the simulator to be used instead of the all
             zero state. This size of this vector must be correct for the number
             of qubits in all experiments in the qobj.
 
+            The "max_parallel_experiments" option specifies the maximum number
+            of experiments simulated in parallel worker processes, and the
+            "max_parallel_shots" option the number of chunks the shots of an
+            experiment which cannot sample its measurements are split in, each
+            chunk being simulated in parallel with its own seed derived from
+            the seed of the experiment. A value of 0 uses all the CPUs. The
+            default value of 1 simulates serially.
+
+            The "fusion_enable" option specifies whether consecutive gates are
+            fused into unitaries on at most two qubits before simulating
+            experiments with at least "fusion_threshold" qubits. The default
+            values are True and 14.
+
             Example::
 
                 backend_options = {
                     "initial_statevector": np.array([1, 0, 0, 1j]) / np.sqrt(2),
+                    "max_parallel_experiments": 4,
                 }
         """
         self._set_options(qobj_config=qobj.config,
@@ -409,8 +564,15 @@ class QasmSimulatorPy(BaseBackend):
         self._memory = getattr(qobj.config, 'memory', False)
         self._qobj_config = qobj.config
         start = time.time()
-        for experiment in qobj.experiments:
-            result_list.append(self.run_experiment(experiment))
+        max_parallel_experiments = self._max_parallel_experiments or CPU_COUNT
+        max_parallel_shots = self._max_parallel_shots or CPU_COUNT
+        if max_parallel_experiments == 1 and max_parallel_shots == 1:
+            for experiment in qobj.experiments:
+                result_list.append(self.run_experiment(experiment))
+        else:
+            result_list = self._run_experiments_in_parallel(
+                qobj.experiments, max(max_parallel_experiments, max_parallel_shots),
+                max_parallel_shots)
         end = time.time()
         result = {'backend_name': self.name(),
                   'backend_version': self._configuration.backend_version,
@@ -424,6 +586,74 @@ class QasmSimulatorPy(BaseBackend):
 
         return Result.from_dict(result)
 
+    def _run_experiments_in_parallel(self, experiments, num_processes, num_shot_chunks):
+        """Run experiments in parallel worker processes.
+
+        The seeds of the experiments are drawn here, so the results only depend
+        on the number of shot chunks and not on the worker running them.
+
+        Args:
+            experiments (list[QobjExperiment]): experiments from a qobj.
+            num_processes (int): the number of worker processes.
+            num_shot_chunks (int): the number of chunks the shots of an
+                experiment which cannot sample its measurements are split in.
+
+        Returns:
+            list[dict]: the experiment results, in the order of ``experiments``.
+        """
+        shots = self._qobj_config.shots
+        tasks = []
+        seeds = []
+        chunk_slices = []
+        for experiment in experiments:
+            seed_simulator = self._get_seed_simulator(experiment)
+            self._validate_measure_sampling(experiment)
+            num_chunks = 1
+            if not self._sample_measure and not self.SHOW_FINAL_STATE:
+                num_chunks = min(num_shot_chunks, shots)
+            if num_chunks == 1:
+                chunk_seeds = [seed_simulator]
+            else:
+                chunk_seeds = np.random.SeedSequence(seed_simulator).generate_state(num_chunks)
+            chunk_slices.append(slice(len(tasks), len(tasks) + num_chunks))
+            seeds.append(seed_simulator)
+            for index, chunk_seed in enumerate(chunk_seeds):
+                chunk_shots = shots // num_chunks + (index < shots % num_chunks)
+                tasks.append((experiment, int(chunk_seed), chunk_shots))
+
+        task_results = parallel_map(_run_experiment_task, tasks, task_args=(self,),
+                                    num_processes=num_processes)
+
+        result_list = []
+        for chunks, seed_simulator in zip(chunk_slices, seeds):
+            chunk_results = task_results[chunks]
+            result = chunk_results[0]
+            if len(chunk_results) > 1:
+                counts = Counter()
+                memory = []
+                for chunk_result in chunk_results:
+                    counts.update(chunk_result['data'].get('counts', {}))
+                    memory.extend(chunk_result['data'].get('memory', []))
+                result['data']['counts'] = dict(counts)
+                if self._memory:
+                    result['data']['memory'] = memory
+                result['seed_simulator'] = seed_simulator
+                result['shots'] = shots
+                result['time_taken'] = max(chunk_result['time_taken']
+                                           for chunk_result in chunk_results)
+            result_list.append(result)
+        return result_list
+
+    def _get_seed_simulator(self, experiment):
+        """Get the seed of an experiment looking in circuit, qobj, and then random."""
+        if hasattr(experiment.config, 'seed_simulator'):
+            return experiment.config.seed_simulator
+        if hasattr(self._qobj_config, 'seed_simulator'):
+            return self._qobj_config.seed_simulator
+        # For compatibility on Windows force dyte to be int32
+        # and set the maximum value to be (2 ** 31) - 1
+        return np.random.randint(2147483647, dtype='int32')
+
     def run_experiment(self, experiment):
         """Run an experiment (circuit) and return a single experiment result.
 
@@ -449,6 +679,16 @@ class QasmSimulatorPy(BaseBackend):
         Raises:
             BasicAerError: if an error occurred.
         """
+        return self._run_experiment(experiment, self._get_seed_simulator(experiment),
+                                    self._shots)
+
+    def _run_experiment(self, experiment, seed_simulator, shots):
+        """Run ``shots`` shots of an experiment with the given seed.
+
+        ``shots`` can be a chunk of the shots of the qobj, which are still used
+        to decide whether the measurements can be sampled. See
+        :meth:`run_experiment` for the returned result.
+        """
         start = time.time()
         self._number_of_qubits = experiment.config.n_qubits
         self._number_of_cmembits = experiment.config.memory_slots
@@ -458,133 +698,52 @@ class QasmSimulatorPy(BaseBackend):
         self._sample_measure = False
         # Validate the dimension of initial statevector if set
         self._validate_initial_statevector()
-        # Get the seed looking in circuit, qobj, and then random.
-        if hasattr(experiment.config, 'seed_simulator'):
-            seed_simulator = experiment.config.seed_simulator
-        elif hasattr(self._qobj_config, 'seed_simulator'):
-            seed_simulator = self._qobj_config.seed_simulator
-        else:
-            # For compatibility on Windows force dyte to be int32
-            # and set the maximum value to be (2 ** 31) - 1
-            seed_simulator = np.random.randint(2147483647, dtype='int32')
-
         self._local_random.seed(seed=seed_simulator)
         # Check if measure sampling is supported for current circuit
         self._validate_measure_sampling(experiment)
 
+        instructions = experiment.instructions
+        if self._fusion_enable and self._number_of_qubits >= self._fusion_threshold:
+            instructions = self._fuse_instructions(instructions)
+
         # List of final counts for all shots
         memory = []
         # Check if we can sample measurements, if so we only perform 1 shot
         # and sample all outcomes from the final state vector
         if self._sample_measure:
-            shots = 1
+            num_runs = 1
             # Store (qubit, cmembit) pairs for all measure ops in circuit to
             # be sampled
             measure_sample_ops = []
         else:
-            shots = self._shots
-        for _ in range(shots):
-            self._initialize_statevector()
+            num_runs = shots
+            measure_sample_ops = None
+        # The instructions before the first measurement, reset or classically
+        # controlled operation evolve the state the same way in every shot, so
+        # they are only simulated once and each shot starts from their state.
+        prefix_statevector = None
+        if num_runs > 1:
+            prefix_length = self._deterministic_prefix_length(instructions)
+            if prefix_length > 0:
+                self._initialize_statevector()
+                self._apply_instructions(instructions[:prefix_length], measure_sample_ops)
+                prefix_statevector = self._statevector
+                instructions = instructions[prefix_length:]
+        for _ in range(num_runs):
+            if prefix_statevector is None:
+                self._initialize_statevector()
+            else:
+                self._statevector = prefix_statevector.copy()
             # Initialize classical memory to all 0
             self._classical_memory = 0
             self._classical_register = 0
-            for operation in experiment.instructions:
-                conditional = getattr(operation, 'conditional', None)
-                if isinstance(conditional, int):
-                    conditional_bit_set = (self._classical_register >> conditional) & 1
-                    if not conditional_bit_set:
-                        continue
-                elif conditional is not None:
-                    mask = int(operation.conditional.mask, 16)
-                    if mask > 0:
-                        value = self._classical_memory & mask
-                        while (mask & 0x1) == 0:
-                            mask >>= 1
-                            value >>= 1
-                        if value != int(operation.conditional.val, 16):
-                            continue
-
-                # Check if single  gate
-                if operation.name == 'unitary':
-                    qubits = operation.qubits
-                    gate = operation.params[0]
-                    self._add_unitary(gate, qubits)
-                elif operation.name in ('U', 'u1', 'u2', 'u3'):
-                    params = getattr(operation, 'params', None)
-                    qubit = operation.qubits[0]
-                    gate = single_gate_matrix(operation.name, params)
-                    self._add_unitary(gate, [qubit])
-                # Check if CX gate
-                elif operation.name in ('id', 'u0'):
-                    pass
-                elif operation.name in ('CX', 'cx'):
-                    qubit0 = operation.qubits[0]
-                    qubit1 = operation.qubits[1]
-                    gate = cx_gate_matrix()
-                    self._add_unitary(gate, [qubit0, qubit1])
-                # Check if reset
-                elif operation.name == 'reset':
-                    qubit = operation.qubits[0]
-                    self._add_qasm_reset(qubit)
-                # Check if barrier
-                elif operation.name == 'barrier':
-                    pass
-                # Check if measure
-                elif operation.name == 'measure':
-                    qubit = operation.qubits[0]
-                    cmembit = operation.memory[0]
-                    cregbit = operation.register[0] if hasattr(operation, 'register') else None
-
-                    if self._sample_measure:
-                        # If sampling measurements record the qubit and cmembit
-                        # for this measurement for later sampling
-                        measure_sample_ops.append((qubit, cmembit))
-                    else:
-                        # If not sampling perform measurement as normal
-                        self._add_qasm_measure(qubit, cmembit, cregbit)
-                elif operation.name == 'bfunc':
-                    mask = int(operation.mask, 16)
-                    relation = operation.relation
-                    val = int(operation.val, 16)
-
-                    cregbit = operation.register
-                    cmembit = operation.memory if hasattr(operation, 'memory') else None
-
-                    compared = (self._classical_register & mask) - val
-
-                    if relation == '==':
-                        outcome = (compared == 0)
-                    elif relation == '!=':
-                        outcome = (compared != 0)
-                    elif relation == '<':
-                        outcome = (compared < 0)
-                    elif relation == '<=':
-                        outcome = (compared <= 0)
-                    elif relation == '>':
-                        outcome = (compared > 0)
-                    elif relation == '>=':
-                        outcome = (compared >= 0)
-                    else:
-                        raise BasicAerError('Invalid boolean function relation.')
-
-                    # Store outcome in register and optionally memory slot
-                    regbit = 1 << cregbit
-                    self._classical_register = \
-                        (self._classical_register & (~regbit)) | (int(outcome) << cregbit)
-                    if cmembit is not None:
-                        membit = 1 << cmembit
-                        self._classical_memory = \
-                            (self._classical_memory & (~membit)) | (int(outcome) << cmembit)
-                else:
-                    backend = self.name()
-                    err_msg = '{0} encountered unrecognized operation "{1}"'
-                    raise BasicAerError(err_msg.format(backend, operation.name))
+            self._apply_instructions(instructions, measure_sample_ops)
 
             # Add final creg data to memory list
             if self._number_of_cmembits > 0:
                 if self._sample_measure:
                     # If sampling we generate all shot samples from the final statevector
-                    memory = self._add_sample_measure(measure_sample_ops, self._shots)
+                    memory = self._add_sample_measure(measure_sample_ops, shots)
                 else:
                     # Turn classical_memory (int) into bit string and pad zero for unused cmembits
                     outcome = bin(self._classical_memory)[2:]
@@ -606,13 +765,134 @@ class QasmSimulatorPy(BaseBackend):
         end = time.time()
         return {'name': experiment.header.name,
                 'seed_simulator': seed_simulator,
-                'shots': self._shots,
+                'shots': shots,
                 'data': data,
                 'status': 'DONE',
                 'success': True,
                 'time_taken': (end - start),
                 'header': experiment.header.to_dict()}
 
+    @staticmethod
+    def _deterministic_prefix_length(instructions):
+        """Return the number of instructions before the first non-unitary one.
+
+        Args:
+            instructions (list[QasmQobjInstruction]): the instructions of an
+                experiment.
+
+        Returns:
+            int: the number of instructions before the first measurement,
+            reset, boolean function or classically controlled operation.
+        """
+        for index, operation in enumerate(instructions):
+            if operation.name in ('measure', 'reset', 'bfunc') or \
+                    getattr(operation, 'conditional', None) is not None:
+                return index
+        return len(instructions)
+
+    def _apply_instructions(self, instructions, measure_sample_ops):
+        """Apply the instructions of an experiment to the current state.
+
+        Args:
+            instructions (list[QasmQobjInstruction]): the instructions.
+            measure_sample_ops (list): list to which the (qubit, cmembit) pairs
+                of the measurements are appended if sampling measurements.
+
+        Raises:
+            BasicAerError: if an instruction is not supported.
+        """
+        for operation in instructions:
+            conditional = getattr(operation, 'conditional', None)
+            if isinstance(conditional, int):
+                conditional_bit_set = (self._classical_register >> conditional) & 1
+                if not conditional_bit_set:
+                    continue
+            elif conditional is not None:
+                mask = int(operation.conditional.mask, 16)
+                if mask > 0:
+                    value = self._classical_memory & mask
+                    while (mask & 0x1) == 0:
+                        mask >>= 1
+                        value >>= 1
+                    if value != int(operation.conditional.val, 16):
+                        continue
+
+            # Check if single  gate
+            if operation.name == 'unitary':
+                qubits = operation.qubits
+                gate = operation.params[0]
+                self._add_unitary(gate, qubits)
+            elif operation.name in ('U', 'u1', 'u2', 'u3'):
+                params = getattr(operation, 'params', None)
+                qubit = operation.qubits[0]
+                gate = single_gate_matrix(operation.name, params)
+                self._add_unitary(gate, [qubit])
+            # Check if CX gate
+            elif operation.name in ('id', 'u0'):
+                pass
+            elif operation.name in ('CX', 'cx'):
+                qubit0 = operation.qubits[0]
+                qubit1 = operation.qubits[1]
+                gate = cx_gate_matrix()
+                self._add_unitary(gate, [qubit0, qubit1])
+            # Check if reset
+            elif operation.name == 'reset':
+                qubit = operation.qubits[0]
+                self._add_qasm_reset(qubit)
+            # Check if barrier
+            elif operation.name == 'barrier':
+                pass
+            # Check if measure
+            elif operation.name == 'measure':
+                qubit = operation.qubits[0]
+                cmembit = operation.memory[0]
+                cregbit = operation.register[0] if hasattr(operation, 'register') else None
+
+                if self._sample_measure:
+                    # If sampling measurements record the qubit and cmembit
+                    # for this measurement for later sampling
+                    measure_sample_ops.append((qubit, cmembit))
+                else:
+                    # If not sampling perform measurement as normal
+                    self._add_qasm_measure(qubit, cmembit, cregbit)
+            elif operation.name == 'bfunc':
+                mask = int(operation.mask, 16)
+                relation = operation.relation
+                val = int(operation.val, 16)
+
+                cregbit = operation.register
+                cmembit = operation.memory if hasattr(operation, 'memory') else None
+
+                compared = (self._classical_register & mask) - val
+
+                if relation == '==':
+                    outcome = (compared == 0)
+                elif relation == '!=':
+                    outcome = (compared != 0)
+                elif relation == '<':
+                    outcome = (compared < 0)
+                elif relation == '<=':
+                    outcome = (compared <= 0)
+                elif relation == '>':
+                    outcome = (compared > 0)
+                elif relation == '>=':
+                    outcome = (compared >= 0)
+                else:
+                    raise BasicAerError('Invalid boolean function relation.')
+
+                # Store outcome in register and optionally memory slot
+                regbit = 1 << cregbit
+                self._classical_register = \
+                    (self._classical_register & (~regbit)) | (int(outcome) << cregbit)
+                if cmembit is not None:
+                    membit = 1 << cmembit
+                    self._classical_memory = \
+                        (self._classical_memory & (~membit)) | (int(outcome) << cmembit)
+            else:
+                backend = self.name()
+                err_msg = '{0} encountered unrecognized operation "{1}"'
+                raise BasicAerError(err_msg.format(backend, operation.name))
+
     def _validate(self, qobj):
         """Semantic validations of the qobj which cannot be done via schemas."""
         n_qubits = qobj.config.n_qubits
@@ -14,8 +14,10 @@
 
 import copy
 import datetime
-from typing import Any, Iterable, Tuple, Union
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Tuple, Union
 import dateutil.parser
+import numpy as np
 
 from qiskit.providers.exceptions import BackendPropertyError
 
@@ -208,6 +210,13 @@ class BackendProperties:
                 value = self._apply_prefix(param.value, param.unit)
                 formatted_props[param.name] = (value, param.date)
             self._gates[gate.gate][tuple(gate.qubits)] = formatted_props
+
+        # Indexes of the properties, built on first use from the qubits and
+        # gates lists, and the elements of the list each was built from.
+        self._qubit_arrays = {}
+        self._qubit_arrays_source = None
+        self._gate_indexes = {}
+        self._gate_indexes_source = None
         self._data.update(kwargs)
 
     def __getattr__(self, name):
@@ -397,6 +406,65 @@ class BackendProperties:
                                                          qubit=qubit))
         return result
 
+    def qubit_property_array(self, name: str) -> np.ndarray:
+        """
+        Return a property of all the qubits as an array.
+
+        The array has one entry per element of :attr:`qubits`. It is built on
+        first use and kept until elements are added to, removed from or
+        replaced in that list, e.g. by the removal of faulty qubits.
+
+        Args:
+            name: Name of the qubit property, e.g. ``'T1'`` or ``'readout_error'``.
+
+        Returns:
+            The value of the property for each qubit, in standard SI units, or
+            ``nan`` for the qubits without the property. The array is read-only.
+        """
+        if not _same_elements(self._qubit_arrays_source, self.qubits):
+            self._qubit_arrays = {}
+            self._qubit_arrays_source = list(self.qubits)
+        if name not in self._qubit_arrays:
+            values = np.full(len(self.qubits), np.nan)
+            for qubit, properties in enumerate(self.qubits):
+                for prop in properties:
+                    if prop.name == name:
+                        values[qubit] = self._apply_prefix(prop.value, prop.unit)
+                        break
+            values.setflags(write=False)
+            self._qubit_arrays[name] = values
+        return self._qubit_arrays[name]
+
+    def gate_property_index(self, name: str) -> Mapping[Tuple[str, Tuple[int, ...]], float]:
+        """
+        Return a property of all the gates, indexed by gate name and qubits.
+
+        The index is built from :attr:`gates` on first use and kept until
+        elements are added to, removed from or replaced in that list, e.g. by
+        the removal of faulty gates.
+
+        Args:
+            name: Name of the gate property, e.g. ``'gate_error'`` or ``'gate_length'``.
+
+        Returns:
+            A read-only mapping of ``(gate, qubits)`` pairs, with ``qubits`` a
+            tuple, to the value of the property in standard SI units, for the
+            gates which have the property.
+        """
+        if not _same_elements(self._gate_indexes_source, self.gates):
+            self._gate_indexes = {}
+            self._gate_indexes_source = list(self.gates)
+        if name not in self._gate_indexes:
+            index = {}
+            for gate in self.gates:
+                for param in gate.parameters:
+                    if param.name == name:
+                        index.setdefault((gate.gate, tuple(gate.qubits)),
+                                         self._apply_prefix(param.value, param.unit))
+                        break
+            self._gate_indexes[name] = MappingProxyType(index)
+        return self._gate_indexes[name]
+
     def t1(self, qubit: int) -> float:  # pylint: disable=invalid-name
         """
         Return the T1 time of the given qubit.
@@ -496,3 +564,9 @@ class BackendProperties:
         else:
             raise BackendPropertyError(
                 "Could not understand units: {u}".format(u=unit))
+
+
+def _same_elements(source, items):
+    """Return True if ``items`` holds the same objects as the list ``source``."""
+    return (source is not None and len(source) == len(items)
+            and all(old is new for old, new in zip(source, items)))
@@ -24,6 +24,9 @@ Parallel Routines
    :toctree: ../stubs/
 
    parallel_map
+   parallel_imap
+   start_process_pool
+   shutdown_process_pool
 
 Monitoring
 ==========
@@ -37,5 +40,6 @@ Monitoring
 
 """
 
-from .parallel import parallel_map
+from .parallel import (parallel_map, parallel_imap, start_process_pool,
+                       shutdown_process_pool)
 from .monitor import (job_monitor, backend_monitor, backend_overview)
@@ -50,7 +50,11 @@ from the multiprocessing library.
 
 import os
 import platform
+from collections import deque
+from itertools import islice
+from concurrent import futures
 from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from qiskit.exceptions import QiskitError
 from qiskit.util import local_hardware_info
 from qiskit.tools.events.pubsub import Publisher
@@ -62,10 +66,97 @@ if os.getenv('QISKIT_IN_PARALLEL') is None:
 # Number of local physical cpus
 CPU_COUNT = local_hardware_info()['cpus']
 
+# State of the persistent process pool shared by ``parallel_map`` calls. The
+# pid of the owning process is stored so a forked child never reuses (or shuts
+# down) the executor of its parent.
+_SHARED_POOL = None
+_SHARED_POOL_SIZE = None
+_SHARED_POOL_PID = None
+
+# Number of chunks of values ``parallel_map`` submits per worker process.
+_CHUNKS_PER_WORKER = 4
+
 
 def _task_wrapper(param):
-    (task, value, task_args, task_kwargs) = param
-    return task(value, *task_args, **task_kwargs)
+    (task, values, task_args, task_kwargs) = param
+    return [task(value, *task_args, **task_kwargs) for value in values]
+
+
+def _split_values(values, num_workers):
+    """Split ``values`` in ordered chunks, about ``_CHUNKS_PER_WORKER`` per worker.
+
+    The chunks are small enough for the executor to balance the load between
+    the workers when the values take different times to process.
+    """
+    chunk_size = -(-len(values) // (_CHUNKS_PER_WORKER * num_workers))
+    return [values[start:start + chunk_size] for start in range(0, len(values), chunk_size)]
+
+
+def start_process_pool(num_processes=CPU_COUNT):
+    """Start a persistent process pool shared by all :func:`parallel_map` calls.
+
+    By default every :func:`parallel_map` call (and hence every multi-circuit
+    :func:`~qiskit.compiler.transpile` or :meth:`~qiskit.transpiler.PassManager.run`)
+    spawns a fresh pool of worker processes and tears it down when the map is
+    done. Once this function has been called the same workers are reused
+    across calls, avoiding the process startup cost, until
+    :func:`shutdown_process_pool` is called.
+
+    Calling this function while a pool is already running with a different
+    number of processes replaces it with a pool of the requested size.
+
+    Worker processes are started from the state of the parent process at the
+    time of the first parallel call, so functions given to
+    :func:`parallel_map` must be importable (or defined) by then.
+
+    Args:
+        num_processes (int): Number of worker processes in the pool.
+
+    Raises:
+        QiskitError: If ``num_processes`` is less than 1.
+    """
+    global _SHARED_POOL, _SHARED_POOL_SIZE, _SHARED_POOL_PID  # pylint: disable=global-statement
+    if num_processes < 1:
+        raise QiskitError('The process pool needs at least one process, '
+                          'got %s.' % num_processes)
+    if _SHARED_POOL is not None and _SHARED_POOL_PID == os.getpid():
+        if _SHARED_POOL_SIZE == num_processes:
+            return
+        _SHARED_POOL.shutdown(wait=True)
+    _SHARED_POOL = ProcessPoolExecutor(max_workers=num_processes)
+    _SHARED_POOL_SIZE = num_processes
+    _SHARED_POOL_PID = os.getpid()
+
+
+def shutdown_process_pool(wait=True):
+    """Shut down the persistent process pool started by :func:`start_process_pool`.
+
+    Subsequent :func:`parallel_map` calls go back to using a new pool per call.
+    It is safe to call this function when no pool is running.
+
+    Args:
+        wait (bool): If ``True``, block until all the worker processes have exited.
+    """
+    global _SHARED_POOL, _SHARED_POOL_SIZE, _SHARED_POOL_PID  # pylint: disable=global-statement
+    if _SHARED_POOL is not None and _SHARED_POOL_PID == os.getpid():
+        _SHARED_POOL.shutdown(wait=wait)
+    _SHARED_POOL = None
+    _SHARED_POOL_SIZE = None
+    _SHARED_POOL_PID = None
+
+
+def _shared_process_pool():
+    """Return the persistent executor usable from the current process, if any.
+
+    A pool inherited through ``fork`` belongs to the parent process, its
+    worker processes and management threads do not exist in the child. In that
+    case a new pool of the same size is started for the child.
+    """
+    if _SHARED_POOL is None:
+        return None
+    if _SHARED_POOL_PID != os.getpid():
+        start_process_pool(_SHARED_POOL_SIZE)
+    return _SHARED_POOL
 
 
 def parallel_map(  # pylint: disable=dangerous-default-value
@@ -79,6 +170,14 @@ def parallel_map(  # pylint: disable=dangerous-default-value
     On Windows this function defaults to a serial implementation to avoid the
     overhead from spawning processes in Windows.
 
+    If a persistent pool has been started with :func:`start_process_pool`, its
+    workers are used instead of spawning new processes and ``num_processes``
+    only selects between parallel (> 1) and serial execution.
+
+    ``values`` are submitted to the workers in a few small chunks per worker
+    process, so ``task``, ``task_args`` and ``task_kwargs`` are serialized and
+    sent once per chunk rather than once per value.
+
     Args:
         task (func): Function that is to be called for each value in ``values``.
         values (array_like): List or array of values for which the ``task``
@@ -118,14 +217,28 @@ def parallel_map(  # pylint: disable=dangerous-default-value
         os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
         try:
             results = []
-            with ProcessPoolExecutor(max_workers=num_processes) as executor:
-                param = map(lambda value: (task, value, task_args, task_kwargs), values)
-                future = executor.map(_task_wrapper, param)
+            shared_executor = _shared_process_pool()
+            num_workers = _SHARED_POOL_SIZE if shared_executor is not None else num_processes
+            param = map(lambda chunk: (task, chunk, task_args, task_kwargs),
+                        _split_values(values, num_workers))
+            if shared_executor is not None:
+                future = shared_executor.map(_task_wrapper, param)
+            else:
+                with ProcessPoolExecutor(max_workers=num_processes) as executor:
+                    future = executor.map(_task_wrapper, param)
 
-            results = list(future)
+            for chunk_results in future:
+                results.extend(chunk_results)
             Publisher().publish("terra.parallel.done", len(results))
 
         except (KeyboardInterrupt, Exception) as error:
+            if isinstance(error, BrokenProcessPool):
+                # A dead worker leaves the persistent pool unusable, replace it
+                # so later calls do not fail as well.
+                size = _SHARED_POOL_SIZE
+                shutdown_process_pool(wait=False)
+                if size is not None:
+                    start_process_pool(size)
             if isinstance(error, KeyboardInterrupt):
                 Publisher().publish("terra.parallel.finish")
                 os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
@@ -147,3 +260,115 @@ def parallel_map(  # pylint: disable=dangerous-default-value
         _callback(0)
     Publisher().publish("terra.parallel.finish")
     return results
+
+
+def parallel_imap(  # pylint: disable=dangerous-default-value
+        task, values, task_args=tuple(), task_kwargs={}, num_processes=CPU_COUNT,
+        chunk_size=1, max_in_flight=None, ordered=True):
+    """
+    Lazy parallel execution of a mapping of ``values`` to the function ``task``.
+    This is functionally equivalent to::
+
+        for value in values:
+            yield task(value, *task_args, **task_kwargs)
+
+    Unlike :func:`parallel_map`, ``values`` can be any iterable (including a
+    generator) and is only consumed as worker processes become available:
+    ``values`` are sent to the workers in chunks of ``chunk_size`` and at most
+    ``max_in_flight`` chunks are pending at any time. Results are yielded as
+    soon as their chunk is done, so the caller can start working on the first
+    results while the rest are still being computed.
+
+    The persistent pool started by :func:`start_process_pool` is used if it is
+    running, otherwise a new pool is started and shut down when the generator
+    is exhausted or closed. On Windows, when ``num_processes`` is 1 or inside
+    another parallel call, the values are mapped serially.
+
+    Args:
+        task (func): Function that is to be called for each value in ``values``.
+        values (iterable): Iterable of values for which the ``task`` function is
+            to be evaluated.
+        task_args (list): Optional additional arguments to the ``task`` function.
+        task_kwargs (dict): Optional additional keyword argument to the ``task`` function.
+        num_processes (int): Number of processes to spawn.
+        chunk_size (int): Number of values sent to a worker at once.
+        max_in_flight (int): Maximum number of chunks submitted and not yet
+            yielded. Defaults to twice the number of worker processes.
+        ordered (bool): If ``True`` the results are yielded in the order of
+            ``values``, otherwise they are yielded as soon as they complete.
+
+    Yields:
+        object: The value of ``task(value, *task_args, **task_kwargs)`` for each
+        value in ``values``.
+
+    Raises:
+        QiskitError: If ``chunk_size`` or ``max_in_flight`` is not positive or
+            if the user interrupts via keyboard.
+        BrokenProcessPool: If a worker process died. A persistent pool is
+            replaced by a new one before raising.
+    """
+    if chunk_size < 1:
+        raise QiskitError('chunk_size must be a positive integer, got %s.' % chunk_size)
+    if max_in_flight is not None and max_in_flight < 1:
+        raise QiskitError('max_in_flight must be a positive integer, got %s.' % max_in_flight)
+
+    if platform.system() == 'Windows' or num_processes <= 1 \
+            or os.getenv('QISKIT_IN_PARALLEL') != 'FALSE':
+        for value in values:
+            yield task(value, *task_args, **task_kwargs)
+        return
+
+    shared_executor = _shared_process_pool()
+    if shared_executor is not None:
+        executor = shared_executor
+        num_workers = _SHARED_POOL_SIZE
+    else:
+        executor = ProcessPoolExecutor(max_workers=num_processes)
+        num_workers = num_processes
+    if max_in_flight is None:
+        max_in_flight = 2 * num_workers
+
+    values = iter(values)
+    pending = deque()
+
+    def _submit():
+        chunk = list(islice(values, chunk_size))
+        if not chunk:
+            return False
+        # Worker processes are started on submission and inherit this flag,
+        # which keeps them from starting nested pools.
+        os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
+        try:
+            pending.append(executor.submit(_task_wrapper,
+                                           (task, chunk, task_args, task_kwargs)))
+        finally:
+            os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
+        return True
+
+    try:
+        while len(pending) < max_in_flight and _submit():
+            pass
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                done, _ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+            for future in done:
+                for result in future.result():
+                    yield result
+            while len(pending) < max_in_flight and _submit():
+                pass
+    except KeyboardInterrupt:
+        raise QiskitError('Keyboard interrupt in parallel_imap.')
+    except BrokenProcessPool:
+        if shared_executor is not None:
+            shutdown_process_pool(wait=False)
+            start_process_pool(num_workers)
+        raise
+    finally:
+        for future in pending:
+            future.cancel()
+        if shared_executor is None:
+            executor.shutdown(wait=True)
@@ -380,6 +380,7 @@ Pass Manager Construction
    PassManagerConfig
    PropertySet
    FlowController
+   TranspileCache
 
 Layout and Topology
 -------------------
@@ -418,3 +419,4 @@ from .fencedobjs import FencedDAGCircuit, FencedPropertySet
 from .basepasses import AnalysisPass, TransformationPass
 from .coupling import CouplingMap
 from .layout import Layout
+from .cache import TranspileCache
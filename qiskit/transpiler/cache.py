@@ -0,0 +1,307 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Cache of transpiled circuits keyed by circuit structure and transpile options."""
+
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+
+import numpy as np
+
+from qiskit.circuit import Parameter, ParameterExpression
+from qiskit.transpiler.coupling import CouplingMap
+from qiskit.transpiler.exceptions import TranspilerError
+from qiskit.transpiler.layout import Layout
+
+
+class TranspileCache:
+    """Least recently used cache of transpiled circuits.
+
+    Circuits are looked up by a canonical hash of their structure (registers,
+    instructions, the wires they act on, their numeric parameters and
+    conditions) together with the options they are transpiled with, so
+    compiling a structurally identical circuit again for the same target is a
+    lookup instead of a run of the transpiler. The circuit name is not part of
+    the key, and neither are the identities or names of unbound
+    :class:`~qiskit.circuit.Parameter` objects: a cached circuit is returned
+    with the parameters of the circuit being transpiled.
+
+    The cache is enabled by passing it to :func:`~qiskit.compiler.transpile`::
+
+        from qiskit.transpiler import TranspileCache
+
+        cache = TranspileCache(max_size=256)
+        transpiled = transpile(circuits, backend, cache=cache)
+        print(cache.hits, cache.misses)
+
+    If ``filename`` is given the cache is loaded from that file, if it exists,
+    and :meth:`save` writes it back.
+
+    .. note::
+
+        If ``seed_transpiler`` is not set the transpilation of a circuit is not
+        deterministic, and a cache hit returns the result of the first
+        transpilation of that circuit.
+    """
+
+    def __init__(self, max_size=128, filename=None):
+        """Create a new transpile cache.
+
+        Args:
+            max_size (int): Maximum number of circuits kept. When the cache is
+                full, the least recently used circuit is evicted.
+            filename (str): Path of a file to persist the cache to. If the file
+                exists, the cache is initialized with its contents.
+
+        Raises:
+            TranspilerError: if ``max_size`` is not positive, or if ``filename``
+                is not a valid cache file.
+        """
+        if max_size < 1:
+            raise TranspilerError('The cache size must be positive, got %s.' % max_size)
+        self.max_size = max_size
+        self.filename = filename
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        # Key of the last backend properties seen, they are usually shared by
+        # all the circuits of a transpile call and are expensive to serialize.
+        self._properties_key = (None, None)
+        if filename is not None and os.path.exists(filename):
+            with open(filename, 'rb') as file:
+                try:
+                    entries = pickle.load(file)
+                except (pickle.UnpicklingError, EOFError, AttributeError) as error:
+                    raise TranspilerError('Cannot load the transpile cache from %s: %s'
+                                          % (filename, error))
+            if not isinstance(entries, OrderedDict):
+                raise TranspilerError('%s is not a transpile cache file.' % filename)
+            self._entries = entries
+            self._evict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def clear(self):
+        """Remove every circuit from the cache and reset the statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def save(self, filename=None):
+        """Write the cache to disk.
+
+        Args:
+            filename (str): Path of the file to write. Defaults to the
+                ``filename`` the cache was created with.
+
+        Raises:
+            TranspilerError: if no file name is known.
+        """
+        filename = filename or self.filename
+        if filename is None:
+            raise TranspilerError('No file name given to save the transpile cache to.')
+        with open(filename, 'wb') as file:
+            pickle.dump(self._entries, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def stats(self):
+        """Return the statistics of the cache.
+
+        Returns:
+            dict: The number of ``hits``, ``misses`` and cached circuits (``size``).
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
+
+    def key(self, circuit, transpile_config):
+        """Return the cache key of ``circuit`` transpiled with ``transpile_config``.
+
+        Args:
+            circuit (QuantumCircuit): the circuit to transpile.
+            transpile_config (dict): the options of the transpilation, in the
+                format used by :func:`~qiskit.compiler.transpile` internally.
+
+        Returns:
+            tuple(str, list[Parameter]): the key and the unbound parameters of
+            ``circuit`` in the canonical order used by the key.
+        """
+        circuit_key, parameters = _circuit_key(circuit)
+        backend_properties = transpile_config['pass_manager_config'].backend_properties
+        if backend_properties is not self._properties_key[0]:
+            properties_key = None
+            if backend_properties is not None:
+                properties_key = hashlib.sha256(
+                    repr(backend_properties.to_dict()).encode('utf-8')).hexdigest()
+            self._properties_key = (backend_properties, properties_key)
+        config_key = _config_key(transpile_config, self._properties_key[1])
+        digest = hashlib.sha256(repr((circuit_key, config_key)).encode('utf-8')).hexdigest()
+        return digest, parameters
+
+    def get(self, key, parameters, name):
+        """Return a copy of a cached circuit, or ``None`` if it is not cached.
+
+        Args:
+            key (str): the key returned by :meth:`key`.
+            parameters (list[Parameter]): the parameters returned by :meth:`key`,
+                which replace those of the cached circuit.
+            name (str): the name of the returned circuit.
+
+        Returns:
+            QuantumCircuit: the cached transpiled circuit, or ``None``.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        cached_circuit, cached_parameters = entry
+        return self.hit(cached_circuit, cached_parameters, parameters, name)
+
+    def hit(self, circuit, circuit_parameters, parameters, name):
+        """Count a hit and return a copy of a transpiled circuit for an identical one.
+
+        This is how :meth:`get` returns the cached circuits. It can also be
+        used for a circuit transpiled outside of the cache, e.g. a circuit
+        evicted since it was transpiled for a structurally identical one.
+
+        Args:
+            circuit (QuantumCircuit): the transpiled circuit.
+            circuit_parameters (list[Parameter]): the parameters of ``circuit``,
+                as returned by :meth:`key`.
+            parameters (list[Parameter]): the parameters replacing them.
+            name (str): the name of the returned circuit.
+
+        Returns:
+            QuantumCircuit: the copy of ``circuit``.
+        """
+        self.hits += 1
+        circuit = circuit.copy(name=name)
+        _replace_parameters(circuit, circuit_parameters, parameters)
+        return circuit
+
+    def put(self, key, parameters, circuit):
+        """Add a transpiled circuit to the cache.
+
+        Args:
+            key (str): the key returned by :meth:`key`.
+            parameters (list[Parameter]): the parameters returned by :meth:`key`.
+            circuit (QuantumCircuit): the transpiled circuit. A copy is stored.
+        """
+        self._entries[key] = (circuit.copy(), list(parameters))
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def _evict(self):
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+def _replace_parameters(circuit, old_parameters, new_parameters):
+    """Replace, in place, the parameters of a cached circuit with the new ones."""
+    circuit_parameters = circuit.parameters
+    mapping = {old: new for old, new in zip(old_parameters, new_parameters)
+               if old in circuit_parameters and old is not new}
+    if not mapping:
+        return
+    if set(mapping.values()) & circuit_parameters:
+        # The substitution is done one parameter at a time, go through fresh
+        # parameters so that swapped parameters are not merged.
+        temporary = {old: Parameter('_%s' % old.name) for old in mapping}
+        circuit.assign_parameters(temporary, inplace=True)
+        mapping = {temporary[old]: new for old, new in mapping.items()}
+    circuit.assign_parameters(mapping, inplace=True)
+
+
+def _circuit_key(circuit):
+    """Return a canonical, hashable description of the structure of ``circuit``."""
+    parameters = {}
+    qubit_indices = {bit: index for index, bit in enumerate(circuit.qubits)}
+    clbit_indices = {bit: index for index, bit in enumerate(circuit.clbits)}
+    global_phase = _param_key(circuit.global_phase, parameters)
+    data = tuple((_instruction_key(instruction, parameters),
+                  tuple(qubit_indices[qubit] for qubit in qargs),
+                  tuple(clbit_indices[clbit] for clbit in cargs))
+                 for instruction, qargs, cargs in circuit.data)
+    key = (tuple((qreg.name, qreg.size) for qreg in circuit.qregs),
+           tuple((creg.name, creg.size) for creg in circuit.cregs),
+           global_phase, data)
+    return key, list(parameters)
+
+
+def _instruction_key(instruction, parameters):
+    if instruction.condition is None:
+        condition = None
+    else:
+        condition = (instruction.condition[0].name, instruction.condition[1])
+    key = (instruction.name, type(instruction).__qualname__,
+           instruction.num_qubits, instruction.num_clbits, condition,
+           tuple(_param_key(param, parameters) for param in instruction.params))
+    if not type(instruction).__module__.startswith('qiskit.circuit.library.standard_gates') \
+            and instruction.definition is not None:
+        # Custom instructions can share a name with different definitions.
+        definition = instruction.definition
+        qubit_indices = {bit: index for index, bit in enumerate(definition.qubits)}
+        clbit_indices = {bit: index for index, bit in enumerate(definition.clbits)}
+        key += (_param_key(definition.global_phase, parameters),
+                tuple((_instruction_key(inner, parameters),
+                       tuple(qubit_indices[qubit] for qubit in qargs),
+                       tuple(clbit_indices[clbit] for clbit in cargs))
+                      for inner, qargs, cargs in definition.data))
+    return key
+
+
+def _param_key(param, parameters):
+    """Return a canonical key of an instruction parameter.
+
+    Unbound parameters are numbered in order of first appearance, in
+    ``parameters``, so that the key does not depend on their names.
+    """
+    if isinstance(param, ParameterExpression):
+        if not param.parameters:
+            return ('value', repr(complex(param._symbol_expr)))
+        # pylint: disable=protected-access
+        from sympy import Symbol, srepr
+        symbols = {}
+        for parameter, symbol in sorted(param._parameter_symbols.items(),
+                                        key=lambda item: item[1].name):
+            if parameter not in parameters:
+                parameters[parameter] = len(parameters)
+            symbols[symbol] = Symbol('_p%d' % parameters[parameter])
+        return ('expr', srepr(param._symbol_expr.xreplace(symbols)))
+    if isinstance(param, np.ndarray):
+        return ('array', param.shape, param.dtype.str, param.tobytes())
+    return (type(param).__name__, repr(param))
+
+
+def _config_key(transpile_config, properties_key):
+    pm_config = transpile_config['pass_manager_config']
+    coupling_map = pm_config.coupling_map
+    if isinstance(coupling_map, CouplingMap):
+        coupling_map = tuple(sorted(coupling_map.get_edges()))
+    initial_layout = pm_config.initial_layout
+    if isinstance(initial_layout, Layout):
+        initial_layout = tuple(
+            sorted((physical, None if virtual is None else
+                    (virtual.register.name, virtual.register.size, virtual.index))
+                   for physical, virtual in initial_layout.get_physical_bits().items()))
+    faulty_qubits_map = transpile_config['faulty_qubits_map']
+    if faulty_qubits_map is not None:
+        faulty_qubits_map = tuple(sorted(faulty_qubits_map.items()))
+    return (pm_config.basis_gates and tuple(pm_config.basis_gates), coupling_map,
+            initial_layout, pm_config.layout_method, pm_config.routing_method,
+            pm_config.translation_method, properties_key, pm_config.seed_transpiler,
+            transpile_config['optimization_level'], transpile_config['backend_num_qubits'],
+            faulty_qubits_map)
@@ -19,6 +19,7 @@ CNOT gates. The object has a distance function that can be used to map quantum c
 onto a device with this coupling.
 """
 import io
+from functools import lru_cache
 import numpy as np
 import scipy.sparse as sp
 import scipy.sparse.csgraph as cs
@@ -80,7 +81,7 @@ class CouplingMap:
         """
         if not isinstance(physical_qubit, int):
             raise CouplingError("Physical qubits should be integers.")
-        if physical_qubit in self.physical_qubits:
+        if physical_qubit in self.graph:
             raise CouplingError(
                 "The physical qubit %s is already in the coupling graph" % physical_qubit)
         self.graph.add_node(physical_qubit)
@@ -94,9 +95,9 @@ class CouplingMap:
         src (int): source physical qubit
         dst (int): destination physical qubit
         """
-        if src not in self.physical_qubits:
+        if src not in self.graph:
             self.add_physical_qubit(src)
-        if dst not in self.physical_qubits:
+        if dst not in self.graph:
             self.add_physical_qubit(dst)
         self.graph.add_edge(src, dst)
         self._dist_matrix = None  # invalidate
@@ -140,22 +141,41 @@ class CouplingMap:
         """
         return self.graph.neighbors(physical_qubit)
 
-    def _compute_distance_matrix(self):
+    @property
+    def distance_matrix(self):
+        """Return the distance matrix of the coupling map.
+
+        Returns:
+            numpy.ndarray: the matrix of the undirected distances between the
+            physical qubits, indexed by physical qubit.
+
+        Raises:
+            CouplingError: if the coupling graph is not connected.
+        """
+        if self._dist_matrix is None:
+            self.compute_distance_matrix()
+        return self._dist_matrix
+
+    def compute_distance_matrix(self):
         """Compute the full distance matrix on pairs of nodes.
 
-        The distance map self._dist_matrix is computed from the graph using
-        all_pairs_shortest_path_length.
+        The distance map self._dist_matrix is computed from the graph with
+        ``scipy.sparse.csgraph``. Coupling maps with the same qubits and edges
+        share the same read-only matrix, which is computed once per process
+        for the most recently used coupling graphs. This is normally handled internally
+        by the :attr:`~qiskit.transpiler.CouplingMap.distance_matrix`
+        attribute or the :meth:`~qiskit.transpiler.CouplingMap.distance`
+        method, but can be called if you're accessing the distance matrix
+        outside of those or want to pre-generate it, e.g. before sending the
+        coupling map to other processes.
+
+        Raises:
+            CouplingError: if the coupling graph is not connected.
         """
         if not self.is_connected():
             raise CouplingError("coupling graph not connected")
-        lengths = nx.all_pairs_shortest_path_length(self.graph.to_undirected(as_view=True))
-        lengths = dict(lengths)
-        size = len(lengths)
-        cmap = np.zeros((size, size))
-        for idx in range(size):
-            cmap[idx, np.fromiter(lengths[idx].keys(), dtype=int)] = np.fromiter(
-                lengths[idx].values(), dtype=int)
-        self._dist_matrix = cmap
+        self._dist_matrix = _distance_matrix(max(self.graph.nodes) + 1,
+                                             tuple(sorted(self.graph.edges)))
 
     def distance(self, physical_qubit1, physical_qubit2):
         """Returns the undirected distance between physical_qubit1 and physical_qubit2.
@@ -170,12 +190,12 @@ class CouplingMap:
         Raises:
             CouplingError: if the qubits do not exist in the CouplingMap
         """
-        if physical_qubit1 not in self.physical_qubits:
+        if physical_qubit1 not in self.graph:
             raise CouplingError("%s not in coupling graph" % (physical_qubit1,))
-        if physical_qubit2 not in self.physical_qubits:
+        if physical_qubit2 not in self.graph:
             raise CouplingError("%s not in coupling graph" % (physical_qubit2,))
         if self._dist_matrix is None:
-            self._compute_distance_matrix()
+            self.compute_distance_matrix()
         return int(self._dist_matrix[physical_qubit1, physical_qubit2])
 
     def shortest_undirected_path(self, physical_qubit1, physical_qubit2):
@@ -211,12 +231,10 @@ class CouplingMap:
         """
         Convert uni-directional edges into bi-directional.
         """
-        edges = self.get_edges()
-        for src, dest in edges:
+        edges = set(self.get_edges())
+        for src, dest in self.get_edges():
             if (dest, src) not in edges:
                 self.add_edge(dest, src)
-        self._dist_matrix = None  # invalidate
-        self._is_symmetric = None  # invalidate
 
     def _check_symmetry(self):
         """
@@ -364,3 +382,24 @@ class CouplingMap:
         png = dot.create_png(prog='neato')
 
         return Image.open(io.BytesIO(png))
+
+
+@lru_cache(maxsize=64)
+def _distance_matrix(num_qubits, edges):
+    """Return the read-only matrix of the undirected distances between qubits.
+
+    Args:
+        num_qubits (int): the size of the matrix, one more than the largest
+            physical qubit.
+        edges (tuple): the edges of the coupling graph, as pairs of physical qubits.
+
+    Returns:
+        numpy.ndarray: the distances, ``inf`` between qubits which are not
+        connected.
+    """
+    edges = np.asarray(edges, dtype=int).reshape(-1, 2)
+    adjacency = sp.coo_matrix((np.ones(len(edges)), (edges[:, 0], edges[:, 1])),
+                              shape=(num_qubits, num_qubits)).tocsr()
+    distances = cs.shortest_path(adjacency, directed=False, unweighted=True)
+    distances.setflags(write=False)
+    return distances
@@ -109,6 +109,7 @@ Additional Passes
    RemoveFinalMeasurements
    DAGFixedPoint
    FixedPoint
+   TrackModifiedQubits
 """
 
 # layout selection (placement)
@@ -172,3 +173,4 @@ from .utils import RemoveFinalMeasurements
 from .utils import MergeAdjacentBarriers
 from .utils import DAGFixedPoint
 from .utils import FixedPoint
+from .utils import TrackModifiedQubits
@@ -14,6 +14,8 @@
 
 import time
 import logging
+import copy
+import weakref
 
 from heapq import heappush, heappop
 from itertools import zip_longest
@@ -30,6 +32,15 @@ from qiskit.transpiler.exceptions import TranspilerError
 
 logger = logging.getLogger(__name__)
 
+# Basis search results and composed replacement rules for each equivalence
+# library, with the version of the library they were computed from. They
+# depend only on the library, the source and the target basis, so they can be
+# reused across circuits and pass instances.
+_TRANSLATION_CACHE = weakref.WeakKeyDictionary()
+
+# Maximum number of (source basis, target basis) entries cached per library.
+_TRANSLATION_CACHE_SIZE = 128
+
 
 class BasisTranslator(TransformationPass):
     """Translates gates to a target basis by searching for a set of translations
@@ -85,36 +96,30 @@ class BasisTranslator(TransformationPass):
         basic_instrs = ['measure', 'reset', 'barrier', 'snapshot']
 
         target_basis = set(self._target_basis).union(basic_instrs)
-        source_basis = {(node.op.name, node.op.num_qubits)
-                        for node in dag.op_nodes()}
+        num_params = {(node.op.name, node.op.num_qubits): len(node.op.params)
+                      for node in dag.op_nodes()}
+        source_basis = set(num_params)
 
         logger.info('Begin BasisTranslator from source basis %s to target '
                     'basis %s.', source_basis, target_basis)
 
-        # Search for a path from source to target basis.
+        cache = _get_translation_cache(self._equiv_lib)
+        cache_key = (frozenset(num_params.items()), frozenset(target_basis))
+        if cache_key in cache:
+            logger.info('Basis translation rules found in cache.')
+            instr_map = cache[cache_key]
+        else:
+            instr_map = cache[cache_key] = self._compose_rules(source_basis, target_basis, dag)
 
-        search_start_time = time.time()
-        basis_transforms = _basis_search(self._equiv_lib, source_basis,
-                                         target_basis, _basis_heuristic)
-        search_end_time = time.time()
-        logger.info('Basis translation path search completed in %.3fs.',
-                    search_end_time - search_start_time)
+            if len(cache) > _TRANSLATION_CACHE_SIZE:
+                del cache[next(iter(cache))]
 
-        if basis_transforms is None:
+        if instr_map is None:
             raise TranspilerError(
                 'Unable to map source basis {} to target basis {} '
                 'over library {}.'.format(
                     source_basis, target_basis, self._equiv_lib))
 
-        # Compose found path into a set of instruction substitution rules.
-
-        compose_start_time = time.time()
-        instr_map = _compose_transforms(basis_transforms, source_basis, dag)
-
-        compose_end_time = time.time()
-        logger.info('Basis translation paths composed in %.3fs.',
-                    compose_end_time - compose_start_time)
-
         # Replace source instructions with target translations.
 
         replace_start_time = time.time()
@@ -123,7 +128,8 @@ class BasisTranslator(TransformationPass):
                 continue
 
             if (node.op.name, node.op.num_qubits) in instr_map:
-                target_params, target_dag = instr_map[node.op.name, node.op.num_qubits]
+                target_params, target_dag, target_circuit = instr_map[node.op.name,
+                                                                      node.op.num_qubits]
 
                 if len(node.op.params) != len(target_params):
                     raise TranspilerError(
@@ -133,23 +139,28 @@ class BasisTranslator(TransformationPass):
                             target_params, target_dag))
 
                 if node.op.params:
-                    # Convert target to circ and back to assign_parameters, since
-                    # DAGCircuits won't have a ParameterTable.
-                    from qiskit.converters import dag_to_circuit, circuit_to_dag
-                    target_circuit = dag_to_circuit(target_dag)
-
-                    target_circuit.assign_parameters(
-                        dict(zip_longest(target_params, node.op.params)),
-                        inplace=True)
-
-                    bound_target_dag = circuit_to_dag(target_circuit)
+                    # Assign the parameters on the target circuit, and convert
+                    # it back to a DAG, since DAGCircuits won't have a
+                    # ParameterTable.
+                    from qiskit.converters import circuit_to_dag
+                    bound_target_circuit = target_circuit.assign_parameters(
+                        dict(zip_longest(target_params, node.op.params)))
+
+                    bound_target_dag = circuit_to_dag(bound_target_circuit)
                 else:
                     bound_target_dag = target_dag
 
                 if (len(bound_target_dag.op_nodes()) == 1
                         and len(bound_target_dag.op_nodes()[0].qargs) == len(node.qargs)):
-                    dag.substitute_node(node, bound_target_dag.op_nodes()[0].op, inplace=True)
+                    target_op = bound_target_dag.op_nodes()[0].op
+                    if not node.op.params:
+                        # The cached rule is shared across runs, so each output
+                        # DAG gets its own copy of the ops.
+                        target_op = target_op.copy()
+                    dag.substitute_node(node, target_op, inplace=True)
                 else:
+                    if not node.op.params:
+                        bound_target_dag = copy.deepcopy(target_dag)
                     dag.substitute_node_with_dag(node, bound_target_dag)
             else:
                 raise TranspilerError('BasisTranslator did not map {}.'.format(node.name))
@@ -160,6 +171,51 @@ class BasisTranslator(TransformationPass):
 
         return dag
 
+    def _compose_rules(self, source_basis, target_basis, dag):
+        """Search for a path from source to target basis and compose it into
+        instruction substitution rules.
+
+        Returns:
+            Optional[Dict[Tuple[gate_name, gate_num_qubits], Tuple(params, dag, circuit)]]:
+                The replacement rule of each gate in source_basis, with its
+                replacement as a QuantumCircuit as well if it is parameterized.
+                Returns None if no path to the target basis was found.
+        """
+        search_start_time = time.time()
+        basis_transforms = _basis_search(self._equiv_lib, source_basis,
+                                         target_basis, _basis_heuristic)
+        search_end_time = time.time()
+        logger.info('Basis translation path search completed in %.3fs.',
+                    search_end_time - search_start_time)
+
+        if basis_transforms is None:
+            return None
+
+        compose_start_time = time.time()
+        instr_map = _compose_transforms(basis_transforms, source_basis, dag)
+
+        from qiskit.converters import dag_to_circuit
+        rules = {key: (params, target_dag, dag_to_circuit(target_dag) if params else None)
+                 for key, (params, target_dag) in instr_map.items()}
+
+        compose_end_time = time.time()
+        logger.info('Basis translation paths composed in %.3fs.',
+                    compose_end_time - compose_start_time)
+
+        return rules
+
+
+def _get_translation_cache(equiv_lib):
+    """Return the cache of translation rules of equiv_lib, emptied if the
+    library was changed since they were computed."""
+    version = equiv_lib._get_version()
+    cached_version, cache = _TRANSLATION_CACHE.get(equiv_lib, (None, None))
+    if cached_version != version:
+        cache = {}
+        _TRANSLATION_CACHE[equiv_lib] = (version, cache)
+
+    return cache
+
 
 def _basis_heuristic(basis, target):
     """Simple metric to gauge distance between two bases as the number of
@@ -79,30 +79,20 @@ class DenseLayout(AnalysisPass):
             cols = []
             cx_err = []
 
+            gate_errors = self.backend_prop.gate_property_index('gate_error')
             for edge in self.coupling_map.get_edges():
-                for gate in self.backend_prop.gates:
-                    if gate.qubits == edge:
-                        rows.append(edge[0])
-                        cols.append(edge[1])
-                        cx_err.append(gate.parameters[0].value)
-                        break
-                else:
-                    continue
+                error = gate_errors.get(('cx', edge))
+                if error is not None:
+                    rows.append(edge[0])
+                    cols.append(edge[1])
+                    cx_err.append(error)
 
             self.cx_mat = sp.coo_matrix((cx_err, (rows, cols)),
                                         shape=(device_qubits,
                                                device_qubits)).tocsr()
 
             # Set measurement array
-            meas_err = []
-            for qubit_data in self.backend_prop.qubits:
-                for item in qubit_data:
-                    if item.name == 'readout_error':
-                        meas_err.append(item.value)
-                        break
-                else:
-                    continue
-            self.meas_arr = np.asarray(meas_err)
+            self.meas_arr = self.backend_prop.qubit_property_array('readout_error')
 
         best_sub = self._best_subset(num_dag_qubits)
         layout = Layout()
@@ -144,28 +134,29 @@ class DenseLayout(AnalysisPass):
 
             connection_count = 0
             sub_graph = []
+            sub_qubits = set(bfs[:num_qubits])
             for i in range(num_qubits):
                 node_idx = bfs[i]
                 for j in range(sp_cmap.indptr[node_idx],
                                sp_cmap.indptr[node_idx + 1]):
                     node = sp_cmap.indices[j]
-                    for counter in range(num_qubits):
-                        if node == bfs[counter]:
-                            connection_count += 1
-                            sub_graph.append([node_idx, node])
-                            break
+                    if node in sub_qubits:
+                        connection_count += 1
+                        sub_graph.append([node_idx, node])
 
             if self.backend_prop:
                 curr_error = 0
-                # compute meas error for subset
-                avg_meas_err = np.mean(self.meas_arr)
-                meas_diff = np.mean(
+                # compute meas error for subset, ignoring the qubits without
+                # readout error
+                avg_meas_err = np.nanmean(self.meas_arr)
+                meas_diff = np.nanmean(
                     self.meas_arr[bfs[0:num_qubits]])-avg_meas_err
                 if meas_diff > 0:
                     curr_error += self.num_meas*meas_diff
 
-                cx_err = np.mean([self.cx_mat[edge[0], edge[1]]
-                                  for edge in sub_graph])
+                sub_edges = np.asarray(sub_graph).reshape(-1, 2)
+                cx_err = np.mean(np.asarray(
+                    self.cx_mat[sub_edges[:, 0], sub_edges[:, 1]]).ravel())
                 if self.coupling_map.is_symmetric:
                     cx_err /= 2
                 curr_error += self.num_cx*cx_err
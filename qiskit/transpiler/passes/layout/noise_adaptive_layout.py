@@ -13,7 +13,9 @@
 """Choose a noise-adaptive Layout based on current calibration data for the backend."""
 
 import math
+
 import networkx as nx
+import numpy as np
 
 from qiskit.transpiler.layout import Layout
 from qiskit.transpiler.basepasses import AnalysisPass
@@ -95,13 +97,10 @@ class NoiseAdaptiveLayout(AnalysisPass):
                 self.swap_graph.add_edge(ginfo.qubits[1], ginfo.qubits[0], weight=swap_cost)
                 self.cx_reliability[(ginfo.qubits[0], ginfo.qubits[1])] = g_reliab
                 self.gate_list.append((ginfo.qubits[0], ginfo.qubits[1]))
-        idx = 0
-        for q in backend_prop.qubits:
-            for nduv in q:
-                if nduv.name == 'readout_error':
-                    self.readout_reliability[idx] = 1.0 - nduv.value
-                    self.available_hw_qubits.append(idx)
-            idx += 1
+        readout_errors = backend_prop.qubit_property_array('readout_error')
+        for idx in np.flatnonzero(~np.isnan(readout_errors)).tolist():
+            self.readout_reliability[idx] = 1.0 - readout_errors[idx]
+            self.available_hw_qubits.append(idx)
         for edge in self.cx_reliability:
             self.gate_reliability[edge] = self.cx_reliability[edge] * \
                                           self.readout_reliability[edge[0]] * \
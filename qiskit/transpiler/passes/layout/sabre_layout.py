@@ -22,10 +22,12 @@ from qiskit.transpiler.passes.layout.full_ancilla_allocation import FullAncillaA
 from qiskit.transpiler.passes.layout.enlarge_with_ancilla import EnlargeWithAncilla
 from qiskit.transpiler.passes.layout.apply_layout import ApplyLayout
 from qiskit.transpiler.passes.routing import SabreSwap
+from qiskit.transpiler.passes.routing.sabre_swap import _routing_cost
 from qiskit.transpiler.passmanager import PassManager
 from qiskit.transpiler.layout import Layout
 from qiskit.transpiler.basepasses import AnalysisPass
 from qiskit.transpiler.exceptions import TranspilerError
+from qiskit.tools.parallel import parallel_map
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +52,7 @@ class SabreLayout(AnalysisPass):
     """
 
     def __init__(self, coupling_map, routing_pass=None, seed=None,
-                 max_iterations=3):
+                 max_iterations=3, trials=1, cost_function=None):
         """SabreLayout initializer.
 
         Args:
@@ -58,12 +60,22 @@ class SabreLayout(AnalysisPass):
             routing_pass (BasePass): the routing pass to use while iterating.
             seed (int): seed for setting a random first trial layout.
             max_iterations (int): number of forward-backward iterations.
+            trials (int): number of random first layouts, with different seeds,
+                to iterate from in parallel processes. The layout whose
+                forward routing has the lowest cost is kept. The first trial
+                uses ``seed``, the seeds of the others are derived from it.
+            cost_function (callable): function of the routed ``QuantumCircuit``
+                of a layout returning a comparable cost. Defaults to the number
+                of swaps, then the depth. It is only evaluated in the calling
+                process, so it does not need to be picklable.
         """
         super().__init__()
         self.coupling_map = coupling_map
         self.routing_pass = routing_pass
         self.seed = seed
         self.max_iterations = max_iterations
+        self.trials = trials
+        self.cost_function = cost_function
 
     def run(self, dag):
         """Run the SabreLayout pass on `dag`.
@@ -77,22 +89,60 @@ class SabreLayout(AnalysisPass):
         if len(dag.qubits) > self.coupling_map.size():
             raise TranspilerError('More virtual qubits exist than physical.')
 
-        # Choose a random initial_layout.
+        if self.trials < 1:
+            raise TranspilerError('Sabre layout needs at least one trial, got %s.' % self.trials)
+
         if self.seed is None:
             self.seed = np.random.randint(0, np.iinfo(np.int32).max)
-        rng = np.random.default_rng(self.seed)
+
+        # The trials only read the circuit, it can share the instructions of the DAG.
+        circ = dag_to_circuit(dag, copy_operations=False)
+        if self.trials == 1:
+            initial_layout, _ = self._layout_trial(circ, self.seed)
+        else:
+            # Compute the distance matrix once, the trials share it through
+            # the coupling map sent to their processes.
+            self.coupling_map.make_symmetric()
+            self.coupling_map.compute_distance_matrix()
+            seeds = [self.seed] + [int(seed) for seed in np.random.SeedSequence(
+                self.seed).generate_state(self.trials - 1)]
+            results = parallel_map(_layout_trial, seeds,
+                                   task_args=(circ, self.coupling_map, self.routing_pass,
+                                              self.max_iterations))
+            cost_function = self.cost_function or _routing_cost
+            costs = [cost_function(routed_circuit) for _, routed_circuit in results]
+            best = costs.index(min(costs))
+            logger.info('Sabre layout trial costs: %s, keeping trial %d', costs, best)
+            initial_layout = results[best][0]
+
+        self.property_set['layout'] = initial_layout
+
+    def _layout_trial(self, circ, seed, route_layout=False):
+        """Iterate forward-backward routings from a random layout drawn with ``seed``.
+
+        Args:
+            circ (QuantumCircuit): the circuit to find a layout for.
+            seed (int): seed for the random first layout and the routing pass.
+            route_layout (bool): if ``True``, also route ``circ`` from the
+                resulting layout to evaluate it.
+
+        Returns:
+            tuple: the Layout, and the routed QuantumCircuit if ``route_layout``
+            is ``True``, ``None`` otherwise.
+        """
+        # Choose a random initial_layout.
+        rng = np.random.default_rng(seed)
 
         physical_qubits = rng.choice(self.coupling_map.size(),
-                                     len(dag.qubits), replace=False)
+                                     len(circ.qubits), replace=False)
         physical_qubits = rng.permutation(physical_qubits)
-        initial_layout = Layout({q: dag.qubits[i]
+        initial_layout = Layout({q: circ.qubits[i]
                                  for i, q in enumerate(physical_qubits)})
 
         if self.routing_pass is None:
-            self.routing_pass = SabreSwap(self.coupling_map, 'decay', seed=self.seed)
+            self.routing_pass = SabreSwap(self.coupling_map, 'decay', seed=seed)
 
         # Do forward-backward iterations.
-        circ = dag_to_circuit(dag)
         for i in range(self.max_iterations):
             for _ in ('forward', 'backward'):
                 pm = self._layout_and_route_passmanager(initial_layout)
@@ -112,7 +162,10 @@ class SabreLayout(AnalysisPass):
             logger.info('new initial layout')
             logger.info(initial_layout)
 
-        self.property_set['layout'] = initial_layout
+        routed_circuit = None
+        if route_layout:
+            routed_circuit = self._layout_and_route_passmanager(initial_layout).run(circ)
+        return initial_layout, routed_circuit
 
     def _layout_and_route_passmanager(self, initial_layout):
         """Return a passmanager for a full layout and routing.
@@ -143,3 +196,10 @@ class SabreLayout(AnalysisPass):
         final_layout = {v: pass_final_layout[qubit_map[v]]
                         for v, _ in initial_layout.get_virtual_bits().items()}
         return Layout(final_layout)
+
+
+def _layout_trial(seed, circ, coupling_map, routing_pass, max_iterations):
+    """Run a single seeded :class:`SabreLayout` trial, in a worker process."""
+    layout_pass = SabreLayout(coupling_map, routing_pass, seed=seed,
+                              max_iterations=max_iterations)
+    return layout_pass._layout_trial(circ, seed, route_layout=True)
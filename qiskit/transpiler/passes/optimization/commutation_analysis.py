@@ -13,13 +13,38 @@
 """Analysis pass to find commutation relations between DAG nodes."""
 
 from collections import defaultdict
+from numbers import Number
 import numpy as np
+from qiskit.circuit import ParameterExpression
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler.basepasses import AnalysisPass
 from qiskit.quantum_info.operators import Operator
 
 _CUTOFF_PRECISION = 1E-10
 
+# Commutation relations between standard gates computed from their matrices,
+# shared by all the CommutationAnalysis passes of the process. Keyed by the
+# name, the numeric parameters, the control state and the qubits, relative to
+# those of both gates, of each gate.
+_COMMUTATION_CACHE = {}
+
+# Maximum number of commutation relations kept in _COMMUTATION_CACHE.
+_COMMUTATION_CACHE_SIZE = 100000
+
+# Standard gates which are diagonal in a product basis, made of the eigenbasis
+# of X, Y or Z on each of their qubits. For each gate name, the basis of its
+# last qubits and the basis of the qubits before them, e.g. the controls.
+# Two such gates commute if they use the same basis on all the qubits they
+# share, since they are then both diagonal in a common basis.
+_DIAGONAL_BASES = {
+    **{name: ('z', '') for name in ['id', 'z', 's', 'sdg', 't', 'tdg', 'rz', 'u1', 'p',
+                                    'cz', 'cu1', 'cp', 'crz', 'rzz', 'mcu1', 'mcphase']},
+    **{name: ('x', '') for name in ['x', 'rx', 'sx', 'sxdg', 'rxx', 'ms']},
+    **{name: ('y', '') for name in ['y', 'ry', 'ryy']},
+    **{name: ('z', 'x') for name in ['cx', 'ccx', 'mcx', 'mcx_gray', 'crx', 'csx', 'rzx']},
+    **{name: ('z', 'y') for name in ['cy', 'cry']},
+}
+
 
 class CommutationAnalysis(AnalysisPass):
     """Analysis pass to find commutation relations between DAG nodes.
@@ -32,9 +57,11 @@ class CommutationAnalysis(AnalysisPass):
     A rule-based analysis would be potentially faster, but more limited.
     """
 
-    def __init__(self):
-        super().__init__()
-        self.cache = {}
+    @property
+    def cache(self):
+        """The commutation relations computed from gate matrices, shared by
+        all the instances of the pass."""
+        return _COMMUTATION_CACHE
 
     def run(self, dag):
         """Run the CommutationAnalysis pass on `dag`.
@@ -45,6 +72,10 @@ class CommutationAnalysis(AnalysisPass):
         # Initiate the commutation set
         self.property_set['commutation_set'] = defaultdict(list)
 
+        # Relations involving other gates than standard ones, whose name does
+        # not identify their matrix, are only cached for this run.
+        local_cache = {}
+
         # Build a dictionary to keep track of the gates on each qubit
         # The key with format (wire_name) will store the lists of commutation sets
         # The key with format (node, wire_name) will store the index of the commutation set
@@ -77,7 +108,7 @@ class CommutationAnalysis(AnalysisPass):
                     prev_gate = current_comm_set[-1][-1]
                     does_commute = False
                     try:
-                        does_commute = _commute(current_gate, prev_gate, self.cache)
+                        does_commute = _commute(current_gate, prev_gate, local_cache)
                     except TranspilerError:
                         pass
                     if does_commute:
@@ -90,7 +121,7 @@ class CommutationAnalysis(AnalysisPass):
                 self.property_set['commutation_set'][(current_gate, wire_name)] = temp_len - 1
 
 
-def _commute(node1, node2, cache):
+def _commute(node1, node2, local_cache):
 
     if node1.type != "op" or node2.type != "op":
         return False
@@ -105,27 +136,87 @@ def _commute(node1, node2, cache):
     if node1.op.is_parameterized() or node2.op.is_parameterized():
         return False
 
-    qarg = list(set(node1.qargs + node2.qargs))
-    qbit_num = len(qarg)
+    # Number the qubits in order of appearance, so that the key of the
+    # relation does not depend on the qubits the gates act on.
+    qarg = list(dict.fromkeys(node1.qargs + node2.qargs))
 
-    qarg1 = [qarg.index(q) for q in node1.qargs]
-    qarg2 = [qarg.index(q) for q in node2.qargs]
+    qarg1 = tuple(qarg.index(q) for q in node1.qargs)
+    qarg2 = tuple(qarg.index(q) for q in node2.qargs)
 
-    id_op = Operator(np.eye(2 ** qbit_num))
+    if _commute_by_bases(node1.op, qarg1, node2.op, qarg2):
+        return True
 
-    node1_key = (node1.op.name, str(node1.op.params), str(qarg1))
-    node2_key = (node2.op.name, str(node2.op.params), str(qarg2))
-    if (node1_key, node2_key) in cache:
-        op12 = cache[(node1_key, node2_key)]
+    if _is_standard_gate(node1.op) and _is_standard_gate(node2.op):
+        cache = _COMMUTATION_CACHE
     else:
-        op12 = id_op.compose(node1.op, qargs=qarg1).compose(node2.op, qargs=qarg2)
-        cache[(node1_key, node2_key)] = op12
-    if (node2_key, node1_key) in cache:
-        op21 = cache[(node2_key, node1_key)]
-    else:
-        op21 = id_op.compose(node2.op, qargs=qarg2).compose(node1.op, qargs=qarg1)
-        cache[(node2_key, node1_key)] = op21
+        cache = local_cache
+    return _cached_commute_by_matrix(node1.op, qarg1, node2.op, qarg2, len(qarg), cache)
+
+
+def _is_standard_gate(op):
+    """Return True if op is a gate of the standard library, whose name
+    identifies its matrix up to its parameters."""
+    return type(op).__module__.startswith('qiskit.circuit.library.standard_gates')
+
+
+def _diagonal_bases(op):
+    """Return the basis of each qubit of a product basis op is diagonal in,
+    or None if it is not a known gate."""
+    if op.name not in _DIAGONAL_BASES or not _is_standard_gate(op):
+        return None
+
+    fill, last = _DIAGONAL_BASES[op.name]
+    return fill * (op.num_qubits - len(last)) + last
+
+
+def _commute_by_bases(op1, qarg1, op2, qarg2):
+    """Return True if op1 and op2 are diagonal in a common product basis,
+    which implies they commute, without computing their matrices."""
+    bases1 = _diagonal_bases(op1)
+    bases2 = _diagonal_bases(op2)
+    if bases1 is None or bases2 is None:
+        return False
+
+    qubit_bases1 = dict(zip(qarg1, bases1))
+    return all(qubit_bases1.get(qubit, basis) == basis
+               for qubit, basis in zip(qarg2, bases2))
+
+
+def _cached_commute_by_matrix(op1, qarg1, op2, qarg2, qbit_num, cache):
+    params1 = _params_key(op1.params)
+    params2 = _params_key(op2.params)
+    if params1 is None or params2 is None:
+        return _commute_by_matrix(op1, qarg1, op2, qarg2, qbit_num)
+
+    key = ((op1.name, params1, getattr(op1, 'ctrl_state', None), qarg1),
+           (op2.name, params2, getattr(op2, 'ctrl_state', None), qarg2))
+    if key not in cache:
+        cache[key] = _commute_by_matrix(op1, qarg1, op2, qarg2, qbit_num)
+
+        if len(cache) > _COMMUTATION_CACHE_SIZE:
+            del cache[next(iter(cache))]
+
+    return cache[key]
+
+
+def _commute_by_matrix(op1, qarg1, op2, qarg2, qbit_num):
+    id_op = Operator(np.eye(2 ** qbit_num))
+
+    op12 = id_op.compose(op1, qargs=list(qarg1)).compose(op2, qargs=list(qarg2))
+    op21 = id_op.compose(op2, qargs=list(qarg2)).compose(op1, qargs=list(qarg1))
+
+    return op12 == op21
+
 
-    if_commute = (op12 == op21)
+def _params_key(params):
+    """Return a hashable key for numeric gate params, or None if they are not
+    all numbers."""
+    key = []
+    for param in params:
+        if isinstance(param, ParameterExpression):
+            param = float(param)
+        elif not isinstance(param, (Number, str)):
+            return None
+        key.append(param)
 
-    return if_commute
+    return tuple(key)
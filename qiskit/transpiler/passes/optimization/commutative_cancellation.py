@@ -19,6 +19,7 @@ from qiskit.circuit.quantumregister import QuantumRegister
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.passes.optimization.commutation_analysis import CommutationAnalysis
+from qiskit.transpiler.passes.utils.track_modified_qubits import TrackModifiedQubits
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.circuit.library.standard_gates.u1 import U1Gate
 from qiskit.circuit.library.standard_gates.rx import RXGate
@@ -42,6 +43,9 @@ class CommutativeCancellation(TransformationPass):
     def run(self, dag):
         """Run the CommutativeCancellation pass on `dag`.
 
+        If ``property_set['dirty_qubits']`` is set, only the gates acting on
+        these qubits are cancelled.
+
         Args:
             dag (DAGCircuit): the DAG to be optimized.
 
@@ -65,6 +69,7 @@ class CommutativeCancellation(TransformationPass):
         #    sec_commutation_set_id), the value is the list gates that share the same gate type,
         #    qubits and commutation sets.
 
+        dirty_qubits = self.property_set['dirty_qubits']
         for wire in dag.wires:
             wire_name = "{}[{}]".format(str(wire.register.name), str(wire.index))
             wire_commutation_set = self.property_set['commutation_set'][wire_name]
@@ -73,6 +78,8 @@ class CommutativeCancellation(TransformationPass):
                 if com_set[0].type in ['in', 'out']:
                     continue
                 for node in com_set:
+                    if dirty_qubits is not None and dirty_qubits.isdisjoint(node.qargs):
+                        continue
                     num_qargs = len(node.qargs)
                     if num_qargs == 1 and node.name in q_gate_list:
                         cancellation_sets[(node.name, wire_name, com_set_idx)].append(node)
@@ -95,9 +102,11 @@ class CommutativeCancellation(TransformationPass):
                 gates_to_cancel = cancellation_sets[cancel_set_key]
                 for c_node in gates_to_cancel[:(set_len // 2) * 2]:
                     dag.remove_op_node(c_node)
+                    TrackModifiedQubits.mark_modified(self.property_set, c_node.qargs)
 
             elif set_len > 1 and cancel_set_key[0] in ['z_rotation', 'x_rotation']:
                 run = cancellation_sets[cancel_set_key]
+                TrackModifiedQubits.mark_modified(self.property_set, run[0].qargs)
                 run_qarg = run[0].qargs[0]
                 total_angle = 0.0  # lambda
                 for current_node in run:
@@ -14,6 +14,9 @@
 
 """Replace each block of consecutive gates by a single Unitary node."""
 
+from numbers import Number
+
+import numpy as np
 
 from qiskit.circuit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.dagcircuit import DAGCircuit
@@ -24,6 +27,18 @@ from qiskit.circuit.library.standard_gates import CXGate
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler.passes.synthesis import unitary_synthesis
+from qiskit.transpiler.passes.utils.track_modified_qubits import TrackModifiedQubits
+
+# Matrices of standard gates, keyed by _gate_key, shared by all the
+# ConsolidateBlocks passes of the process.
+_GATE_MATRICES = {}
+
+# Number of basis gates needed to synthesize a block, keyed by the decomposer
+# and by the _gate_key and block qubits of each gate of the block.
+_NUM_BASIS_GATES = {}
+
+# Maximum number of entries kept in each of the caches above.
+_CACHE_SIZE = 10000
 
 
 class ConsolidateBlocks(TransformationPass):
@@ -69,7 +84,8 @@ class ConsolidateBlocks(TransformationPass):
         """Run the ConsolidateBlocks pass on `dag`.
 
         Iterate over each block and replace it with an equivalent Unitary
-        on the same wires.
+        on the same wires. If ``property_set['dirty_qubits']`` is set, the
+        blocks acting only on other qubits are kept as they are.
         """
 
         if self.decomposer is None:
@@ -115,12 +131,18 @@ class ConsolidateBlocks(TransformationPass):
 
         # create the dag from the updated list of blocks
         basis_gate_name = self.decomposer.gate.name
+        dirty_qubits = self.property_set['dirty_qubits']
         for block in blocks:
             if len(block) == 1 and (block[0].name != basis_gate_name
                                     or block[0].op.is_parameterized()):
                 # an intermediate node that was added into the overall list
                 new_dag.apply_operation_back(block[0].op, block[0].qargs,
                                              block[0].cargs)
+            elif dirty_qubits is not None and all(dirty_qubits.isdisjoint(nd.qargs)
+                                                  for nd in block):
+                # the block was already consolidated, and was not changed since
+                for nd in block:
+                    new_dag.apply_operation_back(nd.op, nd.qargs, nd.cargs)
             else:
                 # find the qubits involved in this block
                 block_qargs = set()
@@ -129,41 +151,80 @@ class ConsolidateBlocks(TransformationPass):
                     block_qargs |= set(nd.qargs)
                     if nd.condition:
                         block_cargs |= set(nd.condition[0])
-                # convert block to a sub-circuit, then simulate unitary and add
-                q = QuantumRegister(len(block_qargs))
-                # if condition in node, add clbits to circuit
-                if len(block_cargs) > 0:
-                    c = ClassicalRegister(len(block_cargs))
-                    subcirc = QuantumCircuit(q, c)
-                else:
-                    subcirc = QuantumCircuit(q)
                 block_index_map = self._block_qargs_to_indices(block_qargs,
                                                                global_index_map)
-                basis_count = 0
-                for nd in block:
-                    if nd.op.name == basis_gate_name:
-                        basis_count += 1
-                    subcirc.append(nd.op, [q[block_index_map[i]] for i in nd.qargs])
-                unitary = UnitaryGate(Operator(subcirc))  # simulates the circuit
+                basis_count = sum(1 for nd in block if nd.op.name == basis_gate_name)
+                unitary = UnitaryGate(self._block_matrix(block, block_qargs, block_cargs,
+                                                         block_index_map))
 
                 max_2q_depth = 20  # If depth > 20, there will be 1q gates to consolidate.
                 if (  # pylint: disable=too-many-boolean-expressions
                         self.force_consolidate
                         or unitary.num_qubits > 2
-                        or self.decomposer.num_basis_gates(unitary) < basis_count
-                        or len(subcirc) > max_2q_depth
+                        or len(block) > max_2q_depth
                         or (self.basis_gates is not None
-                            and not set(subcirc.count_ops()).issubset(self.basis_gates))
+                            and not {nd.op.name for nd in block}.issubset(self.basis_gates))
+                        or self._num_basis_gates(block, block_index_map, unitary) < basis_count
                 ):
                     new_dag.apply_operation_back(
-                        UnitaryGate(unitary),
+                        unitary,
                         sorted(block_qargs, key=lambda x: block_index_map[x]))
+                    TrackModifiedQubits.mark_modified(self.property_set, block_qargs)
                 else:
                     for nd in block:
                         new_dag.apply_operation_back(nd.op, nd.qargs, nd.cargs)
 
         return new_dag
 
+    def _block_matrix(self, block, block_qargs, block_cargs, block_index_map):
+        """Return the unitary matrix of a block.
+
+        Blocks of at most two qubits, without conditions, are composed
+        directly from the matrices of their gates, the others are simulated as
+        a sub-circuit. Both compose the same matrices in the same order, so
+        they give the same unitary.
+        """
+        num_qubits = len(block_qargs)
+        if num_qubits <= 2 and not block_cargs:
+            operator = Operator(np.eye(2 ** num_qubits))
+            for nd in block:
+                gate_matrix = _gate_matrix(nd.op)
+                if gate_matrix is None:
+                    break
+                operator = operator.compose(
+                    gate_matrix, qargs=[block_index_map[q] for q in nd.qargs])
+            else:
+                return operator.data
+
+        # convert block to a sub-circuit, then simulate unitary
+        q = QuantumRegister(num_qubits)
+        # if condition in node, add clbits to circuit
+        if len(block_cargs) > 0:
+            c = ClassicalRegister(len(block_cargs))
+            subcirc = QuantumCircuit(q, c)
+        else:
+            subcirc = QuantumCircuit(q)
+        for nd in block:
+            subcirc.append(nd.op, [q[block_index_map[i]] for i in nd.qargs])
+        return Operator(subcirc).data
+
+    def _num_basis_gates(self, block, block_index_map, unitary):
+        """Return the number of basis gates needed to synthesize a block, which
+        is memoized for blocks made of standard gates."""
+        key = (_gate_key(self.decomposer.gate), self.decomposer.basis_fidelity,
+               tuple((_gate_key(nd.op), tuple(block_index_map[q] for q in nd.qargs))
+                     for nd in block))
+        if key[0] is None or any(gate_key is None for gate_key, _ in key[2]):
+            return self.decomposer.num_basis_gates(unitary)
+
+        if key not in _NUM_BASIS_GATES:
+            _NUM_BASIS_GATES[key] = self.decomposer.num_basis_gates(unitary)
+
+            if len(_NUM_BASIS_GATES) > _CACHE_SIZE:
+                del _NUM_BASIS_GATES[next(iter(_NUM_BASIS_GATES))]
+
+        return _NUM_BASIS_GATES[key]
+
     def _block_qargs_to_indices(self, block_qargs, global_index_map):
         """Map each qubit in block_qargs to its wire position among the block's wires.
 
@@ -180,3 +241,32 @@ class ConsolidateBlocks(TransformationPass):
         block_positions = {q: ordered_block_indices.index(global_index_map[q])
                            for q in block_qargs}
         return block_positions
+
+
+def _gate_key(op):
+    """Return a hashable key identifying the matrix of a standard gate with
+    numeric parameters, or None for other instructions."""
+    if (not type(op).__module__.startswith('qiskit.circuit.library.standard_gates')
+            or not all(isinstance(param, Number) for param in op.params)):
+        return None
+
+    return (type(op), op.num_qubits, tuple(op.params), getattr(op, 'ctrl_state', None))
+
+
+def _gate_matrix(op):
+    """Return the matrix of a gate, as given by its ``to_matrix`` method, or
+    None if it has none. It is memoized for standard gates."""
+    key = _gate_key(op)
+    if key is None:
+        return Operator._instruction_to_matrix(op)
+
+    if key not in _GATE_MATRICES:
+        matrix = Operator._instruction_to_matrix(op)
+        if matrix is not None:
+            matrix.setflags(write=False)
+        _GATE_MATRICES[key] = matrix
+
+        if len(_GATE_MATRICES) > _CACHE_SIZE:
+            del _GATE_MATRICES[next(iter(_GATE_MATRICES))]
+
+    return _GATE_MATRICES[key]
@@ -22,6 +22,7 @@ from qiskit.circuit.library.standard_gates.u2 import U2Gate
 from qiskit.circuit.library.standard_gates.u3 import U3Gate
 from qiskit.circuit.gate import Gate
 from qiskit.transpiler.basepasses import TransformationPass
+from qiskit.transpiler.passes.utils.track_modified_qubits import TrackModifiedQubits
 from qiskit.quantum_info.operators import Quaternion
 
 _CHOP_THRESHOLD = 1e-15
@@ -46,6 +47,9 @@ class Optimize1qGates(TransformationPass):
     def run(self, dag):
         """Run the Optimize1qGates pass on `dag`.
 
+        If ``property_set['dirty_qubits']`` is set, only the chains of gates on
+        these qubits are optimized.
+
         Args:
             dag (DAGCircuit): the DAG to be optimized.
 
@@ -57,7 +61,11 @@ class Optimize1qGates(TransformationPass):
         """
         runs = dag.collect_runs(["u1", "u2", "u3"])
         runs = _split_runs_on_parameters(runs)
+        dirty_qubits = self.property_set['dirty_qubits']
         for run in runs:
+            if dirty_qubits is not None and run[0].qargs[0] not in dirty_qubits:
+                continue
+
             right_name = "u1"
             right_parameters = (0, 0, 0)  # (theta, phi, lambda)
 
@@ -206,6 +214,10 @@ class Optimize1qGates(TransformationPass):
                 else:
                     raise TranspilerError('It was not possible to use the basis %s' % self.basis)
 
+            if (len(run) > 1 or right_name == 'nop' or new_op.name != run[0].name
+                    or new_op.params != run[0].op.params):
+                TrackModifiedQubits.mark_modified(self.property_set, run[0].qargs)
+
             if right_name != 'nop':
                 dag.substitute_node(run[0], new_op, inplace=True)
 
@@ -15,19 +15,23 @@
 # that they have been altered from the originals.
 
 cimport cython
+from cython.parallel cimport prange
+from libcpp.vector cimport vector
 from libcpp.unordered_set cimport unordered_set as cset
 from .utils cimport NLayout, EdgeCollection
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef double compute_cost(double[:, ::1] dist, unsigned int * logic_to_phys,
-                          int[::1] gates, unsigned int num_gates) nogil:
+cdef double compute_cost(const double * dist, unsigned int stride,
+                         const unsigned int * logic_to_phys,
+                         const int * gates, unsigned int num_gates) nogil:
     """ Computes the cost (distance) of a logical to physical mapping.
     
     Args:
-        dist (ndarray): An array of doubles that specifies the distance.
+        dist (double *): A row-major array of doubles that specifies the distance.
+        stride (int): The length of the rows of dist.
         logic_to_phys (int *): Pointer to logical to physical array.
-        gates (ndarray): Array of ints giving gates in layer.
+        gates (int *): Array of ints giving gates in layer.
         num_gates (int): The number of gates (length of gates//2).
     
     Returns:
@@ -38,64 +42,72 @@ cdef double compute_cost(double[:, ::1] dist, unsigned int * logic_to_phys,
     for kk in range(num_gates):
         ii = logic_to_phys[gates[2*kk]]
         jj = logic_to_phys[gates[2*kk+1]]
-        cost += dist[ii,jj]
+        cost += dist[ii*stride+jj]
     return cost
 
 @cython.nonecheck(False)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef compute_random_scaling(double[:, ::1] scale, double[:, ::1] cdist2,
-                            double * rand, unsigned int num_qubits):
+cdef void compute_random_scaling(double * scale, const double * cdist2,
+                                 unsigned int cdist2_stride, const double * rand,
+                                 unsigned int num_qubits) nogil:
     """ Computes the symmetric random scaling (perturbation) matrix, 
     and places the values in the 'scale' array.
 
     Args:
-        scale (ndarray): An array of doubles where the values are to be stored.
-        cdist2 (ndarray): Array representing the coupling map distance squared.
+        scale (double *): A row-major num_qubits x num_qubits array of doubles
+                          where the values are to be stored.
+        cdist2 (double *): Row-major array representing the coupling map
+                           distance squared.
+        cdist2_stride (int): The length of the rows of cdist2.
         rand (double *): Array of rands of length num_qubits*(num_qubits+1)//2.
         num_qubits (int): Number of physical qubits.
     """
     cdef size_t ii, jj, idx=0
     for ii in range(num_qubits):
         for jj in range(ii):
-            scale[ii,jj] = rand[idx]*cdist2[ii,jj]
-            scale[jj,ii] = scale[ii,jj]
+            scale[ii*num_qubits+jj] = rand[idx]*cdist2[ii*cdist2_stride+jj]
+            scale[jj*num_qubits+ii] = scale[ii*num_qubits+jj]
             idx += 1
 
 
+cdef inline void swap_layout(vector[unsigned int] & logic_to_phys,
+                             vector[unsigned int] & phys_to_logic,
+                             unsigned int idx1, unsigned int idx2) nogil:
+    """ Swaps two physical qubits in a layout, like NLayout.swap.
+    """
+    cdef unsigned int temp1 = phys_to_logic[idx1]
+    cdef unsigned int temp2 = phys_to_logic[idx2]
+    phys_to_logic[idx1] = temp2
+    phys_to_logic[idx2] = temp1
+    logic_to_phys[phys_to_logic[idx1]] = idx1
+    logic_to_phys[phys_to_logic[idx2]] = idx2
+
+
 @cython.nonecheck(False)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
-               int[::1] gates, double[:, ::1] cdist2, double[:, ::1] cdist, 
-               int[::1] edges, double[:, ::1] scale, object rng):
-    """ A single iteration of the tchastic swap mapping routine.
+cdef unsigned int run_trial(unsigned int num_qubits,
+                            vector[unsigned int] & trial_l2p,
+                            vector[unsigned int] & trial_p2l,
+                            const cset[unsigned int] & input_qubit_set,
+                            const int * gates, unsigned int num_gates,
+                            const double * cdist2, const double * cdist,
+                            unsigned int cdist_stride,
+                            const int * edges, unsigned int num_edges,
+                            double * scale, const double * rand,
+                            vector[unsigned int] & opt_edges,
+                            double * dist_out) nogil:
+    """ Runs a single trial without the GIL.
 
-    Args:
-        num_qubits (int): The number of physical qubits.
-        int_layout (NLayout): The numeric (integer) representation of 
-                              the initial_layout.
-        int_qubit_subset (ndarray): Int ndarray listing qubits in set.
-        gates (ndarray): Int array with integers giving qubits on which
-                         two-qubits gates act on.
-        cdist2 (ndarray): Array of doubles that gives the square of the 
-                          distance graph.
-        cdist (ndarray): Array of doubles that gives the distance graph.
-        edges (ndarray): Int array of edges in coupling map.
-        scale (ndarray): A double array that holds the perturbed cdist2 array.
-        rng (default_rng): An instance of the NumPy default_rng.
+    The layout (``trial_l2p``, ``trial_p2l``) is updated in place to the
+    optimal layout found, the swaps are appended to ``opt_edges`` and the
+    final distance is written to ``dist_out``.
 
     Returns:
-        double: Best distance achieved in this trial.
-        EdgeCollection: Collection of optimal edges found.
-        NLayout: The optimal layout found.
         int: The number of depth steps required in mapping.
     """
-    cdef EdgeCollection opt_edges = EdgeCollection()
-    cdef NLayout optimal_layout, new_layout, trial_layout = int_layout.copy()
-    
-    cdef unsigned int num_gates = gates.shape[0]//2
-    cdef unsigned int num_edges = edges.shape[0]//2
+    cdef vector[unsigned int] new_l2p, new_p2l, optimal_l2p, optimal_p2l
     
     cdef unsigned int need_copy, cost_reduced
     cdef unsigned int depth_step = 1
@@ -106,19 +118,10 @@ def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
     cdef unsigned int optimal_start, optimal_end, optimal_start_qubit, optimal_end_qubit
     
     cdef size_t idx
-    
-    # Compute randomized distance
-    cdef double[::1] rand = 1.0 + rng.normal(0.0, 1.0/num_qubits,
-                                             size=num_qubits*(num_qubits+1)//2)
-    
-    compute_random_scaling(scale, cdist2, &rand[0], num_qubits)
-    
-    # Convert int qubit array to c++ set
     cdef cset[unsigned int] qubit_set
-    cdef cset[unsigned int] input_qubit_set
     
-    for idx in range(<unsigned int>int_qubit_subset.shape[0]):
-        input_qubit_set.insert(int_qubit_subset[idx])
+    # Compute randomized distance
+    compute_random_scaling(scale, cdist2, cdist_stride, rand, num_qubits)
     
     # Loop over depths from 1 up to a maximum depth
     while depth_step < depth_max:
@@ -126,8 +129,8 @@ def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
         # While there are still qubits available
         while not qubit_set.empty():
             # Compute the objective function
-            min_cost = compute_cost(scale, trial_layout.logic_to_phys,
-                                   gates, num_gates)
+            min_cost = compute_cost(scale, num_qubits, trial_l2p.data(),
+                                    gates, num_gates)
             # Try to decrease objective function
             cost_reduced = 0
 
@@ -136,38 +139,42 @@ def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
             for idx in range(num_edges):
                 start_edge = edges[2*idx]
                 end_edge = edges[2*idx+1]
-                start_qubit = trial_layout.phys_to_logic[start_edge]
-                end_qubit =  trial_layout.phys_to_logic[end_edge]
+                start_qubit = trial_p2l[start_edge]
+                end_qubit = trial_p2l[end_edge]
                 # Are the qubits available?
-                if  qubit_set.count(start_qubit) and qubit_set.count(end_qubit):
+                if qubit_set.count(start_qubit) and qubit_set.count(end_qubit):
                     # Try this edge to reduce the cost
                     if need_copy:
-                        new_layout = trial_layout.copy()
+                        new_l2p = trial_l2p
+                        new_p2l = trial_p2l
                         need_copy = 0
-                    new_layout.swap(start_edge, end_edge)
+                    swap_layout(new_l2p, new_p2l, start_edge, end_edge)
                     # Compute the objective function
-                    new_cost = compute_cost(scale, new_layout.logic_to_phys,
-                                   gates, num_gates)
+                    new_cost = compute_cost(scale, num_qubits, new_l2p.data(),
+                                            gates, num_gates)
                     # Record progress if we succeed
                     if new_cost < min_cost:
-                        cost_reduced = True
+                        cost_reduced = 1
                         min_cost = new_cost
-                        optimal_layout = new_layout
+                        optimal_l2p = new_l2p
+                        optimal_p2l = new_p2l
                         optimal_start = start_edge
                         optimal_end = end_edge
                         optimal_start_qubit = start_qubit
                         optimal_end_qubit = end_qubit
                         need_copy = 1
                     else:
-                        new_layout.swap(start_edge, end_edge)
+                        swap_layout(new_l2p, new_p2l, start_edge, end_edge)
 
             # After going over all edges
             # Were there any good swap choices?
             if cost_reduced:
                 qubit_set.erase(optimal_start_qubit)
                 qubit_set.erase(optimal_end_qubit)
-                trial_layout = optimal_layout
-                opt_edges.add(optimal_start, optimal_end)
+                trial_l2p.swap(optimal_l2p)
+                trial_p2l.swap(optimal_p2l)
+                opt_edges.push_back(optimal_start)
+                opt_edges.push_back(optimal_end)
             else:
                 break
 
@@ -175,8 +182,7 @@ def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
         # failed to improve the cost.
 
         # Compute the coupling graph distance
-        dist = compute_cost(cdist, trial_layout.logic_to_phys,
-                                   gates, num_gates)
+        dist = compute_cost(cdist, cdist_stride, trial_l2p.data(), gates, num_gates)
         # If all gates can be applied now, we are finished.
         # Otherwise we need to consider a deeper swap circuit
         if dist == num_gates:
@@ -186,7 +192,147 @@ def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
         depth_step += 1
 
     # Either we have succeeded at some depth d < dmax or failed
-    dist = compute_cost(cdist, trial_layout.logic_to_phys,
-                                   gates, num_gates)
-    
+    dist_out[0] = compute_cost(cdist, cdist_stride, trial_l2p.data(), gates, num_gates)
+    return depth_step
+
+
+cdef tuple trial_result(NLayout int_layout, vector[unsigned int] & l2p,
+                        vector[unsigned int] & p2l, vector[unsigned int] & edges,
+                        double dist, unsigned int depth_step):
+    """ Wraps the outcome of a trial in the Python objects returned by swap_trial.
+    """
+    cdef EdgeCollection opt_edges = EdgeCollection()
+    cdef NLayout trial_layout = int_layout.copy()
+    cdef size_t kk
+    for kk in range(l2p.size()):
+        trial_layout.logic_to_phys[kk] = l2p[kk]
+    for kk in range(p2l.size()):
+        trial_layout.phys_to_logic[kk] = p2l[kk]
+    for kk in range(edges.size()//2):
+        opt_edges.add(edges[2*kk], edges[2*kk+1])
     return dist, opt_edges, trial_layout, depth_step
+
+
+@cython.nonecheck(False)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
+               int[::1] gates, double[:, ::1] cdist2, const double[:, ::1] cdist, 
+               int[::1] edges, double[:, ::1] scale, object rng):
+    """ A single iteration of the tchastic swap mapping routine.
+
+    Args:
+        num_qubits (int): The number of physical qubits.
+        int_layout (NLayout): The numeric (integer) representation of 
+                              the initial_layout.
+        int_qubit_subset (ndarray): Int ndarray listing qubits in set.
+        gates (ndarray): Int array with integers giving qubits on which
+                         two-qubits gates act on.
+        cdist2 (ndarray): Array of doubles that gives the square of the 
+                          distance graph.
+        cdist (ndarray): Array of doubles that gives the distance graph.
+        edges (ndarray): Int array of edges in coupling map.
+        scale (ndarray): A double array that holds the perturbed cdist2 array.
+        rng (default_rng): An instance of the NumPy default_rng.
+
+    Returns:
+        double: Best distance achieved in this trial.
+        EdgeCollection: Collection of optimal edges found.
+        NLayout: The optimal layout found.
+        int: The number of depth steps required in mapping.
+    """
+    # Compute randomized distance
+    cdef double[:, ::1] rand = 1.0 + rng.normal(0.0, 1.0/num_qubits,
+                                                size=(1, num_qubits*(num_qubits+1)//2))
+    return swap_trials(num_qubits, int_layout, int_qubit_subset, gates, cdist2,
+                       cdist, edges, rand, scale, 1)[0]
+
+
+@cython.nonecheck(False)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def swap_trials(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
+                int[::1] gates, double[:, ::1] cdist2, const double[:, ::1] cdist,
+                int[::1] edges, double[:, ::1] rand, double[:, ::1] scale,
+                int num_threads):
+    """ Independent iterations of the stochastic swap mapping routine.
+
+    The trials run without the GIL, in ``num_threads`` threads if Qiskit was
+    built with OpenMP support. Trial ``k`` is perturbed by the random numbers
+    ``rand[k]``, so the results do not depend on the number of threads.
+
+    Args:
+        num_qubits (int): The number of physical qubits.
+        int_layout (NLayout): The numeric (integer) representation of 
+                              the initial_layout.
+        int_qubit_subset (ndarray): Int ndarray listing qubits in set.
+        gates (ndarray): Int array with integers giving qubits on which
+                         two-qubits gates act on.
+        cdist2 (ndarray): Array of doubles that gives the square of the 
+                          distance graph.
+        cdist (ndarray): Array of doubles that gives the distance graph.
+        edges (ndarray): Int array of edges in coupling map.
+        rand (ndarray): A double array with a row of
+                        num_qubits*(num_qubits+1)//2 random scaling factors
+                        for each trial.
+        scale (ndarray): A double array of shape
+                         (k*num_qubits, num_qubits) that holds the perturbed
+                         cdist2 arrays of up to k trials running at once.
+        num_threads (int): The number of threads to run the trials on, at
+                           most k.
+
+    Returns:
+        list: For each trial, a tuple of the best distance achieved, the
+        EdgeCollection of optimal edges found, the optimal NLayout found and the
+        number of depth steps required in mapping, like :func:`swap_trial`.
+    """
+    cdef int num_trials = rand.shape[0]
+    cdef unsigned int num_gates = gates.shape[0]//2
+    cdef unsigned int num_edges = edges.shape[0]//2
+    cdef unsigned int cdist_stride = cdist.shape[1]
+    cdef int num_scales = scale.shape[0] // num_qubits
+    cdef size_t idx
+    cdef int trial, thread
+
+    # Convert int qubit array to c++ set
+    cdef cset[unsigned int] input_qubit_set
+    for idx in range(<unsigned int>int_qubit_subset.shape[0]):
+        input_qubit_set.insert(int_qubit_subset[idx])
+
+    cdef vector[vector[unsigned int]] trial_l2p, trial_p2l, opt_edges
+    trial_l2p.resize(num_trials)
+    trial_p2l.resize(num_trials)
+    opt_edges.resize(num_trials)
+    for trial in range(num_trials):
+        trial_l2p[trial].assign(int_layout.logic_to_phys,
+                                int_layout.logic_to_phys + int_layout.l2p_len)
+        trial_p2l[trial].assign(int_layout.phys_to_logic,
+                                int_layout.phys_to_logic + int_layout.p2l_len)
+    cdef vector[double] dist
+    cdef vector[unsigned int] depth_step
+    dist.resize(num_trials)
+    depth_step.resize(num_trials)
+
+    # The perturbed cdist2 arrays are stacked in scale, one per thread.
+    num_threads = max(1, min(num_threads, num_trials, num_scales))
+    if num_threads == 1:
+        with nogil:
+            for trial in range(num_trials):
+                depth_step[trial] = run_trial(
+                    num_qubits, trial_l2p[trial], trial_p2l[trial], input_qubit_set,
+                    &gates[0], num_gates, &cdist2[0, 0], &cdist[0, 0], cdist_stride,
+                    &edges[0], num_edges, &scale[0, 0], &rand[trial, 0], opt_edges[trial],
+                    &dist[trial])
+    else:
+        for trial in prange(num_trials, nogil=True, num_threads=num_threads,
+                            schedule='dynamic'):
+            thread = cython.parallel.threadid()
+            depth_step[trial] = run_trial(
+                num_qubits, trial_l2p[trial], trial_p2l[trial], input_qubit_set,
+                &gates[0], num_gates, &cdist2[0, 0], &cdist[0, 0], cdist_stride,
+                &edges[0], num_edges, &scale[0, 0] + thread * num_qubits * num_qubits,
+                &rand[trial, 0], opt_edges[trial], &dist[trial])
+
+    return [trial_result(int_layout, trial_l2p[trial], trial_p2l[trial], opt_edges[trial],
+                         dist[trial], depth_step[trial])
+            for trial in range(num_trials)]
@@ -13,16 +13,17 @@
 """Routing via SWAP insertion using the SABRE method from Li et al."""
 
 import logging
-from copy import deepcopy
+from collections import deque
 from itertools import cycle
 import numpy as np
 
+from qiskit.converters import circuit_to_dag, dag_to_circuit
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.circuit.library.standard_gates import SwapGate
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler.layout import Layout
-from qiskit.dagcircuit import DAGNode
+from qiskit.tools.parallel import parallel_map
 
 logger = logging.getLogger(__name__)
 
@@ -65,7 +66,8 @@ class SabreSwap(TransformationPass):
     `arXiv:1809.02573 <https://arxiv.org/pdf/1809.02573.pdf>`_
     """
 
-    def __init__(self, coupling_map, heuristic='basic', seed=None):
+    def __init__(self, coupling_map, heuristic='basic', seed=None, trials=1,
+                 cost_function=None):
         r"""SabreSwap initializer.
 
         Args:
@@ -73,6 +75,14 @@ class SabreSwap(TransformationPass):
             heuristic (str): The type of heuristic to use when deciding best
                 swap strategy ('basic' or 'lookahead' or 'decay').
             seed (int): random seed used to tie-break among candidate swaps.
+            trials (int): number of routings, with different seeds, to run in
+                parallel processes. The best routed circuit is kept. The first
+                trial uses ``seed``, the seeds of the others are derived from it.
+            cost_function (callable): function of a routed ``QuantumCircuit``
+                returning a comparable cost, the routed circuit with the lowest
+                cost is kept. Defaults to the number of swaps, then the depth.
+                It is only evaluated in the calling process, so it does not
+                need to be picklable.
 
         Additional Information:
 
@@ -122,12 +132,19 @@ class SabreSwap(TransformationPass):
         self.coupling_map = coupling_map
         self.heuristic = heuristic
         self.seed = seed
-        self.applied_gates = None
+        self.trials = trials
+        self.cost_function = cost_function
         self.qubits_decay = None
 
     def run(self, dag):
         """Run the SabreSwap pass on `dag`.
 
+        The routing works on integer indices: virtual qubits are indexed by
+        their position in the canonical register, the layout is kept as a pair
+        of arrays mapping virtual to physical qubits and back, and all the
+        candidate swaps are scored at once against the distance matrix of the
+        coupling map.
+
         Args:
             dag (DAGCircuit): the directed acyclic graph to be mapped.
         Returns:
@@ -142,127 +159,170 @@ class SabreSwap(TransformationPass):
         if len(dag.qubits) > self.coupling_map.size():
             raise TranspilerError('More virtual qubits exist than physical.')
 
-        rng = np.random.default_rng(self.seed)
+        if self.heuristic not in ('basic', 'lookahead', 'decay'):
+            raise TranspilerError('Heuristic %s not recognized.' % self.heuristic)
 
-        # Preserve input DAG's name, regs, wire_map, etc. but replace the graph.
-        mapped_dag = _copy_circuit_metadata(dag)
+        if self.trials < 1:
+            raise TranspilerError('Sabre swap needs at least one trial, got %s.' % self.trials)
 
         # Assume bidirectional couplings, fixing gate direction is easy later.
+        # The distance matrix is computed once here, and sent along with the
+        # coupling map to the processes running the trials.
         self.coupling_map.make_symmetric()
+        distance_matrix = self.coupling_map.distance_matrix
 
-        canonical_register = dag.qregs['q']
-        current_layout = Layout.generate_trivial_layout(canonical_register)
+        if self.trials == 1:
+            mapped_dag, final_layout = self._route(dag, self.seed, distance_matrix)
+        else:
+            seeds = [self.seed] + [int(seed) for seed in np.random.SeedSequence(
+                self.seed).generate_state(self.trials - 1)]
+            # DAGCircuits are not picklable, the trials exchange QuantumCircuits.
+            results = parallel_map(_route_trial, seeds,
+                                   task_args=(dag_to_circuit(dag, copy_operations=False),
+                                              self.coupling_map, self.heuristic))
+            cost_function = self.cost_function or _routing_cost
+            costs = [cost_function(mapped_circuit) for mapped_circuit, _ in results]
+            best = costs.index(min(costs))
+            logger.info('Sabre swap trial costs: %s, keeping trial %d', costs, best)
+            mapped_dag = circuit_to_dag(results[best][0], copy_operations=False)
+            final_layout = results[best][1]
+
+        self.property_set['final_layout'] = final_layout
+
+        return mapped_dag
+
+    def _route(self, dag, seed, distance_matrix):
+        """Route ``dag`` with the random number generator seeded by ``seed``.
+
+        Returns:
+            tuple: the routed DAGCircuit and its final Layout.
+        """
+        rng = np.random.default_rng(seed)
 
-        # A decay factor for each qubit used to heuristically penalize recently
-        # used qubits (to encourage parallelism).
-        self.qubits_decay = {qubit: 1 for qubit in dag.qubits}
+        # Preserve input DAG's name, regs, wire_map, etc. but replace the graph.
+        mapped_dag = _copy_circuit_metadata(dag)
+
+        canonical_register = dag.qregs['q']
+        num_qubits = len(canonical_register)
+        qubit_indices = {qubit: index for index, qubit in enumerate(canonical_register)}
+        # Physical qubits beyond the register hold no virtual qubit to swap with.
+        neighbors = [[neighbor for neighbor in self.coupling_map.neighbors(physical)
+                      if neighbor < num_qubits]
+                     for physical in range(num_qubits)]
+
+        # The layout starts trivial: virtual qubit i is on physical qubit i.
+        virtual_to_physical = np.arange(num_qubits)
+        physical_to_virtual = np.arange(num_qubits)
+
+        # A decay factor for each virtual qubit used to heuristically penalize
+        # recently used qubits (to encourage parallelism).
+        self.qubits_decay = np.ones(num_qubits)
+
+        # The quantum successors of the applied nodes, and the number of quantum
+        # predecessors of the nodes which are not applied yet.
+        dag_successors = {}
+        num_unapplied_predecessors = {}
 
         # Start algorithm from the front layer and iterate until all gates done.
         num_search_steps = 0
         front_layer = dag.front_layer()
-        self.applied_gates = set()
         while front_layer:
             execute_gate_list = []
 
             # Remove as many immediately applicable gates as possible
             for node in front_layer:
                 if len(node.qargs) == 2:
-                    v0, v1 = node.qargs
-                    physical_qubits = (current_layout[v0], current_layout[v1])
-                    if physical_qubits in self.coupling_map.get_edges():
+                    physical0 = virtual_to_physical[qubit_indices[node.qargs[0]]]
+                    physical1 = virtual_to_physical[qubit_indices[node.qargs[1]]]
+                    if distance_matrix[physical0, physical1] == 1:
                         execute_gate_list.append(node)
                 else:  # Single-qubit gates as well as barriers are free
                     execute_gate_list.append(node)
 
             if execute_gate_list:
                 for node in execute_gate_list:
-                    new_node = _transform_gate_for_layout(node, current_layout)
-                    mapped_dag.apply_operation_back(new_node.op,
-                                                    new_node.qargs,
-                                                    new_node.cargs,
-                                                    new_node.condition)
+                    mapped_dag.apply_operation_back(
+                        node.op,
+                        [canonical_register[virtual_to_physical[qubit_indices[qubit]]]
+                         for qubit in node.qargs],
+                        node.cargs)
                     front_layer.remove(node)
-                    self.applied_gates.add(node)
                     for successor in dag.quantum_successors(node):
                         if successor.type != 'op':
                             continue
-                        if self._is_resolved(successor, dag):
+                        if successor not in num_unapplied_predecessors:
+                            num_unapplied_predecessors[successor] = sum(
+                                1 for predecessor in dag.quantum_predecessors(successor)
+                                if predecessor.type == 'op')
+                        num_unapplied_predecessors[successor] -= 1
+                        if not num_unapplied_predecessors[successor]:
+                            del num_unapplied_predecessors[successor]
                             front_layer.append(successor)
 
                     if node.qargs:
-                        self._reset_qubits_decay()
+                        self.qubits_decay.fill(1)
 
                 # Diagnostics
-                logger.debug('free! %s',
-                             [(n.name, n.qargs) for n in execute_gate_list])
-                logger.debug('front_layer: %s',
-                             [(n.name, n.qargs) for n in front_layer])
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug('free! %s',
+                                 [(n.name, n.qargs) for n in execute_gate_list])
+                    logger.debug('front_layer: %s',
+                                 [(n.name, n.qargs) for n in front_layer])
 
                 continue
 
             # After all free gates are exhausted, heuristically find
             # the best swap and insert it. When two or more swaps tie
             # for best score, pick one randomly.
-            extended_set = self._obtain_extended_set(dag, front_layer)
-            swap_candidates = self._obtain_swaps(front_layer, current_layout)
-            swap_scores = dict.fromkeys(swap_candidates, 0)
-            for swap_qubits in swap_scores:
-                trial_layout = current_layout.copy()
-                trial_layout.swap(*swap_qubits)
-                score = self._score_heuristic(self.heuristic,
-                                              front_layer,
-                                              extended_set,
-                                              trial_layout,
-                                              swap_qubits)
-                swap_scores[swap_qubits] = score
-            min_score = min(swap_scores.values())
-            best_swaps = [k for k, v in swap_scores.items() if v == min_score]
-            best_swaps.sort(key=lambda x: (x[0].index, x[1].index))
-            best_swap = rng.choice(best_swaps)
-            swap_node = DAGNode(op=SwapGate(), qargs=best_swap, type='op')
-            swap_node = _transform_gate_for_layout(swap_node, current_layout)
-            mapped_dag.apply_operation_back(swap_node.op, swap_node.qargs)
-            current_layout.swap(*best_swap)
+            front_gates = np.array([[qubit_indices[qubit] for qubit in node.qargs]
+                                    for node in front_layer])
+            extended_set = self._obtain_extended_set(dag, front_layer, dag_successors)
+            extended_gates = np.array([[qubit_indices[qubit] for qubit in node.qargs]
+                                       for node in extended_set]).reshape(-1, 2)
+            swap_candidates = self._obtain_swaps(front_gates, neighbors,
+                                                 virtual_to_physical, physical_to_virtual)
+            swap_scores = self._score_heuristic(self.heuristic, front_gates, extended_gates,
+                                                swap_candidates, virtual_to_physical,
+                                                distance_matrix)
+            # The candidates are sorted, so are the best swaps.
+            best_swaps = swap_candidates[swap_scores == swap_scores.min()]
+            virtual0, virtual1 = rng.choice(best_swaps)
+            physical0 = virtual_to_physical[virtual0]
+            physical1 = virtual_to_physical[virtual1]
+            mapped_dag.apply_operation_back(SwapGate(), [canonical_register[physical0],
+                                                         canonical_register[physical1]])
+            virtual_to_physical[virtual0], virtual_to_physical[virtual1] = physical1, physical0
+            physical_to_virtual[physical0], physical_to_virtual[physical1] = virtual1, virtual0
 
             num_search_steps += 1
             if num_search_steps % DECAY_RESET_INTERVAL == 0:
-                self._reset_qubits_decay()
+                self.qubits_decay.fill(1)
             else:
-                self.qubits_decay[best_swap[0]] += DECAY_RATE
-                self.qubits_decay[best_swap[1]] += DECAY_RATE
+                self.qubits_decay[virtual0] += DECAY_RATE
+                self.qubits_decay[virtual1] += DECAY_RATE
 
             # Diagnostics
-            logger.debug('SWAP Selection...')
-            logger.debug('extended_set: %s',
-                         [(n.name, n.qargs) for n in extended_set])
-            logger.debug('swap scores: %s', swap_scores)
-            logger.debug('best swap: %s', best_swap)
-            logger.debug('qubits decay: %s', self.qubits_decay)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('SWAP Selection...')
+                logger.debug('extended_set: %s',
+                             [(n.name, n.qargs) for n in extended_set])
+                logger.debug('swap scores: %s',
+                             dict(zip(map(tuple, swap_candidates), swap_scores)))
+                logger.debug('best swap: %s', (virtual0, virtual1))
+                logger.debug('qubits decay: %s', self.qubits_decay)
 
-        self.property_set['final_layout'] = current_layout
+        final_layout = Layout({canonical_register[virtual]: int(physical)
+                               for virtual, physical in enumerate(virtual_to_physical)})
 
-        return mapped_dag
-
-    def _reset_qubits_decay(self):
-        """Reset all qubit decay factors to 1 upon request (to forget about
-        past penalizations).
-        """
-        self.qubits_decay = {k: 1 for k in self.qubits_decay.keys()}
-
-    def _is_resolved(self, node, dag):
-        """Return True if all of a node's predecessors in dag are applied.
-        """
-        predecessors = dag.quantum_predecessors(node)
-        predecessors = filter(lambda x: x.type == 'op', predecessors)
-        return all([n in self.applied_gates for n in predecessors])
+        return mapped_dag, final_layout
 
-    def _obtain_extended_set(self, dag, front_layer):
+    def _obtain_extended_set(self, dag, front_layer, dag_successors):
         """Populate extended_set by looking ahead a fixed number of gates.
         For each existing element add a successor until reaching limit.
         """
         # TODO: use layers instead of bfs_successors so long range successors aren't included.
         extended_set = set()
-        bfs_successors_pernode = [dag.bfs_successors(n) for n in front_layer]
+        bfs_successors_pernode = [_bfs_successors(dag, n, dag_successors) for n in front_layer]
         node_lookahead_exhausted = [False] * len(front_layer)
         for i, node_successor_generator in cycle(enumerate(bfs_successors_pernode)):
             if all(node_lookahead_exhausted) or len(extended_set) >= EXTENDED_SET_SIZE:
@@ -285,56 +345,120 @@ class SabreSwap(TransformationPass):
 
         return extended_set
 
-    def _obtain_swaps(self, front_layer, current_layout):
-        """Return a set of candidate swaps that affect qubits in front_layer.
+    @staticmethod
+    def _obtain_swaps(front_gates, neighbors, virtual_to_physical, physical_to_virtual):
+        """Return the candidate swaps that affect qubits in front_layer.
 
         For each virtual qubit in front_layer, find its current location
         on hardware and the physical qubits in that neighborhood. Every SWAP
         on virtual qubits that corresponds to one of those physical couplings
         is a candidate SWAP.
 
-        Candidate swaps are sorted so SWAP(i,j) and SWAP(j,i) are not duplicated.
+        Returns:
+            ndarray: the candidate swaps, as pairs of virtual qubits sorted in
+            ascending order, in lexicographic order.
         """
         candidate_swaps = set()
-        for node in front_layer:
-            for virtual in node.qargs:
-                physical = current_layout[virtual]
-                for neighbor in self.coupling_map.neighbors(physical):
-                    virtual_neighbor = current_layout[neighbor]
-                    swap = sorted([virtual, virtual_neighbor],
-                                  key=lambda q: (q.register.name, q.index))
-                    candidate_swaps.add(tuple(swap))
+        for virtual in set(front_gates.flat):
+            for neighbor in neighbors[virtual_to_physical[virtual]]:
+                virtual_neighbor = physical_to_virtual[neighbor]
+                candidate_swaps.add((min(virtual, virtual_neighbor),
+                                     max(virtual, virtual_neighbor)))
 
-        return candidate_swaps
+        return np.array(sorted(candidate_swaps))
 
-    def _score_heuristic(self, heuristic, front_layer, extended_set, layout, swap_qubits=None):
-        """Return a heuristic score for a trial layout.
+    def _score_heuristic(self, heuristic, front_gates, extended_gates, swaps,
+                         virtual_to_physical, distance_matrix):
+        """Return the heuristic scores of the trial layouts resulting from swaps.
 
         Assuming a trial layout has resulted from a SWAP, we now assign a cost
         to it. The goodness of a layout is evaluated based on how viable it makes
         the remaining virtual gates that must be applied.
         """
         if heuristic == 'basic':
-            return sum(self.coupling_map.distance(*[layout[q] for q in node.qargs])
-                       for node in front_layer)
+            return _trial_distances(front_gates, swaps, virtual_to_physical, distance_matrix)
 
         elif heuristic == 'lookahead':
-            first_cost = self._score_heuristic('basic', front_layer, [], layout)
-            first_cost /= len(front_layer)
-
-            second_cost = self._score_heuristic('basic', extended_set, [], layout)
-            second_cost = 0.0 if not extended_set else second_cost / len(extended_set)
+            first_cost = self._score_heuristic('basic', front_gates, None, swaps,
+                                               virtual_to_physical, distance_matrix)
+            first_cost /= len(front_gates)
+
+            if extended_gates.size:
+                second_cost = self._score_heuristic('basic', extended_gates, None, swaps,
+                                                    virtual_to_physical, distance_matrix)
+                second_cost /= len(extended_gates)
+            else:
+                second_cost = 0.0
 
             return first_cost + EXTENDED_SET_WEIGHT * second_cost
 
         elif heuristic == 'decay':
-            return max(self.qubits_decay[swap_qubits[0]], self.qubits_decay[swap_qubits[1]]) * \
-                   self._score_heuristic('lookahead', front_layer, extended_set, layout)
+            return np.maximum(self.qubits_decay[swaps[:, 0]], self.qubits_decay[swaps[:, 1]]) * \
+                self._score_heuristic('lookahead', front_gates, extended_gates, swaps,
+                                      virtual_to_physical, distance_matrix)
 
         else:
             raise TranspilerError('Heuristic %s not recognized.' % heuristic)
 
 
+def _routing_cost(circuit):
+    """Return the default cost of a routed circuit: its number of swaps, then its depth."""
+    return circuit.count_ops().get('swap', 0), circuit.depth()
+
+
+def _route_trial(seed, circuit, coupling_map, heuristic):
+    """Route ``circuit`` with a single seeded :class:`SabreSwap`, in a worker process."""
+    routing_pass = SabreSwap(coupling_map, heuristic, seed=seed)
+    # Like the single trial path, the mapped DAG shares the input instructions.
+    mapped_dag, final_layout = routing_pass._route(circuit_to_dag(circuit, copy_operations=False),
+                                                   seed, coupling_map.distance_matrix)
+    return dag_to_circuit(mapped_dag, copy_operations=False), final_layout
+
+
+def _trial_distances(gates, swaps, virtual_to_physical, distance_matrix):
+    """Return the sum of the distances between the qubits of gates after each swap.
+
+    Args:
+        gates (ndarray): the virtual qubits of 2-qubit gates, with shape ``(k, 2)``.
+        swaps (ndarray): pairs of virtual qubits to swap, with shape ``(c, 2)``.
+        virtual_to_physical (ndarray): the physical qubit of each virtual qubit.
+        distance_matrix (ndarray): the distances between physical qubits.
+
+    Returns:
+        ndarray: for each swap, the sum of the distances between the physical
+        qubits of the gates in the layout resulting from the swap.
+    """
+    physical = virtual_to_physical[gates][np.newaxis]
+    physical0 = virtual_to_physical[swaps[:, 0]][:, np.newaxis, np.newaxis]
+    physical1 = virtual_to_physical[swaps[:, 1]][:, np.newaxis, np.newaxis]
+    trial_physical = np.where(physical == physical0, physical1,
+                              np.where(physical == physical1, physical0, physical))
+    return distance_matrix[trial_physical[..., 0], trial_physical[..., 1]].sum(axis=1)
+
+
+def _bfs_successors(dag, node, dag_successors):
+    """Lazily yield ``(node, successors)`` pairs in breadth-first order from ``node``.
+
+    This is the same sequence as :meth:`DAGCircuit.bfs_successors`, which
+    traverses all the descendants of ``node`` up front, while routing only
+    looks at a few of them. The successors of the visited nodes are cached in
+    ``dag_successors``.
+    """
+    discovered = {node}
+    queue = deque([node])
+    while queue:
+        current = queue.popleft()
+        successors = dag_successors.get(current)
+        if successors is None:
+            successors = dag_successors[current] = list(dag.successors(current))
+        for successor in successors:
+            if successor not in discovered:
+                discovered.add(successor)
+                queue.append(successor)
+        if successors:
+            yield current, successors
+
+
 def _copy_circuit_metadata(source_dag):
     """Return a copy of source_dag with metadata but empty.
     """
@@ -347,15 +471,3 @@ def _copy_circuit_metadata(source_dag):
         target_dag.add_creg(creg)
 
     return target_dag
-
-
-def _transform_gate_for_layout(op_node, layout):
-    """Return node implementing a virtual op on given layout."""
-    mapped_op_node = deepcopy(op_node)
-
-    device_qreg = op_node.qargs[0].register
-    premap_qargs = op_node.qargs
-    mapped_qargs = map(lambda x: device_qreg[layout[x]], premap_qargs)
-    mapped_op_node.qargs = mapped_op_node.op.qargs = list(mapped_qargs)
-
-    return mapped_op_node
@@ -12,6 +12,7 @@
 
 """Map a DAGCircuit onto a `coupling_map` adding swap gates."""
 
+import os
 from logging import getLogger
 from math import inf
 from collections import OrderedDict
@@ -23,10 +24,11 @@ from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.circuit.library.standard_gates import SwapGate
 from qiskit.transpiler.layout import Layout
+from qiskit.tools.parallel import CPU_COUNT
 # pylint: disable=no-name-in-module
 from .cython.stochastic_swap.utils import nlayout_from_layout
 # pylint: disable=no-name-in-module
-from .cython.stochastic_swap.swap_trial import swap_trial
+from .cython.stochastic_swap.swap_trial import swap_trials
 
 
 logger = getLogger(__name__)
@@ -47,7 +49,7 @@ class StochasticSwap(TransformationPass):
            the circuit.
     """
 
-    def __init__(self, coupling_map, trials=20, seed=None):
+    def __init__(self, coupling_map, trials=20, seed=None, num_threads=None):
         """StochasticSwap initializer.
 
         The coupling map is a connected graph
@@ -59,11 +61,16 @@ class StochasticSwap(TransformationPass):
                 map.
             trials (int): maximum number of iterations to attempt
             seed (int): seed for random number generator
+            num_threads (int): number of threads running the trials of a layer
+                at once. Defaults to the number of CPUs, or 1 when the pass runs
+                in a parallel process, e.g. in a multi-circuit ``transpile``.
+                The result does not depend on the number of threads.
         """
         super().__init__()
         self.coupling_map = coupling_map
         self.trials = trials
         self.seed = seed
+        self.num_threads = num_threads
         self.qregs = None
         self.rng = None
         self.trivial_layout = None
@@ -173,8 +180,6 @@ class StochasticSwap(TransformationPass):
         best_layout = None  # initialize best final layout
 
         cdist2 = coupling._dist_matrix**2
-        # Scaling matrix
-        scale = np.zeros((num_qubits, num_qubits))
 
         int_qubit_subset = _regtuple_to_numeric(qubit_subset, qregs)
         int_gates = _gates_to_idx(gates, qregs)
@@ -187,27 +192,46 @@ class StochasticSwap(TransformationPass):
 
         edges = np.asarray(coupling.get_edges(), dtype=np.int32).ravel()
         cdist = coupling._dist_matrix
-        for trial in range(trials):
-            logger.debug("layer_permutation: trial %s", trial)
-            # This is one Trial --------------------------------------
-            dist, optim_edges, trial_layout, depth_step = swap_trial(num_qubits, int_layout,
-                                                                     int_qubit_subset,
-                                                                     int_gates, cdist2,
-                                                                     cdist, edges, scale,
-                                                                     self.rng)
-
-            logger.debug("layer_permutation: final distance for this trial = %s", dist)
-            if dist == len(gates) and depth_step < best_depth:
-                logger.debug("layer_permutation: got circuit with improved depth %s",
-                             depth_step)
-                best_edges = optim_edges
-                best_layout = trial_layout
-                best_depth = min(best_depth, depth_step)
-
-            # Break out of trial loop if we found a depth 1 circuit
-            # since we can't improve it further
-            if best_depth == 1:
-                break
+
+        num_threads = self.num_threads
+        if num_threads is None:
+            num_threads = 1 if os.getenv('QISKIT_IN_PARALLEL') == 'TRUE' else CPU_COUNT
+        # Scaling matrices, one for each trial running at once
+        scale = np.zeros((num_threads * num_qubits, num_qubits))
+        num_rands = num_qubits * (num_qubits + 1) // 2
+
+        # The trials run in batches of num_threads. Their random numbers are
+        # drawn in order, so the outcome does not depend on the batch size.
+        trial = 0
+        while trial < trials and best_depth != 1:
+            num_batch = min(num_threads, trials - trial)
+            rng_state = self.rng.bit_generator.state
+            rand = 1.0 + self.rng.normal(0.0, 1.0/num_qubits, size=(num_batch, num_rands))
+            results = swap_trials(num_qubits, int_layout, int_qubit_subset, int_gates,
+                                  cdist2, cdist, edges, rand, scale, num_threads)
+
+            for offset, (dist, optim_edges, trial_layout, depth_step) in enumerate(results):
+                logger.debug("layer_permutation: trial %s", trial + offset)
+                # This is one Trial --------------------------------------
+                logger.debug("layer_permutation: final distance for this trial = %s", dist)
+                if dist == len(gates) and depth_step < best_depth:
+                    logger.debug("layer_permutation: got circuit with improved depth %s",
+                                 depth_step)
+                    best_edges = optim_edges
+                    best_layout = trial_layout
+                    best_depth = min(best_depth, depth_step)
+
+                # Break out of trial loop if we found a depth 1 circuit
+                # since we can't improve it further
+                if best_depth == 1:
+                    # Leave the generator as if the following trials of the
+                    # batch had not drawn their random numbers.
+                    if offset + 1 < num_batch:
+                        self.rng.bit_generator.state = rng_state
+                        self.rng.normal(0.0, 1.0/num_qubits, size=(offset + 1, num_rands))
+                    break
+
+            trial += num_batch
 
         # If we have no best circuit for this layer, all of the
         # trials have failed
@@ -227,29 +251,22 @@ class StochasticSwap(TransformationPass):
         best_lay = best_layout.to_layout(qregs)
         return True, best_circuit, best_depth, best_lay
 
-    def _layer_update(self, i, best_layout, best_depth,
-                      best_circuit, layer_list):
-        """Provide a DAGCircuit for a new mapped layer.
+    def _layer_update(self, dagcircuit_output, layer, best_layout, best_depth,
+                      best_circuit):
+        """Append a new mapped layer to the output DAGCircuit.
 
         Args:
-            i (int): layer number
+            dagcircuit_output (DAGCircuit): the DAGCircuit that the _mapper
+                method is building
+            layer (DAGLayer): layer of the input circuit, output of DAGCircuit
+                layers() or serial_layers() method
             best_layout (Layout): layout returned from _layer_permutation
             best_depth (int): depth returned from _layer_permutation
             best_circuit (DAGCircuit): swap circuit returned from _layer_permutation
-            layer_list (list): list of DAGCircuit objects for each layer,
-                output of DAGCircuit layers() method
-
-        Returns:
-            DAGCircuit: a DAGCircuit object to append to the output DAGCircuit
-                that the _mapper method is building.
         """
         layout = best_layout
         logger.debug("layer_update: layout = %s", layout)
         logger.debug("layer_update: self.trivial_layout = %s", self.trivial_layout)
-        dagcircuit_output = DAGCircuit()
-        for qubit in layout.get_virtual_bits().keys():
-            if qubit.register not in dagcircuit_output.qregs.values():
-                dagcircuit_output.add_qreg(qubit.register)
 
         # Output any swaps
         if best_depth > 0:
@@ -258,15 +275,16 @@ class StochasticSwap(TransformationPass):
             dagcircuit_output.compose(best_circuit)
         else:
             logger.debug("layer_update: there are no swaps in this layer")
-        # Output this layer
-        layer_circuit = layer_list[i]["graph"]
-        for creg in layer_circuit.cregs.values():
-            dagcircuit_output.add_creg(creg)
-
-        order = layout.reorder_bits(dagcircuit_output.qubits)
-        dagcircuit_output.compose(layer_circuit, qubits=order)
-
-        return dagcircuit_output
+        # Output this layer, with each qubit moved to its position in the layout.
+        # The ops are applied directly from the nodes of the layer, so that the
+        # DAGCircuit of the layer is never built.
+        qubits = dagcircuit_output.qubits
+        for node in layer.nodes:
+            op = node.op.copy()
+            op.condition = node.condition
+            dagcircuit_output.apply_operation_back(op,
+                                                   [qubits[layout[qarg]] for qarg in node.qargs],
+                                                   node.cargs)
 
     def _mapper(self, circuit_graph, coupling_graph, trials=20):
         """Map a DAGCircuit onto a CouplingMap using swap gates.
@@ -290,7 +308,7 @@ class StochasticSwap(TransformationPass):
         layerlist = list(circuit_graph.layers())
         logger.debug("schedule:")
         for i, v in enumerate(layerlist):
-            logger.debug("    %d: %s", i, v["partition"])
+            logger.debug("    %d: %s", i, v.partition)
 
         qubit_subset = self.trivial_layout.get_virtual_bits().keys()
 
@@ -313,7 +331,7 @@ class StochasticSwap(TransformationPass):
 
             # Attempt to find a permutation for this layer
             success_flag, best_circuit, best_depth, best_layout \
-                = self._layer_permutation(layer["partition"], layout,
+                = self._layer_permutation(layer.partition, layout,
                                           qubit_subset, coupling_graph,
                                           trials)
             logger.debug("mapper: layer %d", i)
@@ -324,14 +342,14 @@ class StochasticSwap(TransformationPass):
             if not success_flag:
                 logger.debug("mapper: failed, layer %d, "
                              "retrying sequentially", i)
-                serial_layerlist = list(layer["graph"].serial_layers())
+                serial_layerlist = list(layer.graph.serial_layers())
 
                 # Go through each gate in the layer
                 for j, serial_layer in enumerate(serial_layerlist):
 
                     success_flag, best_circuit, best_depth, best_layout = \
                         self._layer_permutation(
-                            serial_layer["partition"],
+                            serial_layer.partition,
                             layout, qubit_subset,
                             coupling_graph,
                             trials)
@@ -348,24 +366,22 @@ class StochasticSwap(TransformationPass):
                     # for each inner iteration
                     layout = best_layout
                     # Update the DAG
-                    dagcircuit_output.compose(
-                        self._layer_update(j,
-                                           best_layout,
-                                           best_depth,
-                                           best_circuit,
-                                           serial_layerlist))
+                    self._layer_update(dagcircuit_output,
+                                       serial_layer,
+                                       best_layout,
+                                       best_depth,
+                                       best_circuit)
 
             else:
                 # Update the record of qubit positions for each iteration
                 layout = best_layout
 
                 # Update the DAG
-                dagcircuit_output.compose(
-                    self._layer_update(i,
-                                       best_layout,
-                                       best_depth,
-                                       best_circuit,
-                                       layerlist))
+                self._layer_update(dagcircuit_output,
+                                   layer,
+                                   best_layout,
+                                   best_depth,
+                                   best_circuit)
 
         # This is the final edgemap. We might use it to correctly replace
         # any measurements that needed to be removed earlier.
@@ -17,6 +17,7 @@ from typing import List
 
 from qiskit.converters import circuit_to_dag
 from qiskit.transpiler.basepasses import TransformationPass
+from qiskit.transpiler.passes.utils.track_modified_qubits import TrackModifiedQubits
 from qiskit.dagcircuit.dagcircuit import DAGCircuit
 from qiskit.circuit.library.standard_gates import iSwapGate, CXGate, CZGate, RXXGate
 from qiskit.extensions.quantum_initializer import isometry
@@ -99,15 +100,18 @@ class UnitarySynthesis(TransformationPass):
             if len(node.qargs) == 1:
                 if decomposer1q is None:
                     continue
-                synth_dag = circuit_to_dag(decomposer1q(node.op.to_matrix()))
+                synth_dag = circuit_to_dag(decomposer1q(node.op.to_matrix()),
+                                           copy_operations=False)
             elif len(node.qargs) == 2:
                 if decomposer2q is None:
                     continue
-                synth_dag = circuit_to_dag(decomposer2q(node.op.to_matrix()))
+                synth_dag = circuit_to_dag(decomposer2q(node.op.to_matrix()),
+                                           copy_operations=False)
             else:
                 synth_dag = circuit_to_dag(
                     isometry.Isometry(node.op.to_matrix(), 0, 0).definition)
 
             dag.substitute_node_with_dag(node, synth_dag)
+            TrackModifiedQubits.mark_modified(self.property_set, node.qargs)
 
         return dag
@@ -20,3 +20,4 @@ from .remove_final_measurements import RemoveFinalMeasurements
 from .merge_adjacent_barriers import MergeAdjacentBarriers
 from .dag_fixed_point import DAGFixedPoint
 from .fixed_point import FixedPoint
+from .track_modified_qubits import TrackModifiedQubits
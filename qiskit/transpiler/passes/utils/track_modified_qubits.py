@@ -0,0 +1,77 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Restrict the passes of an optimization loop to the qubits its previous iteration modified."""
+
+from qiskit.transpiler.basepasses import AnalysisPass
+
+
+class TrackModifiedQubits(AnalysisPass):
+    """Restrict the passes of an optimization loop to the qubits its previous iteration modified.
+
+    This pass is meant to run first in each iteration of a loop of optimization
+    passes, such as the one of the level 3 preset pass manager. It saves the qubits
+    modified since its previous run in ``property_set['dirty_qubits']``, or ``None``
+    (all the qubits) on its first run, and starts recording the qubits modified from
+    now on in ``property_set['modified_qubits']``.
+
+    The passes supporting it, :class:`~qiskit.transpiler.passes.ConsolidateBlocks`,
+    :class:`~qiskit.transpiler.passes.Optimize1qGates` and
+    :class:`~qiskit.transpiler.passes.CommutativeCancellation`, only optimize the
+    gates acting on dirty qubits: the gates acting on other qubits were already
+    optimized by the previous iteration, and were not changed since. They, and
+    :class:`~qiskit.transpiler.passes.UnitarySynthesis`, record the qubits they
+    modify with :meth:`mark_modified`, which also makes these qubits dirty for the
+    passes after them. This skips the synthesis of the unchanged blocks and the
+    rewriting of the unchanged gates. The analysis passes of the loop, such as
+    :class:`~qiskit.transpiler.passes.Collect2qBlocks`,
+    :class:`~qiskit.transpiler.passes.CommutationAnalysis` or
+    :class:`~qiskit.transpiler.passes.Depth`, and the rebuilding of the DAG by
+    :class:`~qiskit.transpiler.passes.ConsolidateBlocks`, still go through the
+    whole circuit.
+
+    All the transformation passes of the loop must record the qubits they modify.
+    After the loop, ``TrackModifiedQubits(reset=True)`` stops the tracking, so
+    that the passes after it optimize all the qubits again.
+    """
+
+    def __init__(self, reset=False):
+        """TrackModifiedQubits initializer.
+
+        Args:
+            reset (bool): stop tracking the modified qubits instead, by setting
+                ``property_set['dirty_qubits']`` and ``property_set['modified_qubits']``
+                to ``None``.
+        """
+        super().__init__()
+        self.reset = reset
+
+    def run(self, dag):
+        """Run the TrackModifiedQubits pass on `dag`."""
+        if self.reset:
+            self.property_set['dirty_qubits'] = None
+            self.property_set['modified_qubits'] = None
+            return
+        self.property_set['dirty_qubits'] = self.property_set['modified_qubits']
+        self.property_set['modified_qubits'] = set()
+
+    @staticmethod
+    def mark_modified(property_set, qubits):
+        """Record qubits as modified, and make them dirty.
+
+        Args:
+            property_set (PropertySet): the property set of the pass modifying the qubits.
+            qubits (Iterable[Qubit]): the modified qubits.
+        """
+        for name in ('modified_qubits', 'dirty_qubits'):
+            if property_set[name] is not None:
+                property_set[name].update(qubits)
@@ -224,6 +224,8 @@ class PassManager:
     @staticmethod
     def _in_parallel(circuit, pm_dill=None) -> QuantumCircuit:
         """Task used by the parallel map tools from ``_run_several_circuits``."""
+        # The pass manager is loaded again for each circuit: passes keep state
+        # between runs, and loading is faster than deep copying a loaded one.
         running_passmanager = dill.loads(pm_dill)._create_running_passmanager()
         result = running_passmanager.run(circuit)
         return result
@@ -51,6 +51,7 @@ from qiskit.transpiler.passes import ConsolidateBlocks
 from qiskit.transpiler.passes import UnitarySynthesis
 from qiskit.transpiler.passes import ApplyLayout
 from qiskit.transpiler.passes import CheckCXDirection
+from qiskit.transpiler.passes import TrackModifiedQubits
 
 from qiskit.transpiler import TranspilerError
 
@@ -160,11 +161,15 @@ def level_3_pass_manager(pass_manager_config: PassManagerConfig) -> PassManager:
 
     # 8. Optimize iteratively until no more change in depth. Removes useless gates
     # after reset and before measure, commutes gates and optimizes continguous blocks.
-    _depth_check = [Depth(), FixedPoint('depth')]
+    # Each iteration after the first only optimizes the qubits changed by the previous one.
+    _depth_check = [Depth(), FixedPoint('depth'), TrackModifiedQubits()]
 
     def _opt_control(property_set):
         return not property_set['depth_fixed_point']
 
+    # The passes after the loop optimize all the qubits again.
+    _stop_tracking = [TrackModifiedQubits(reset=True)]
+
     _reset = [RemoveResetInZeroState()]
 
     _meas = [OptimizeSwapBeforeMeasure(), RemoveDiagonalGatesBeforeMeasure()]
@@ -190,6 +195,7 @@ def level_3_pass_manager(pass_manager_config: PassManagerConfig) -> PassManager:
         pm3.append(_swap, condition=_swap_condition)
     pm3.append(_unroll)
     pm3.append(_depth_check + _opt + _unroll, do_while=_opt_control)
+    pm3.append(_stop_tracking)
     if coupling_map and not coupling_map.is_symmetric:
         pm3.append(_direction_check)
         pm3.append(_direction, condition=_direction_condition)
@@ -112,7 +112,9 @@ class RunningPassManager:
             for pass_ in passset:
                 dag = self._do_pass(pass_, dag, passset.options)
 
-        circuit = dag_to_circuit(dag)
+        # The DAG is private to this run, and its instructions copies of those
+        # of the input circuit or created by the passes: they are not copied again.
+        circuit = dag_to_circuit(dag, copy_operations=False)
         if output_name:
             circuit.name = output_name
         else:
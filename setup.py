@@ -14,7 +14,9 @@
 
 import os
 import sys
+from distutils.errors import CompileError, LinkError
 from setuptools import setup, find_packages, Extension
+from setuptools.command.build_ext import build_ext
 try:
     from Cython.Build import cythonize
 except ImportError:
@@ -42,6 +44,9 @@ REQUIREMENTS = [
 CYTHON_EXTS = ['utils', 'swap_trial']
 CYTHON_MODULE = 'qiskit.transpiler.passes.routing.cython.stochastic_swap'
 CYTHON_SOURCE_DIR = 'qiskit/transpiler/passes/routing/cython/stochastic_swap'
+# Cython extensions which run in parallel threads when built with OpenMP, and
+# serially otherwise
+OPENMP_EXTS = ['swap_trial']
 
 INCLUDE_DIRS = []
 # Extra link args
@@ -49,15 +54,37 @@ LINK_FLAGS = []
 # If on Win and not in MSYS2 (i.e. Visual studio compile)
 if (sys.platform == 'win32' and os.environ.get('MSYSTEM') is None):
     COMPILER_FLAGS = ['/O2']
+    OPENMP_FLAGS = []
 # Everything else
 else:
     COMPILER_FLAGS = ['-O2', '-funroll-loops', '-std=c++11']
+    OPENMP_FLAGS = ['-fopenmp']
     if sys.platform == 'darwin':
         # These are needed for compiling on OSX 10.14+
         COMPILER_FLAGS.append('-mmacosx-version-min=10.9')
         LINK_FLAGS.append('-mmacosx-version-min=10.9')
 
 
+class BuildExt(build_ext):
+    """Build the OpenMP extensions with OpenMP if the compiler supports it."""
+
+    def build_extension(self, ext):
+        if ext.name.rsplit('.', 1)[-1] not in OPENMP_EXTS or not OPENMP_FLAGS:
+            build_ext.build_extension(self, ext)
+            return
+        compile_args = ext.extra_compile_args
+        link_args = ext.extra_link_args
+        ext.extra_compile_args = compile_args + OPENMP_FLAGS
+        ext.extra_link_args = link_args + OPENMP_FLAGS
+        try:
+            build_ext.build_extension(self, ext)
+        except (CompileError, LinkError):
+            print('Building %s without OpenMP, it will run serially.' % ext.name)
+            ext.extra_compile_args = compile_args
+            ext.extra_link_args = link_args
+            build_ext.build_extension(self, ext)
+
+
 EXT_MODULES = []
 # Add Cython Extensions
 for ext in CYTHON_EXTS:
@@ -118,5 +145,6 @@ setup(
         "Source Code": "https://github.com/Qiskit/qiskit-terra",
     },
     ext_modules=cythonize(EXT_MODULES),
+    cmdclass={'build_ext': BuildExt},
     zip_safe=False
 )
@@ -13,7 +13,9 @@
 """Test QASM simulator."""
 
 import unittest
+from unittest import mock
 import io
+import os
 from logging import StreamHandler, getLogger
 import sys
 
@@ -22,7 +24,7 @@ import numpy as np
 from qiskit import execute
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
 from qiskit.compiler import transpile, assemble
-from qiskit.providers.basicaer import QasmSimulatorPy
+from qiskit.providers.basicaer import BasicAerError, QasmSimulatorPy
 from qiskit.test import Path
 from qiskit.test import providers
 
@@ -288,6 +290,103 @@ class TestBasicAerQasmSimulator(providers.BackendTestCase):
             counts = result.get_counts(0)
             self.assertEqual(counts, target_counts)
 
+    def test_max_parallel_experiments(self):
+        """Test experiments simulated in parallel give the serial results."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        circuits = []
+        for angle in np.linspace(0, np.pi, 4):
+            circuit = QuantumCircuit(qr, cr)
+            circuit.ry(angle, qr[0])
+            circuit.cx(qr[0], qr[1])
+            circuit.measure(qr, cr)
+            circuits.append(circuit)
+        qobj = assemble(transpile(circuits, self.backend), shots=200,
+                        seed_simulator=self.seed, memory=True)
+        serial = self.backend.run(qobj).result()
+        parallel = self.backend.run(qobj, backend_options={
+            'max_parallel_experiments': 2}).result()
+        for index in range(len(circuits)):
+            self.assertEqual(parallel.get_counts(index), serial.get_counts(index))
+            self.assertEqual(parallel.get_memory(index), serial.get_memory(index))
+
+    def test_max_parallel_shots(self):
+        """Test shot chunks are seeded deterministically and merged."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr[0])
+        circuit.cx(qr[0], qr[1]).c_if(cr, 1)
+        circuit.measure(qr[1], cr[1])
+        qobj = assemble(transpile(circuit, self.backend), shots=101,
+                        seed_simulator=self.seed, memory=True)
+        results = [self.backend.run(qobj, backend_options={'max_parallel_shots': 3}).result()
+                   for _ in range(2)]
+        self.assertEqual(results[0].get_memory(0), results[1].get_memory(0))
+        self.assertEqual(len(results[0].get_memory(0)), 101)
+        counts = results[0].get_counts(0)
+        self.assertEqual(sum(counts.values()), 101)
+        self.assertEqual(set(counts), {'00', '11'})
+        self.assertEqual(results[0].results[0].seed_simulator, self.seed)
+        self.assertEqual(results[0].results[0].shots, 101)
+
+    def test_max_parallel_shots_serial(self):
+        """Test shot chunks run serially report the shots of the qobj."""
+        qr = QuantumRegister(1, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr[0])
+        circuit.x(qr[0]).c_if(cr, 1)
+        circuit.measure(qr[0], cr[0])
+        qobj = assemble(transpile(circuit, self.backend), shots=100,
+                        seed_simulator=self.seed)
+        backend = QasmSimulatorPy()
+        backend._set_options(qobj_config=qobj.config,
+                             backend_options={'max_parallel_shots': 3})
+        # Run the job in this process, where parallel_map falls back to serial.
+        with mock.patch.dict(os.environ, {'QISKIT_IN_PARALLEL': 'TRUE'}):
+            result = backend._run_job('serial', qobj)
+        self.assertEqual(result.results[0].shots, 100)
+        self.assertEqual(result.get_counts(0), {'0': 100})
+
+    def test_deterministic_prefix_is_simulated_once(self):
+        """Test shots starting from the shared prefix give the same memory."""
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(3, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.ry(0.3, qr[2])
+        circuit.measure(qr[0], cr[0])
+        circuit.x(qr[2]).c_if(cr, 1)
+        circuit.reset(qr[1])
+        circuit.measure(qr, cr)
+        qobj = assemble(transpile(circuit, self.backend), shots=200,
+                        seed_simulator=self.seed, memory=True)
+        # Run the job in this process, so that the mock applies to it.
+        backend = QasmSimulatorPy()
+        backend._set_options(qobj_config=qobj.config)
+        result = backend._run_job('prefix', qobj)
+        with mock.patch.object(QasmSimulatorPy, '_deterministic_prefix_length',
+                               return_value=0):
+            expected = backend._run_job('no-prefix', qobj)
+        self.assertEqual(result.get_memory(0), expected.get_memory(0))
+        instructions = qobj.experiments[0].instructions
+        prefix_length = QasmSimulatorPy._deterministic_prefix_length(instructions)
+        self.assertGreater(prefix_length, 0)
+        self.assertTrue(all(inst.name in ('u1', 'u2', 'u3', 'cx')
+                            for inst in instructions[:prefix_length]))
+        self.assertIn(instructions[prefix_length].name, ('measure', 'reset'))
+
+    def test_max_parallel_options_must_be_non_negative(self):
+        """Test invalid parallelism options raise."""
+        with self.assertRaises(BasicAerError):
+            self.backend.run(self.qobj, backend_options={'max_parallel_experiments': -1})
+        with self.assertRaises(BasicAerError):
+            self.backend.run(self.qobj, backend_options={'max_parallel_shots': 1.5})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -18,9 +18,10 @@ import numpy as np
 from qiskit.providers.basicaer import StatevectorSimulatorPy
 from qiskit.test import ReferenceCircuits
 from qiskit.test import providers
-from qiskit import QuantumRegister, QuantumCircuit, execute
+from qiskit import QuantumRegister, QuantumCircuit, assemble, execute, transpile
+from qiskit.circuit.random import random_circuit
 from qiskit.quantum_info.random import random_unitary
-from qiskit.quantum_info import state_fidelity
+from qiskit.quantum_info import Statevector, state_fidelity
 
 
 class StatevectorSimulatorTest(providers.BackendTestCase):
@@ -83,6 +84,37 @@ class StatevectorSimulatorTest(providers.BackendTestCase):
                 fidelity = state_fidelity(psi_target, psi_out)
                 self.assertGreater(fidelity, 0.999)
 
+    def test_gate_fusion(self):
+        """Test fusing gates does not change the final statevector."""
+        for seed in range(3):
+            circuit = random_circuit(4, 10, max_operands=3, seed=seed)
+            circuit = transpile(circuit, self.backend, optimization_level=0)
+            fused = execute(circuit, self.backend,
+                            backend_options={'fusion_threshold': 1}).result()
+            unfused = execute(circuit, self.backend,
+                              backend_options={'fusion_enable': False}).result()
+            np.testing.assert_allclose(fused.get_statevector(0), unfused.get_statevector(0),
+                                       atol=1e-10)
+            fidelity = state_fidelity(Statevector.from_instruction(circuit),
+                                      unfused.get_statevector(0))
+            self.assertAlmostEqual(fidelity, 1)
+
+    def test_gate_fusion_blocks(self):
+        """Test gates are fused in blocks of at most two qubits."""
+        qr = QuantumRegister(3, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        circuit.h(qr[1])
+        circuit.cx(qr[0], qr[1])
+        circuit.t(qr[1])
+        circuit.cx(qr[1], qr[0])
+        circuit.cx(qr[1], qr[2])
+        circuit.h(qr[2])
+        qobj = assemble(transpile(circuit, self.backend))
+        fused = self.backend._fuse_instructions(qobj.experiments[0].instructions)
+        self.assertEqual([(inst.name, sorted(inst.qubits)) for inst in fused],
+                         [('unitary', [0, 1]), ('unitary', [1, 2])])
+
 
 if __name__ == '__main__':
     unittest.main()
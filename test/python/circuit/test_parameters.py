@@ -779,6 +779,167 @@ class TestParameters(QiskitTestCase):
         self.assertEqual(qc.parameters, set())
         raise_if_parameter_table_invalid(qc)
 
+    def test_bind_many(self):
+        """Test bind_many gives the same circuits as bind_parameters."""
+        theta, phi = Parameter('theta'), Parameter('phi')
+        qc = QuantumCircuit(2, global_phase=theta / 2)
+        qc.rx(theta, 0)
+        qc.crz(2 * phi + theta, 0, 1)
+        qc.u3(theta, phi, phi - 0.5, 1)
+
+        values = numpy.array([[0.1, 0.2], [0.3, -0.4], [1, 2]])
+        bound_circuits = qc.bind_many(values, [theta, phi])
+
+        self.assertEqual(len(bound_circuits), 3)
+        for bound_circuit, row in zip(bound_circuits, values):
+            expected = qc.bind_parameters({theta: row[0], phi: row[1]})
+            self.assertEqual(bound_circuit, expected)
+            self.assertAlmostEqual(bound_circuit.global_phase, expected.global_phase)
+            self.assertEqual(bound_circuit.parameters, set())
+            raise_if_parameter_table_invalid(bound_circuit)
+        self.assertEqual(qc.parameters, {theta, phi})
+
+    def test_bind_many_default_order(self):
+        """Test bind_many orders the parameters by name by default."""
+        theta, phi = Parameter('theta'), Parameter('phi')
+        qc = QuantumCircuit(1)
+        qc.rx(theta, 0)
+        qc.rz(phi, 0)
+        bound_circuits = qc.bind_many([[0.1, 0.2]])
+        self.assertEqual(bound_circuits, [qc.bind_parameters({phi: 0.1, theta: 0.2})])
+
+    def test_bind_many_parameter_vector(self):
+        """Test bind_many with a ParameterVector on a transpiled circuit."""
+        theta = ParameterVector('theta', 4)
+        qc = QuantumCircuit(2)
+        qc.ry(theta[0], 0)
+        qc.ry(theta[1], 1)
+        qc.cx(0, 1)
+        qc.rz(theta[2] - theta[3], 1)
+        template = transpile(qc, basis_gates=['u3', 'cx'], optimization_level=0)
+
+        values = numpy.random.RandomState(42).rand(5, 4)
+        for bound_circuit, row in zip(template.bind_many(values, theta), values):
+            self.assertEqual(bound_circuit, template.bind_parameters({theta: row}))
+
+    def test_bind_many_composite_instruction(self):
+        """Test bind_many binds the definitions of composite instructions."""
+        theta = Parameter('th')
+        qc = QuantumCircuit(1)
+        qc.rx(theta, 0)
+        qc1 = QuantumCircuit(1)
+        qc1.append(qc.to_instruction(), [0])
+
+        outputs = qc1.bind_many([[0.1], [0.2]], [theta])
+        expected1 = QuantumCircuit(1)
+        expected1.rx(0.1, 0)
+        expected2 = QuantumCircuit(1)
+        expected2.rx(0.2, 0)
+        self.assertEqual(outputs[0].decompose(), expected1)
+        self.assertEqual(outputs[1].decompose(), expected2)
+
+    def test_bind_many_raises(self):
+        """Test bind_many raises on values or parameters not matching the circuit."""
+        theta, phi = Parameter('theta'), Parameter('phi')
+        qc = QuantumCircuit(1)
+        qc.rx(theta, 0)
+        qc.rz(phi, 0)
+        with self.assertRaises(CircuitError):
+            qc.bind_many([[0.1, 0.2, 0.3]], [theta, phi])
+        with self.assertRaises(CircuitError):
+            qc.bind_many([0.1, 0.2], [theta, phi])
+        with self.assertRaises(CircuitError):
+            qc.bind_many([[0.1]], [theta])
+        with self.assertRaises(CircuitError):
+            qc.bind_many([[0.1, 0.2]], [theta, theta])
+
+    def test_bind_many_integer_values_negative_exponent(self):
+        """Test bind_many with integer values of a parameter raised to a negative power."""
+        theta = Parameter('theta')
+        qc = QuantumCircuit(1, 1)
+        qc.rx(1 / theta, 0)
+        qc.measure(0, 0)
+
+        bound_circuits = qc.bind_many([[1], [2]], [theta])
+        self.assertEqual(bound_circuits, [qc.bind_parameters({theta: 1}),
+                                          qc.bind_parameters({theta: 2})])
+
+        qobj = assemble(qc, parameter_binds=[{theta: 1}, {theta: 2}])
+        self.assertEqual([float(experiment.instructions[0].params[0])
+                          for experiment in qobj.experiments], [1.0, 0.5])
+
+    def test_bind_many_division_by_zero(self):
+        """Test bind_many raises like bind_parameters on division by zero."""
+        theta = Parameter('theta')
+        qc = QuantumCircuit(1)
+        qc.rx(1 / theta, 0)
+        with self.assertRaises(ZeroDivisionError):
+            qc.bind_parameters({theta: 0})
+        with self.assertRaises(ZeroDivisionError):
+            qc.bind_many([[0.0]], [theta])
+        with self.assertRaises(ZeroDivisionError):
+            qc.bind_many([[1], [0]], [theta])
+
+    def test_bind_many_shares_unbound_instructions(self):
+        """Test bind_many only copies the parameterized instructions."""
+        theta = Parameter('theta')
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.rx(theta, 0)
+        qc.cx(0, 1)
+        qc.rx(theta, 1)
+        bound = qc.bind_many([[0.1], [0.2]])
+        for circuit, value in zip(bound, [0.1, 0.2]):
+            self.assertIs(circuit.data[0][0], qc.data[0][0])
+            self.assertIs(circuit.data[2][0], qc.data[2][0])
+            self.assertIsNot(circuit.data[1][0], qc.data[1][0])
+            self.assertEqual(float(circuit.data[1][0].params[0]), value)
+            self.assertEqual(float(circuit.data[3][0].params[0]), value)
+        self.assertEqual(qc.parameters, {theta})
+        self.assertIs(qc.data[1][0].params[0], theta)
+        self.assertEqual(bound[0], qc.bind_parameters({theta: 0.1}))
+
+    def test_remove_instruction_updates_parameter_table(self):
+        """Test removing instructions drops the parameters no longer used."""
+        theta, phi = Parameter('theta'), Parameter('phi')
+        qc = QuantumCircuit(1)
+        gate = circlib.RXGate(theta)
+        qc.append(gate, [0])
+        qc.append(gate, [0])
+        qc.rz(phi, 0)
+        del qc.data[0]
+        self.assertEqual(qc.parameters, {theta, phi})
+        raise_if_parameter_table_invalid(qc)
+        del qc.data[0]
+        self.assertEqual(qc.parameters, {phi})
+        qc.data[0] = (circlib.HGate(), [qc.qubits[0]], [])
+        self.assertEqual(qc.parameters, set())
+        raise_if_parameter_table_invalid(qc)
+
+    def test_parameter_table_lookup_by_name(self):
+        """Test looking up parameters by name."""
+        theta = Parameter('theta')
+        vec = ParameterVector('v', 3)
+        qc = QuantumCircuit(1)
+        qc.rx(theta, 0)
+        qc.ry(vec[0], 0)
+        table = qc._parameter_table
+        self.assertIs(table.get_parameter('theta'), theta)
+        self.assertIs(table.get_parameter('v[0]'), vec[0])
+        self.assertIsNone(table.get_parameter('phi'))
+        qc.assign_parameters({vec[0]: 0.1}, inplace=True)
+        self.assertIsNone(table.get_parameter('v[0]'))
+
+    def test_name_conflict_after_parameter_removed(self):
+        """Test a parameter can reuse the name of a parameter no longer in the circuit."""
+        qc = QuantumCircuit(1)
+        qc.rx(Parameter('theta'), 0)
+        with self.assertRaises(CircuitError):
+            qc.ry(Parameter('theta'), 0)
+        del qc.data[0]
+        theta = Parameter('theta')
+        qc.ry(theta, 0)
+        self.assertEqual(qc.parameters, {theta})
 
 def _construct_circuit(param, qr):
     qc = QuantumCircuit(qr)
@@ -1233,6 +1394,43 @@ class TestParameterExpressions(QiskitTestCase):
         x = Parameter('x')
         self.assertEqual(x, x.conjugate())  # Parameters are real, therefore conjugate returns self
 
+    def test_evaluate(self):
+        """Test numeric evaluation of an expression."""
+        x, y = Parameter('x'), Parameter('y')
+        expr = 2 * x - y / 4 + 1
+        self.assertEqual(expr.evaluate({x: 0.5, y: 2}), 1.5)
+        numpy.testing.assert_allclose(expr.evaluate({x: numpy.array([0, 1, 2]), y: 4}),
+                                      [0, 2, 4])
+        self.assertEqual(x.evaluate({x: 3}), 3)
+        numpy.testing.assert_allclose((1 / x).evaluate({x: numpy.array([1, 2, 4])}),
+                                      [1, 0.5, 0.25])
+
+    def test_evaluate_raises_if_not_fully_bound(self):
+        """Test evaluate requires values for exactly the parameters of the expression."""
+        x, y, z = Parameter('x'), Parameter('y'), Parameter('z')
+        expr = x + y
+        with self.assertRaises(CircuitError):
+            expr.evaluate({x: 1})
+        with self.assertRaises(CircuitError):
+            expr.evaluate({x: 1, y: 2, z: 3})
+
+    def test_bind_matches_symbolic_binding(self):
+        """Test fully binding an expression gives the value of the partial bindings."""
+        x, y = Parameter('x'), Parameter('y')
+        expr = (x + 1) * (y - 2) / (x + y)
+        expected = expr.bind({x: 0.3}).bind({y: 0.7})
+        self.assertAlmostEqual(float(expr.bind({x: 0.3, y: 0.7})), float(expected))
+        self.assertEqual(float(expr.bind({x: 1, y: 2})), 0)
+
+    def test_pickle_evaluated_expression(self):
+        """Test an expression can be pickled after it has been evaluated."""
+        x = Parameter('x')
+        expr = 3 * x
+        expr.evaluate({x: 1})
+        loaded = pickle.loads(pickle.dumps(expr))
+        self.assertEqual(loaded, expr)
+        self.assertEqual(loaded.evaluate({x: 2}), 6)
+
     @data(circlib.RGate, circlib.RXGate, circlib.RYGate, circlib.RZGate, circlib.RXXGate,
           circlib.RYYGate, circlib.RZXGate, circlib.RZZGate, circlib.CRXGate, circlib.CRYGate,
           circlib.CRZGate)
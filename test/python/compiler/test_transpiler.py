@@ -25,7 +25,7 @@ from test import combine  # pylint: disable=wrong-import-order
 from qiskit import BasicAer
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.circuit import Parameter
-from qiskit.compiler import transpile
+from qiskit.compiler import transpile, transpile_iter
 from qiskit.converters import circuit_to_dag
 from qiskit.dagcircuit.exceptions import DAGCircuitError
 from qiskit.circuit.library import CXGate
@@ -789,6 +789,52 @@ class TestLogTranspile(QiskitTestCase):
         self.assertTranspileLog('Total Transpile Time')
 
 
+class TestTranspileIter(QiskitTestCase):
+    """Test the transpile_iter function."""
+
+    def _circuits(self, num_circuits):
+        for index in range(num_circuits):
+            qr = QuantumRegister(3, 'qr')
+            circuit = QuantumCircuit(qr, name='circuit_%s' % index)
+            circuit.h(qr[0])
+            for _ in range(index):
+                circuit.cx(qr[0], qr[2])
+            circuit.cx(qr[1], qr[2])
+            yield circuit
+
+    def test_same_as_transpile(self):
+        """Test transpile_iter yields the same circuits as transpile, in order."""
+        backend = FakeMelbourne()
+        expected = transpile(list(self._circuits(4)), backend, seed_transpiler=42)
+        result = transpile_iter(self._circuits(4), backend, seed_transpiler=42,
+                                max_in_flight=2)
+        self.assertEqual(list(result), expected)
+
+    def test_unordered(self):
+        """Test transpile_iter with ordered=False yields every circuit."""
+        coupling_map = [[0, 1], [1, 2]]
+        result = transpile_iter(self._circuits(5), basis_gates=['u3', 'cx'],
+                                coupling_map=coupling_map, seed_transpiler=42,
+                                ordered=False, chunk_size=2)
+        circuits = {circuit.name: circuit for circuit in result}
+        expected = transpile(list(self._circuits(5)), basis_gates=['u3', 'cx'],
+                             coupling_map=coupling_map, seed_transpiler=42)
+        self.assertEqual(circuits, {circuit.name: circuit for circuit in expected})
+
+    def test_is_lazy(self):
+        """Test transpile_iter does not consume the circuits before it is iterated."""
+        circuits = self._circuits(3)
+        result = transpile_iter(circuits, basis_gates=['u3', 'cx'])
+        self.assertEqual(next(circuits).name, 'circuit_0')
+        self.assertEqual([circuit.name for circuit in result], ['circuit_1', 'circuit_2'])
+
+    def test_per_circuit_options_raise(self):
+        """Test transpile_iter rejects options given per circuit."""
+        with self.assertRaisesRegex(TranspilerError, 'seed_transpiler, optimization_level'):
+            transpile_iter(self._circuits(2), seed_transpiler=[1, 2],
+                           optimization_level=[0, 1])
+
+
 class TestTranspileCustomPM(QiskitTestCase):
     """Test transpile function with custom pass manager"""
 
@@ -39,6 +39,41 @@ class TestCircuitToDag(QiskitTestCase):
         circuit_out = dag_to_circuit(dag)
         self.assertEqual(circuit_out, circuit_in)
 
+    def test_circuit_and_dag_shared_operations(self):
+        """Check convert to dag and back without copying the operations"""
+        qr = QuantumRegister(2)
+        cr = ClassicalRegister(2)
+        circuit_in = QuantumCircuit(qr, cr)
+        circuit_in.h(qr[0])
+        circuit_in.cx(qr[0], qr[1])
+        circuit_in.measure(qr, cr)
+        circuit_in.x(qr[1]).c_if(cr, 0x1)
+        dag = circuit_to_dag(circuit_in, copy_operations=False)
+        for node, (instruction, _, _) in zip(dag.topological_op_nodes(), circuit_in.data):
+            self.assertIs(node.op, instruction)
+
+        circuit_out = dag_to_circuit(dag, copy_operations=False)
+        self.assertEqual(circuit_out, circuit_in)
+        for (instruction_out, _, _), (instruction_in, _, _) in zip(circuit_out.data,
+                                                                   circuit_in.data):
+            self.assertIs(instruction_out, instruction_in)
+
+    def test_dag_to_circuit_shared_operations_condition(self):
+        """Check an operation whose node condition differs is copied"""
+        qr = QuantumRegister(1)
+        cr = ClassicalRegister(1)
+        circuit_in = QuantumCircuit(qr, cr)
+        circuit_in.x(qr[0])
+        dag = circuit_to_dag(circuit_in, copy_operations=False)
+        node = dag.op_nodes()[0]
+        node.condition = (cr, 1)
+
+        circuit_out = dag_to_circuit(dag, copy_operations=False)
+        instruction_out = circuit_out.data[0][0]
+        self.assertIsNot(instruction_out, node.op)
+        self.assertEqual(instruction_out.condition, (cr, 1))
+        self.assertIsNone(node.op.condition)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -12,13 +12,14 @@
 
 """Test for the DAGCircuit object"""
 
+import copy
 import unittest
 
 from ddt import ddt, data
 
 import retworkx as rx
 
-from qiskit.dagcircuit import DAGCircuit
+from qiskit.dagcircuit import DAGCircuit, DAGNode, DAGLayer
 from qiskit.circuit import QuantumRegister
 from qiskit.circuit import ClassicalRegister, Clbit
 from qiskit.circuit import QuantumCircuit
@@ -348,6 +349,49 @@ class TestDagApplyOperation(QiskitTestCase):
 
         self.assertIn(reset_node, set(self.dag.predecessors(h_node)))
 
+    def test_apply_operations_back(self):
+        """Applying operations in bulk builds the graph apply_operation_back() builds."""
+        x_gate = XGate()
+        x_gate.condition = self.condition
+        self.dag.apply_operation_back(HGate(), [self.qubit2], [])
+        operations = [(HGate(), [self.qubit0], []),
+                      (CXGate(), [self.qubit0, self.qubit1], []),
+                      (Measure(), [self.qubit1], [self.clbit1]),
+                      (x_gate, [self.qubit1], []),
+                      (CXGate(), [self.qubit2, self.qubit0], []),
+                      (Measure(), [self.qubit0], [self.clbit0])]
+
+        expected = copy.deepcopy(self.dag)
+        for op, qargs, cargs in operations:
+            expected.apply_operation_back(copy.deepcopy(op), qargs, cargs)
+        self.dag._apply_operations_back(operations)
+
+        raise_if_dagcircuit_invalid(self.dag)
+        self.assertEqual(self.dag, expected)
+        for node_id in expected._multi_graph.node_indexes():
+            self.assertEqual(self.dag._multi_graph.successor_indices(node_id),
+                             expected._multi_graph.successor_indices(node_id))
+            self.assertEqual(self.dag._multi_graph.predecessor_indices(node_id),
+                             expected._multi_graph.predecessor_indices(node_id))
+
+    def test_apply_operations_back_invalid_bit(self):
+        """Applying operations in bulk on a bit not in the circuit raises."""
+        qubit = QuantumRegister(1, 'qr2')[0]
+        clbit = ClassicalRegister(1, 'cr2')[0]
+        with self.assertRaises(DAGCircuitError):
+            self.dag._apply_operations_back([(HGate(), [self.qubit0], []),
+                                             (HGate(), [qubit], [])])
+        self.assertEqual(self.dag.size(), 0)
+        self.assertEqual(list(self.dag.topological_op_nodes()), [])
+
+        with self.assertRaises(DAGCircuitError):
+            self.dag._apply_operations_back([(HGate(), [self.qubit0], []),
+                                             (Measure(), [self.qubit1], [clbit])])
+        self.assertEqual(self.dag.size(), 0)
+
+        self.dag._apply_operations_back([(HGate(), [self.qubit0], [])])
+        self.assertEqual([node.name for node in self.dag.topological_op_nodes()], ['h'])
+
 
 class TestDagNodeSelection(QiskitTestCase):
     """Test methods that select certain dag nodes"""
@@ -571,6 +615,35 @@ class TestDagNodeSelection(QiskitTestCase):
                     ('h', [self.qubit2])]
         self.assertEqual(expected, [(i.name, i.qargs) for i in named_nodes])
 
+    def test_topological_nodes_sort_key_order(self):
+        """The topological_nodes() method orders the nodes like their sort_key"""
+        qr_a = QuantumRegister(12, 'a')
+        qr_b = QuantumRegister(3, 'b')
+        cr = ClassicalRegister(2, 'c')
+        circuit = QuantumCircuit(qr_b, qr_a, cr)
+        circuit.h(qr_a[11])
+        circuit.h(qr_a[1])
+        circuit.cx(qr_a[1], qr_b[0])
+        circuit.cx(qr_b[2], qr_a[10])
+        circuit.x(qr_a[2])
+        circuit.barrier(qr_a[10], qr_a[1])
+        circuit.ccx(qr_a[1], qr_a[10], qr_a[2])
+        circuit.measure(qr_b[1], cr[0])
+        circuit.x(qr_a[0]).c_if(cr, 1)
+        dag = circuit_to_dag(circuit)
+
+        expected = rx.lexicographical_topological_sort(dag._multi_graph,
+                                                       key=lambda x: x.sort_key)
+        self.assertEqual([node._node_id for node in expected],
+                         [node._node_id for node in dag.topological_nodes()])
+
+        dag.add_qreg(QuantumRegister(1, 'a0'))
+        dag.apply_operation_back(CXGate(), [dag.qubits[-1], qr_a[0]], [])
+        expected = rx.lexicographical_topological_sort(dag._multi_graph,
+                                                       key=lambda x: x.sort_key)
+        self.assertEqual([node._node_id for node in expected],
+                         [node._node_id for node in dag.topological_nodes()])
+
     def test_dag_nodes_on_wire(self):
         """Test that listing the gates on a qubit/classical bit gets the correct gates"""
         self.dag.apply_operation_back(CXGate(), [self.qubit0, self.qubit1], [])
@@ -766,6 +839,58 @@ class TestDagLayers(QiskitTestCase):
             comp = [(nd.type, nd.name, nd._node_id) for nd in dag1.topological_nodes()]
             self.assertEqual(comp, truth)
 
+    def test_layers_view(self):
+        """The layers are views on the nodes of the DAG, built as a DAG on demand."""
+        qreg = QuantumRegister(3, 'qr')
+        creg = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qreg, creg)
+        circuit.h(qreg[0])
+        circuit.cx(qreg[1], qreg[2])
+        circuit.barrier(qreg)
+        circuit.measure(qreg[0], creg[0])
+        dag = circuit_to_dag(circuit)
+
+        layers = list(dag.layers())
+        self.assertEqual(3, len(layers))
+        self.assertIsInstance(layers[0], DAGLayer)
+        self.assertIsNone(layers[0]._graph)
+
+        op_nodes = dag.op_nodes()
+        self.assertEqual([op_nodes[:2], op_nodes[2:3], op_nodes[3:]],
+                         [layer.nodes for layer in layers])
+        self.assertEqual([[[qreg[0]], [qreg[1], qreg[2]]], [], [[qreg[0]]]],
+                         [layer.partition for layer in layers])
+        self.assertEqual(['graph', 'partition'], list(layers[0]))
+        self.assertIs(layers[0].partition, layers[0]['partition'])
+
+        graph = layers[0]['graph']
+        self.assertIs(graph, layers[0].graph)
+        self.assertEqual(graph.qubits, dag.qubits)
+        self.assertEqual(graph.clbits, dag.clbits)
+        self.assertEqual(['h', 'cx'], [node.name for node in graph.op_nodes()])
+        self.assertTrue(all(DAGNode.semantic_eq(node, layer_node)
+                            for node, layer_node in zip(layers[0].nodes, graph.op_nodes())))
+        self.assertIs(graph.op_nodes()[0].op, layers[0].nodes[0].op)
+
+    def test_serial_layers_view(self):
+        """The serial layers are views on each op node of the DAG."""
+        qreg = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qreg)
+        circuit.h(qreg[0])
+        circuit.barrier(qreg)
+        circuit.cx(qreg[0], qreg[1])
+        dag = circuit_to_dag(circuit)
+
+        layers = list(dag.serial_layers())
+        self.assertEqual([[node] for node in dag.topological_op_nodes()],
+                         [layer.nodes for layer in layers])
+        self.assertEqual([[[qreg[0]]], [], [[qreg[0], qreg[1]]]],
+                         [layer['partition'] for layer in layers])
+
+        graph = layers[2]['graph']
+        self.assertEqual(['cx'], [node.name for node in graph.op_nodes()])
+        self.assertIsNot(graph.op_nodes()[0].op, layers[2].nodes[0].op)
+
 
 class TestCircuitSpecialCases(QiskitTestCase):
     """DAGCircuit test for special cases, usually for regression."""
@@ -1126,6 +1251,33 @@ class TestDagProperties(QiskitTestCase):
         dag = circuit_to_dag(qc)
         self.assertEqual(dag.depth(), 6)
 
+    def test_cached_properties_follow_changes(self):
+        """The cached order, depth and wire nodes of a DAG are updated when it changes."""
+
+        def _properties(dag):
+            return ([node.name for node in dag.topological_nodes()],
+                    dag.depth(),
+                    [sorted(node.name for node in layer) for layer in dag.multigraph_layers()],
+                    {wire: [node.name for node in dag.nodes_on_wire(wire)]
+                     for wire in dag.wires})
+
+        qubits = self.dag.qubits
+        changes = [
+            lambda: self.dag.remove_op_node(self.dag.named_nodes('t')[0]),
+            lambda: self.dag.apply_operation_back(XGate(), [qubits[0]], []),
+            lambda: self.dag.apply_operation_front(XGate(), [qubits[3]], []),
+            lambda: self.dag.substitute_node(self.dag.named_nodes('ch')[0], CZGate()),
+            lambda: self.dag.substitute_node_with_dag(
+                self.dag.named_nodes('ccx')[0], circuit_to_dag(QuantumCircuit(3))),
+            lambda: self.dag.add_qreg(QuantumRegister(1, 'qr2')),
+        ]
+        for change in changes:
+            _properties(self.dag)
+            change()
+            uncached_dag = copy.deepcopy(self.dag)
+            uncached_dag._cache.clear()
+            self.assertEqual(_properties(self.dag), _properties(uncached_dag))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -14,6 +14,8 @@
 
 import copy
 
+import numpy as np
+
 from qiskit.test.mock import FakeOurense
 from qiskit.test.mock import FakeProvider
 from qiskit.test import QiskitTestCase
@@ -92,6 +94,47 @@ class BackendpropertiesTestCase(QiskitTestCase):
         self.assertEqual(self.properties.readout_error(0),
                          self.properties._qubits[0]['readout_error'][0])
 
+    def test_qubit_property_array(self):
+        """Test for getting a property of all the qubits as an array."""
+        values = self.properties.qubit_property_array('readout_error')
+        self.assertEqual(values.tolist(), [self.properties.readout_error(qubit)
+                                           for qubit in range(len(self.properties.qubits))])
+        self.assertFalse(values.flags.writeable)
+        self.assertIs(self.properties.qubit_property_array('readout_error'), values)
+        self.assertTrue(np.isnan(self.properties.qubit_property_array('gate_error')).all())
+
+    def test_qubit_property_array_follows_changes(self):
+        """Test the qubit property array follows changes to the qubits list."""
+        properties = copy.deepcopy(self.properties)
+        readout_errors = properties.qubit_property_array('readout_error')
+
+        del properties.qubits[1]
+
+        self.assertEqual(properties.qubit_property_array('readout_error').tolist(),
+                         np.delete(readout_errors, 1).tolist())
+
+    def test_gate_property_index(self):
+        """Test for getting a property of all the gates indexed by name and qubits."""
+        errors = self.properties.gate_property_index('gate_error')
+        for gate in self.properties.gates:
+            self.assertEqual(errors[(gate.gate, tuple(gate.qubits))],
+                             self.properties.gate_error(gate.gate, gate.qubits))
+        self.assertIs(self.properties.gate_property_index('gate_error'), errors)
+        with self.assertRaises(TypeError):
+            errors[('cx', (0, 1))] = 0
+        self.assertEqual(len(self.properties.gate_property_index('T1')), 0)
+
+    def test_gate_property_index_follows_changes(self):
+        """Test the gate property index follows changes to the gates list."""
+        properties = copy.deepcopy(self.properties)
+        self.assertIn(('cx', (0, 1)), properties.gate_property_index('gate_error'))
+
+        properties.gates = [gate for gate in properties.gates if 1 not in gate.qubits]
+
+        errors = properties.gate_property_index('gate_error')
+        self.assertNotIn(('cx', (0, 1)), errors)
+        self.assertEqual(len(errors), len(properties.gates))
+
     def test_apply_prefix(self):
         """Testing unit conversions."""
         self.assertEqual(self.properties._apply_prefix(71.9500421005539, 'µs'),
@@ -14,9 +14,14 @@
 import os
 import time
 
-from qiskit.tools.parallel import parallel_map
+import numpy as np
+
+from qiskit.tools import parallel
+from qiskit.tools.parallel import (parallel_map, parallel_imap, start_process_pool,
+                                   shutdown_process_pool)
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.pulse import Schedule
+from qiskit.exceptions import QiskitError
 from qiskit.test import QiskitTestCase
 
 
@@ -38,6 +43,10 @@ def _build_simple_schedule(_):
     return Schedule()
 
 
+def _worker_pid(_):
+    return os.getpid()
+
+
 class TestParallel(QiskitTestCase):
     """A class for testing parallel_map functionality.
     """
@@ -57,8 +66,98 @@ class TestParallel(QiskitTestCase):
         names = [circ.name for circ in out_circs]
         self.assertEqual(len(names), len(set(names)))
 
+    def test_parallel_numpy_values(self):
+        """Verify parallel_map with a numpy array of values"""
+        ans = parallel_map(_parfunc, np.arange(3), num_processes=2)
+        self.assertEqual(ans, [0, 1, 2])
+
+    def test_split_values(self):
+        """Verify values are split in small ordered chunks"""
+        chunks = parallel._split_values(list(range(10)), 2)
+        self.assertEqual(chunks, [[0, 1], [2, 3], [4, 5], [6, 7], [8, 9]])
+        self.assertEqual(parallel._split_values([0, 1], 4), [[0], [1]])
+
     def test_parallel_schedule_names(self):
         """Verify unique schedule names in parallel"""
         out_schedules = parallel_map(_build_simple_schedule, list(range(10)))
         names = [schedule.name for schedule in out_schedules]
         self.assertEqual(len(names), len(set(names)))
+
+
+class TestParallelImap(QiskitTestCase):
+    """Tests for the lazy parallel_imap."""
+
+    def test_parallel_imap_ordered(self):
+        """Verify parallel_imap yields results in order from a generator"""
+        values = (value for value in range(7))
+        ans = parallel_imap(_parfunc, values, num_processes=2, chunk_size=2, max_in_flight=2)
+        self.assertEqual(list(ans), list(range(7)))
+
+    def test_parallel_imap_unordered(self):
+        """Verify parallel_imap with ordered=False yields every result"""
+        ans = parallel_imap(_parfunc, range(5), num_processes=2, ordered=False)
+        self.assertEqual(sorted(ans), list(range(5)))
+        self.assertEqual(os.getenv('QISKIT_IN_PARALLEL', None), 'FALSE')
+
+    def test_parallel_imap_serial(self):
+        """Verify parallel_imap runs serially with a single process"""
+        ans = parallel_imap(_worker_pid, range(3), num_processes=1)
+        self.assertEqual(list(ans), [os.getpid()] * 3)
+
+    def test_parallel_imap_bad_chunk_size(self):
+        """Verify parallel_imap rejects a non positive chunk size"""
+        with self.assertRaises(QiskitError):
+            next(parallel_imap(_parfunc, range(3), chunk_size=0))
+
+    def test_parallel_imap_persistent_pool(self):
+        """Verify parallel_imap uses the persistent pool when it is running"""
+        start_process_pool(2)
+        self.addCleanup(shutdown_process_pool)
+        pool = parallel._SHARED_POOL
+        ans = list(parallel_imap(_worker_pid, range(4), num_processes=2))
+        self.assertNotIn(os.getpid(), ans)
+        self.assertIs(parallel._SHARED_POOL, pool)
+
+
+class TestProcessPool(QiskitTestCase):
+    """Tests for the persistent process pool used by parallel_map."""
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(shutdown_process_pool)
+
+    def test_pool_reused_across_calls(self):
+        """Verify the same workers run consecutive parallel_map calls."""
+        start_process_pool(2)
+        first = set(parallel_map(_worker_pid, list(range(10)), num_processes=2))
+        second = set(parallel_map(_worker_pid, list(range(10)), num_processes=2))
+        self.assertNotIn(os.getpid(), first)
+        self.assertLessEqual(len(first | second), 2)
+        self.assertEqual(os.getenv('QISKIT_IN_PARALLEL', None), 'FALSE')
+
+    def test_pool_results_in_order(self):
+        """Verify results from the persistent pool keep the input order."""
+        start_process_pool(2)
+        ans = parallel_map(_parfunc, list(range(4)), num_processes=2)
+        self.assertEqual(ans, list(range(4)))
+
+    def test_shutdown_pool(self):
+        """Verify parallel_map works again after shutting the pool down."""
+        start_process_pool(2)
+        pids = set(parallel_map(_worker_pid, list(range(4)), num_processes=2))
+        shutdown_process_pool()
+        self.assertIsNone(parallel._SHARED_POOL)
+        new_pids = set(parallel_map(_worker_pid, list(range(4)), num_processes=2))
+        self.assertTrue(pids.isdisjoint(new_pids))
+
+    def test_pool_restarted_after_fork(self):
+        """Verify a pool owned by another process is not reused."""
+        start_process_pool(2)
+        pids = set(parallel_map(_worker_pid, list(range(4)), num_processes=2))
+        inherited = parallel._SHARED_POOL
+        parallel._SHARED_POOL_PID = -1
+        new_pids = set(parallel_map(_worker_pid, list(range(4)), num_processes=2))
+        self.assertIsNot(parallel._SHARED_POOL, inherited)
+        self.assertEqual(parallel._SHARED_POOL_PID, os.getpid())
+        self.assertTrue(pids.isdisjoint(new_pids))
+        inherited.shutdown()
@@ -228,6 +228,98 @@ class TestBasisTranslator(QiskitTestCase):
 
         self.assertEqual(actual, expected_dag)
 
+    def test_reuse_translation_across_circuits(self):
+        """Verify translations reused across circuits are bound to each circuit's parameters."""
+        eq_lib = EquivalenceLibrary()
+
+        theta = Parameter('theta')
+        gate = OneQubitOneParamGate(theta)
+        equiv = QuantumCircuit(1)
+        equiv.append(OneQubitTwoParamGate(theta, pi/2), [0])
+
+        eq_lib.add_equivalence(gate, equiv)
+
+        for param in [pi, pi/4, pi]:
+            qc = QuantumCircuit(1)
+            qc.append(OneQubitOneParamGate(param), [0])
+            qc.append(OneQubitOneParamGate(2 * param), [0])
+            dag = circuit_to_dag(qc)
+
+            expected = QuantumCircuit(1)
+            expected.append(OneQubitTwoParamGate(param, pi/2), [0])
+            expected.append(OneQubitTwoParamGate(2 * param, pi/2), [0])
+            expected_dag = circuit_to_dag(expected)
+
+            pass_ = BasisTranslator(eq_lib, ['1q2p'])
+            actual = pass_.run(dag)
+
+            self.assertEqual(actual, expected_dag)
+
+    def test_library_changes_invalidate_translation(self):
+        """Verify changes to the library, or to its base, are used by later translations."""
+        base_lib = EquivalenceLibrary()
+        eq_lib = EquivalenceLibrary(base=base_lib)
+
+        qc = QuantumCircuit(1)
+        qc.append(OneQubitZeroParamGate(), [0])
+
+        with self.assertRaises(TranspilerError):
+            BasisTranslator(eq_lib, ['1q1p']).run(circuit_to_dag(qc))
+
+        equiv = QuantumCircuit(1)
+        equiv.append(OneQubitOneParamGate(pi), [0])
+        base_lib.add_equivalence(OneQubitZeroParamGate(), equiv)
+
+        expected = QuantumCircuit(1)
+        expected.append(OneQubitOneParamGate(pi), [0])
+
+        actual = BasisTranslator(eq_lib, ['1q1p']).run(circuit_to_dag(qc))
+        self.assertEqual(actual, circuit_to_dag(expected))
+
+        equiv = QuantumCircuit(1)
+        equiv.append(OneQubitOneParamGate(pi/2), [0])
+        eq_lib.set_entry(OneQubitZeroParamGate(), [equiv])
+
+        expected = QuantumCircuit(1)
+        expected.append(OneQubitOneParamGate(pi/2), [0])
+
+        actual = BasisTranslator(eq_lib, ['1q1p']).run(circuit_to_dag(qc))
+        self.assertEqual(actual, circuit_to_dag(expected))
+
+    def test_reused_translation_does_not_share_ops(self):
+        """Verify circuits translated with a reused translation do not share ops."""
+        eq_lib = EquivalenceLibrary()
+
+        single = QuantumCircuit(1)
+        single.append(OneQubitOneParamGate(pi), [0])
+        eq_lib.add_equivalence(OneQubitZeroParamGate(), single)
+
+        double = QuantumCircuit(2)
+        double.append(OneQubitOneParamGate(pi), [0])
+        double.append(OneQubitOneParamGate(pi), [1])
+        eq_lib.add_equivalence(TwoQubitZeroParamGate(), double)
+
+        qc = QuantumCircuit(2)
+        qc.append(OneQubitZeroParamGate(), [0])
+        qc.append(TwoQubitZeroParamGate(), [0, 1])
+
+        pass_ = BasisTranslator(eq_lib, ['1q1p'])
+        first = pass_.run(circuit_to_dag(qc))
+        second = pass_.run(circuit_to_dag(qc))
+
+        first_ops = [node.op for node in first.op_nodes()]
+        second_ops = [node.op for node in second.op_nodes()]
+        self.assertEqual(len(first_ops), 3)
+        for first_op, second_op in zip(first_ops, second_ops):
+            self.assertIsNot(first_op, second_op)
+
+        for op in first_ops:
+            op.params[0] = pi/2
+
+        third = pass_.run(circuit_to_dag(qc))
+        self.assertEqual(second, third)
+        self.assertEqual([node.op.params for node in third.op_nodes()], [[pi]] * 3)
+
 
 class TestUnrollerCompatability(QiskitTestCase):
     """Tests backward compatability with the Unroller pass.
@@ -13,11 +13,18 @@
 
 """Commutation analysis and transformation pass testing"""
 
+import itertools
 import unittest
 
 from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.circuit.library import (CXGate, CCXGate, CYGate, CZGate, RXGate, RYGate, RZGate,
+                                    RZXGate, RZZGate, SXGate)
+from qiskit.compiler import transpile
+from qiskit.quantum_info import Operator
 from qiskit.transpiler import PropertySet
 from qiskit.transpiler.passes import CommutationAnalysis
+from qiskit.transpiler.passes.optimization.commutation_analysis import (
+    _commute_by_bases, _commute_by_matrix)
 from qiskit.converters import circuit_to_dag
 from qiskit.test import QiskitTestCase
 
@@ -284,6 +291,74 @@ class TestCommutationAnalysis(QiskitTestCase):
                     'qr[4]': [[8], [12, 15, 18], [9]]}
         self.assertCommutationSet(self.pset["commutation_set"], expected)
 
+    def test_commutation_depends_on_params(self):
+        """Test gates only commuting for some parameters are told apart"""
+        qr = QuantumRegister(1, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.x(qr[0])
+        circuit.rz(0, qr[0])
+        circuit.x(qr[0])
+        circuit.rz(0.5, qr[0])
+        circuit.x(qr[0])
+        circuit.rz(0, qr[0])
+        dag = circuit_to_dag(circuit)
+
+        self.pass_.run(dag)
+
+        expected = {'qr[0]': [[0], [2, 3, 4], [5], [6, 7], [1]]}
+        self.assertCommutationSet(self.pset["commutation_set"], expected)
+        self.assertIs(CommutationAnalysis().cache, self.pass_.cache)
+
+    def test_diagonal_bases_rule(self):
+        """Test gates commuting by the diagonal bases rule commute"""
+        gates = [CXGate(), CCXGate(), CYGate(), CZGate(), RXGate(0.1), RYGate(0.2), RZGate(0.3),
+                 RZXGate(0.4), RZZGate(0.5), SXGate()]
+        for gate1, gate2 in itertools.product(gates, repeat=2):
+            qarg1 = tuple(range(gate1.num_qubits))
+            for qarg2 in itertools.permutations(range(4), gate2.num_qubits):
+                if not set(qarg1) & set(qarg2):
+                    continue
+                with self.subTest(gate1=gate1.name, gate2=gate2.name, qarg2=qarg2):
+                    if _commute_by_bases(gate1, qarg1, gate2, qarg2):
+                        self.assertTrue(_commute_by_matrix(gate1, qarg1, gate2, qarg2, 4))
+                    elif {gate1.name, gate2.name} <= {'cx', 'ccx', 'cy', 'cz', 'rzz'}:
+                        self.assertFalse(_commute_by_matrix(gate1, qarg1, gate2, qarg2, 4))
+
+    def test_custom_gates_with_same_name(self):
+        """Test custom gates sharing a name but not a matrix are not confused"""
+        for definition, expected in [('z', [[0], [2, 3, 4, 5], [1]]),
+                                     ('h', [[0], [2], [3], [4], [5], [1]])]:
+            with self.subTest(definition=definition):
+                oracle = QuantumCircuit(1, name='oracle')
+                getattr(oracle, definition)(0)
+                qr = QuantumRegister(1, 'qr')
+                circuit = QuantumCircuit(qr)
+                circuit.append(oracle.to_gate(), [qr[0]])
+                circuit.t(qr[0])
+                circuit.append(oracle.to_gate(), [qr[0]])
+                circuit.t(qr[0])
+
+                self.pass_.run(circuit_to_dag(circuit))
+
+                self.assertCommutationSet(self.pset["commutation_set"], {'qr[0]': expected})
+
+    def test_transpile_custom_gates_with_same_name(self):
+        """Test transpiling circuits with custom gates sharing a name in one process"""
+        for definition in ['z', 'h']:
+            with self.subTest(definition=definition):
+                oracle = QuantumCircuit(1, name='oracle')
+                getattr(oracle, definition)(0)
+                circuit = QuantumCircuit(1)
+                circuit.append(oracle.to_gate(), [0])
+                circuit.t(0)
+                circuit.append(oracle.to_gate(), [0])
+                circuit.t(0)
+
+                transpiled = transpile(circuit, basis_gates=['u1', 'u2', 'u3', 'cx', 'oracle'],
+                                       optimization_level=2)
+
+                self.assertTrue(Operator(transpiled).equiv(Operator(circuit)))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -18,6 +18,7 @@ import unittest
 import numpy as np
 
 from qiskit.circuit import QuantumCircuit, QuantumRegister
+from qiskit.circuit.library import CRYGate, CXGate, CZGate, HGate, RZGate, SwapGate, SXGate
 from qiskit.extensions import UnitaryGate
 from qiskit.converters import circuit_to_dag
 from qiskit.execute import execute
@@ -76,6 +77,34 @@ class TestConsolidateBlocks(QiskitTestCase):
                                                                      [0, 0, 1, 0]]))
         self.assertAlmostEqual(fidelity, 1.0, places=7)
 
+    def test_block_unitary(self):
+        """the unitary of a block mixing gates on either wire order is correct"""
+        gates = [(HGate(), [1]),
+                 (CXGate(), [1, 0]),
+                 (RZGate(0.3), [0]),
+                 (CXGate(), [0, 1]),
+                 (CXGate(ctrl_state=0), [1, 0]),
+                 (CRYGate(0.7), [1, 0]),
+                 (SXGate(), [1]),
+                 (UnitaryGate(Operator(SwapGate()).compose(CZGate())), [0, 1]),
+                 (CXGate(), [1, 0])]
+        qr = QuantumRegister(3, "qr")
+        qc = QuantumCircuit(qr)
+        expected = QuantumCircuit(2)
+        for gate, qargs in gates:
+            qc.append(gate, [qr[2 * i] for i in qargs])
+            expected.append(gate, qargs)
+        dag = circuit_to_dag(qc)
+
+        pass_ = ConsolidateBlocks(force_consolidate=True)
+        pass_.property_set['block_list'] = [list(dag.topological_op_nodes())]
+        new_dag = pass_.run(dag)
+
+        new_node = new_dag.op_nodes()[0]
+        self.assertEqual(len(new_dag.op_nodes()), 1)
+        self.assertEqual(new_node.qargs, [qr[0], qr[2]])
+        self.assertEqual(Operator(new_node.op), Operator(expected))
+
     def test_topological_order_preserved(self):
         """the original topological order of nodes is preserved
                                                      ______
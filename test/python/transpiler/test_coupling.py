@@ -12,6 +12,8 @@
 
 # pylint: disable=missing-docstring
 
+import networkx as nx
+
 from qiskit.transpiler import CouplingMap
 from qiskit.transpiler.exceptions import CouplingError
 from qiskit.test.mock import FakeRueschlikon
@@ -43,6 +45,31 @@ class CouplingTest(QiskitTestCase):
         self.assertIsInstance(result, int)
         self.assertEqual(1, result)
 
+    def test_distance_matrix(self):
+        """Test the distance matrix of a coupling map."""
+        coupling = CouplingMap.from_line(4)
+        expected = [[0, 1, 2, 3], [1, 0, 1, 2], [2, 1, 0, 1], [3, 2, 1, 0]]
+        self.assertEqual(coupling.distance_matrix.tolist(), expected)
+        coupling.add_edge(0, 3)
+        self.assertEqual(coupling.distance_matrix[0, 3], 1)
+
+    def test_distance_matrix_matches_shortest_paths(self):
+        coupling = CouplingMap(FakeRueschlikon().configuration().coupling_map)
+        undirected = coupling.graph.to_undirected()
+        for source, lengths in nx.all_pairs_shortest_path_length(undirected):
+            for target, length in lengths.items():
+                self.assertEqual(coupling.distance(source, target), length)
+
+    def test_distance_matrix_shared(self):
+        coupling = CouplingMap([[0, 1], [1, 2], [2, 3]])
+        other = CouplingMap([[2, 3], [0, 1], [1, 2]])
+        self.assertIs(coupling.distance_matrix, other.distance_matrix)
+        self.assertFalse(coupling.distance_matrix.flags.writeable)
+        other.add_edge(3, 0)
+        self.assertIsNot(coupling.distance_matrix, other.distance_matrix)
+        self.assertEqual(coupling.distance(0, 3), 3)
+        self.assertEqual(other.distance(0, 3), 1)
+
     def test_add_physical_qubits(self):
         coupling = CouplingMap()
         self.assertEqual("", str(coupling))
@@ -13,8 +13,11 @@
 """Test the DenseLayout pass"""
 
 import unittest
+from datetime import datetime
 
 from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.providers.models import BackendProperties
+from qiskit.providers.models.backendproperties import Nduv, Gate
 from qiskit.transpiler import CouplingMap
 from qiskit.transpiler.passes import DenseLayout
 from qiskit.converters import circuit_to_dag
@@ -70,6 +73,33 @@ class TestDenseLayout(QiskitTestCase):
         self.assertEqual(layout[qr1[1]], 1)
         self.assertEqual(layout[qr1[2]], 0)
 
+    def test_cx_errors(self):
+        """Test the qubits with the lowest CX error are selected.
+        """
+        calib_time = datetime(year=2019, month=2, day=1, hour=0, minute=0, second=0)
+        qubits = [[Nduv(date=calib_time, name='readout_error', unit='', value=0.01)]
+                  for _ in range(3)]
+        gates = [Gate(name='cx0_1', gate='cx', qubits=[0, 1],
+                      parameters=[Nduv(date=calib_time, name='gate_error', unit='',
+                                       value=0.2)]),
+                 Gate(name='cx1_2', gate='cx', qubits=[1, 2],
+                      parameters=[Nduv(date=calib_time, name='gate_error', unit='',
+                                       value=0.01)])]
+        properties = BackendProperties(last_update_date=calib_time,
+                                       backend_name='test_backend', backend_version='1.0.0',
+                                       qubits=qubits, gates=gates, general=[])
+
+        qr = QuantumRegister(2, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+
+        dag = circuit_to_dag(circuit)
+        pass_ = DenseLayout(CouplingMap([[0, 1], [1, 2]]), properties)
+        pass_.run(dag)
+
+        layout = pass_.property_set['layout']
+        self.assertEqual({layout[qr[0]], layout[qr[1]]}, {1, 2})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -19,7 +19,8 @@ from qiskit.compiler import transpile
 from qiskit.test import QiskitTestCase
 from qiskit.converters import circuit_to_dag
 from qiskit.circuit.library import CXGate
-from qiskit.transpiler import TranspilerError
+from qiskit.transpiler import TranspilerError, CouplingMap
+from qiskit.transpiler.passes import DenseLayout
 from ..providers.faulty_backends import FakeOurenseFaultyQ1, FakeOurenseFaultyCX01, \
     FakeOurenseFaultyCX13
 
@@ -244,6 +245,19 @@ class TestFaultyQ1(TestFaultyBackendCase):
 
         self.assertEqual(context.exception.message, message)
 
+    def test_dense_layout(self):
+        """Test DenseLayout with the properties of a faulty Q1 pruned like in transpile"""
+        properties = FakeOurenseFaultyQ1().properties()
+        del properties.qubits[1]
+        coupling_map = CouplingMap([[0, 1], [1, 0]])
+        circuit = QuantumCircuit(QuantumRegister(2, 'qr'))
+        circuit.cx(0, 1)
+        circuit.measure_all()
+
+        pass_ = DenseLayout(coupling_map, properties)
+        pass_.run(circuit_to_dag(circuit))
+        self.assertEqual(set(pass_.property_set['layout'].get_physical_bits()), {0, 1})
+
 
 class TestFaultyQ1Unpickable(TestFaultyBackendCase):
     """See:
@@ -12,12 +12,17 @@
 
 """Tests PassManager.run()"""
 
+from functools import partial
+from unittest import mock
+
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.circuit.library import CXGate
 from qiskit.transpiler.preset_passmanagers import level_1_pass_manager
 from qiskit.test import QiskitTestCase
 from qiskit.test.mock import FakeMelbourne
-from qiskit.transpiler import Layout, CouplingMap
+from qiskit.tools.parallel import parallel_map, start_process_pool, shutdown_process_pool
+from qiskit.transpiler import Layout, CouplingMap, PassManager
+from qiskit.transpiler.passes import NoiseAdaptiveLayout
 from qiskit.transpiler.passmanager_config import PassManagerConfig
 
 
@@ -111,3 +116,41 @@ class TestPassManagerRun(QiskitTestCase):
             for gate, qargs, _ in new_circuit.data:
                 if isinstance(gate, CXGate):
                     self.assertIn([x.index for x in qargs], coupling_map)
+
+    def test_output_does_not_share_instructions(self):
+        """Test the output of a run does not share instructions with its input or other runs."""
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        pass_manager = level_1_pass_manager(PassManagerConfig(basis_gates=['u3', 'cx']))
+        first = pass_manager.run(circuit)
+        second = pass_manager.run(circuit)
+
+        input_ids = {id(instruction) for instruction, _, _ in circuit.data}
+        first_ids = {id(instruction) for instruction, _, _ in first.data}
+        second_ids = {id(instruction) for instruction, _, _ in second.data}
+        self.assertFalse(first_ids & input_ids)
+        self.assertFalse(first_ids & second_ids)
+
+    def test_stateful_pass_several_circuits(self):
+        """Test a stateful pass run on several circuits starts from a fresh pass each time."""
+        properties = FakeMelbourne().properties()
+        circuit_3q = QuantumCircuit(3)
+        circuit_3q.cx(0, 1)
+        circuit_3q.cx(1, 2)
+        circuit_2q = QuantumCircuit(2)
+        circuit_2q.cx(0, 1)
+        circuits = [circuit_3q, circuit_2q, circuit_3q, circuit_2q]
+
+        expected = [PassManager(NoiseAdaptiveLayout(properties)).run(circuit)
+                    for circuit in circuits]
+        new_circuits = PassManager(NoiseAdaptiveLayout(properties)).run(circuits)
+        self.assertEqual(new_circuits, expected)
+
+        # All the circuits are run by the same worker process.
+        start_process_pool(1)
+        self.addCleanup(shutdown_process_pool)
+        with mock.patch('qiskit.transpiler.passmanager.parallel_map',
+                        partial(parallel_map, num_processes=2)):
+            new_circuits = PassManager(NoiseAdaptiveLayout(properties)).run(circuits)
+        self.assertEqual(new_circuits, expected)
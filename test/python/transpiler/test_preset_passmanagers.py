@@ -296,8 +296,8 @@ class TestFinalLayouts(QiskitTestCase):
                           13: ancilla[8], 14: ancilla[9], 15: ancilla[10], 16: ancilla[11],
                           17: ancilla[12], 18: ancilla[13], 19: ancilla[14]}
 
-        dense_layout = {0: qr2[1], 1: qr1[2], 2: qr1[0], 3: ancilla[0], 4: ancilla[1], 5: qr2[0],
-                        6: qr1[1], 7: ancilla[2], 8: ancilla[3], 9: ancilla[4], 10: ancilla[5],
+        dense_layout = {2: qr2[1], 3: qr2[0], 4: qr1[0], 8: qr1[1], 9: qr1[2], 0: ancilla[0],
+                        1: ancilla[1], 5: ancilla[2], 6: ancilla[3], 7: ancilla[4], 10: ancilla[5],
                         11: ancilla[6], 12: ancilla[7], 13: ancilla[8], 14: ancilla[9],
                         15: ancilla[10], 16: ancilla[11], 17: ancilla[12], 18: ancilla[13],
                         19: ancilla[14]}
@@ -343,8 +343,8 @@ class TestFinalLayouts(QiskitTestCase):
                           13: ancilla[8], 14: ancilla[9], 15: ancilla[10], 16: ancilla[11],
                           17: ancilla[12], 18: ancilla[13], 19: ancilla[14]}
 
-        dense_layout = {2: qr[0], 6: qr[1], 1: qr[2], 5: qr[3], 0: qr[4], 3: ancilla[0],
-                        4: ancilla[1], 7: ancilla[2], 8: ancilla[3], 9: ancilla[4], 10: ancilla[5],
+        dense_layout = {4: qr[0], 8: qr[1], 9: qr[2], 3: qr[3], 2: qr[4], 0: ancilla[0],
+                        1: ancilla[1], 5: ancilla[2], 6: ancilla[3], 7: ancilla[4], 10: ancilla[5],
                         11: ancilla[6], 12: ancilla[7], 13: ancilla[8], 14: ancilla[9],
                         15: ancilla[10], 16: ancilla[11], 17: ancilla[12], 18: ancilla[13],
                         19: ancilla[14]}
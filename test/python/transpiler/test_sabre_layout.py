@@ -78,6 +78,32 @@ class TestSabreLayout(QiskitTestCase):
         self.assertEqual(layout[qr1[1]], 7)
         self.assertEqual(layout[qr1[2]], 5)
 
+    def test_trials_keep_best_layout(self):
+        """Test several layout trials keep the layout with the lowest cost."""
+        qr = QuantumRegister(5, 'q')
+        circuit = QuantumCircuit(qr)
+        for control, target in [(0, 1), (1, 2), (2, 3), (3, 4), (4, 0), (0, 2), (1, 3)]:
+            circuit.cx(qr[control], qr[target])
+        dag = circuit_to_dag(circuit)
+
+        single_pass = SabreLayout(CouplingMap(self.cmap20), seed=0)
+        single_pass.run(dag)
+
+        # The trials are scored in order, the first one uses the seed of the pass.
+        costs = []
+
+        def cost_function(routed_circuit):
+            costs.append(routed_circuit.count_ops().get('swap', 0))
+            return len(costs) - 1
+
+        pass_ = SabreLayout(CouplingMap(self.cmap20), seed=0, trials=4,
+                            cost_function=cost_function)
+        pass_.run(dag)
+
+        self.assertEqual(len(costs), 4)
+        self.assertEqual(pass_.property_set['layout'].get_physical_bits(),
+                         single_pass.property_set['layout'].get_physical_bits())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -16,6 +16,7 @@ import unittest
 from qiskit.transpiler.passes import SabreSwap
 from qiskit.transpiler import CouplingMap, PassManager
 from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.circuit.random import random_circuit
 from qiskit.test import QiskitTestCase
 
 
@@ -84,6 +85,46 @@ class TestSabreSwap(QiskitTestCase):
 
         self.assertEqual(new_qc.num_nonlocal_gates(), 7)
 
+    def test_routed_gates_are_on_coupled_qubits(self):
+        """Test every gate of a routed random circuit acts on coupled qubits."""
+        coupling = CouplingMap.from_grid(3, 4)
+        qr = QuantumRegister(12, 'q')
+        qc = QuantumCircuit(qr)
+        qc.compose(random_circuit(12, 10, max_operands=2, seed=5), inplace=True)
+
+        for heuristic in ('basic', 'lookahead', 'decay'):
+            passmanager = PassManager(SabreSwap(coupling, heuristic, seed=0))
+            new_qc = passmanager.run(qc)
+            edges = set(coupling.get_edges())
+            for _, qargs, _ in new_qc.data:
+                if len(qargs) == 2:
+                    self.assertIn((qargs[0].index, qargs[1].index), edges)
+            ops, expected_ops = dict(new_qc.count_ops()), dict(qc.count_ops())
+            self.assertGreaterEqual(ops.pop('swap'), expected_ops.pop('swap', 0))
+            self.assertEqual(ops, expected_ops)
+            self.assertEqual(sorted(passmanager.property_set['final_layout'].get_physical_bits()),
+                             list(range(12)))
+
+    def test_trials_keep_best_routing(self):
+        """Test routing with several trials keeps the routing with the lowest cost."""
+        coupling = CouplingMap.from_grid(3, 4)
+        qr = QuantumRegister(12, 'q')
+        qc = QuantumCircuit(qr)
+        qc.compose(random_circuit(12, 10, max_operands=2, seed=5), inplace=True)
+
+        single_qc = PassManager(SabreSwap(coupling, 'decay', seed=0)).run(qc)
+        best_qc = PassManager(SabreSwap(coupling, 'decay', seed=0, trials=4)).run(qc)
+        worst_qc = PassManager(SabreSwap(coupling, 'decay', seed=0, trials=4,
+                                         cost_function=lambda circuit: -circuit.size())).run(qc)
+
+        num_swaps = single_qc.count_ops()['swap']
+        self.assertLessEqual(best_qc.count_ops()['swap'], num_swaps)
+        self.assertGreaterEqual(worst_qc.count_ops()['swap'], num_swaps)
+        edges = set(coupling.get_edges())
+        for _, qargs, _ in best_qc.data:
+            if len(qargs) == 2:
+                self.assertIn((qargs[0].index, qargs[1].index), edges)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -18,6 +18,7 @@ from qiskit.transpiler import CouplingMap, PassManager
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.converters import circuit_to_dag, dag_to_circuit
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.circuit.random import random_circuit
 from qiskit.test import QiskitTestCase
 
 
@@ -534,6 +535,20 @@ class TestStochasticSwap(QiskitTestCase):
         after = circuit_to_dag(after)
         self.assertEqual(expected_dag, after)
 
+    def test_result_independent_of_num_threads(self):
+        """Test the trials give the same result whatever the number of threads."""
+        coupling = CouplingMap.from_grid(3, 4)
+        qr = QuantumRegister(12, 'q')
+        circuit = QuantumCircuit(qr)
+        circuit.compose(random_circuit(12, 10, max_operands=2, seed=3), inplace=True)
+
+        expected = PassManager(StochasticSwap(coupling, 50, 7, num_threads=1)).run(circuit)
+        for num_threads in (2, 3, 8):
+            with self.subTest(num_threads=num_threads):
+                after = PassManager(StochasticSwap(coupling, 50, 7,
+                                                   num_threads=num_threads)).run(circuit)
+                self.assertEqual(circuit_to_dag(expected), circuit_to_dag(after))
+
 
 if __name__ == '__main__':
     unittest.main()
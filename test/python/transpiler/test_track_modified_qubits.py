@@ -0,0 +1,166 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""TrackModifiedQubits pass testing"""
+
+import unittest
+
+from qiskit.circuit import QuantumCircuit, QuantumRegister
+from qiskit.circuit.library import U1Gate
+from qiskit.converters import circuit_to_dag
+from qiskit.transpiler import PassManager, PassManagerConfig, CouplingMap
+from qiskit.transpiler.basepasses import TransformationPass
+from qiskit.transpiler.passes import (TrackModifiedQubits, ConsolidateBlocks, Optimize1qGates,
+                                      CommutationAnalysis, CommutativeCancellation)
+from qiskit.transpiler.preset_passmanagers import level_3_pass_manager
+from qiskit.test import QiskitTestCase
+
+
+class TestTrackModifiedQubits(QiskitTestCase):
+    """ Tests for TrackModifiedQubits pass. """
+
+    def setUp(self):
+        self.pass_ = TrackModifiedQubits()
+        self.pset = self.pass_.property_set
+        self.dag = None  # The pass do not read the DAG.
+        self.qr = QuantumRegister(3, 'q')
+
+    def test_first_run_all_dirty(self):
+        """ All the qubits are dirty on the first run. """
+        self.pass_.run(self.dag)
+        self.assertIsNone(self.pset['dirty_qubits'])
+        self.assertEqual(self.pset['modified_qubits'], set())
+
+    def test_modified_qubits_become_dirty(self):
+        """ The qubits modified since the previous run are dirty. """
+        self.pass_.run(self.dag)
+        TrackModifiedQubits.mark_modified(self.pset, [self.qr[0]])
+        self.assertIsNone(self.pset['dirty_qubits'])
+        self.pass_.run(self.dag)
+        self.assertEqual(self.pset['dirty_qubits'], {self.qr[0]})
+        TrackModifiedQubits.mark_modified(self.pset, [self.qr[1]])
+        self.assertEqual(self.pset['dirty_qubits'], {self.qr[0], self.qr[1]})
+        self.pass_.run(self.dag)
+        self.assertEqual(self.pset['dirty_qubits'], {self.qr[1]})
+
+    def test_reset(self):
+        """ Reset stops tracking the modified qubits. """
+        self.pass_.run(self.dag)
+        self.pass_.run(self.dag)
+        TrackModifiedQubits.mark_modified(self.pset, [self.qr[0]])
+        reset_pass = TrackModifiedQubits(reset=True)
+        reset_pass.property_set = self.pset
+        reset_pass.run(self.dag)
+        self.assertIsNone(self.pset['dirty_qubits'])
+        self.assertIsNone(self.pset['modified_qubits'])
+
+    def test_mark_modified_untracked(self):
+        """ Marking qubits modified without tracking does nothing. """
+        TrackModifiedQubits.mark_modified(self.pset, [self.qr[0]])
+        self.assertIsNone(self.pset['modified_qubits'])
+        self.assertIsNone(self.pset['dirty_qubits'])
+
+    def test_optimize_clean_qubits_kept(self):
+        """ Optimize1qGates and CommutativeCancellation keep the gates on clean qubits. """
+        circuit = QuantumCircuit(self.qr)
+        circuit.u1(0.1, self.qr[0])
+        circuit.u1(0.2, self.qr[0])
+        circuit.u1(0.1, self.qr[1])
+        circuit.u1(0.2, self.qr[1])
+        circuit.cx(self.qr[1], self.qr[2])
+        circuit.cx(self.qr[1], self.qr[2])
+
+        for pass_ in [Optimize1qGates(), CommutativeCancellation()]:
+            dag = circuit_to_dag(circuit)
+            analysis = CommutationAnalysis()
+            analysis.property_set = pass_.property_set
+            analysis.run(dag)
+            pass_.property_set['dirty_qubits'] = {self.qr[0]}
+            pass_.property_set['modified_qubits'] = set()
+            dag = pass_.run(dag)
+            self.assertEqual(pass_.property_set['modified_qubits'], {self.qr[0]})
+            self.assertEqual(len(dag.op_nodes()), 5)
+            self.assertEqual(len(list(dag.nodes_on_wire(self.qr[0], only_ops=True))), 1)
+
+    def test_consolidate_clean_qubits_kept(self):
+        """ ConsolidateBlocks keeps the blocks on clean qubits. """
+        circuit = QuantumCircuit(self.qr)
+        circuit.cx(self.qr[0], self.qr[1])
+        circuit.cx(self.qr[0], self.qr[1])
+        circuit.h(self.qr[2])
+        circuit.h(self.qr[2])
+
+        dag = circuit_to_dag(circuit)
+        pass_ = ConsolidateBlocks(force_consolidate=True)
+        pass_.property_set['block_list'] = [list(dag.op_nodes())[:2], list(dag.op_nodes())[2:]]
+        pass_.property_set['dirty_qubits'] = {self.qr[2]}
+        pass_.property_set['modified_qubits'] = set()
+        result = pass_.run(dag)
+        self.assertEqual(pass_.property_set['modified_qubits'], {self.qr[2]})
+        self.assertEqual(result.count_ops(), {'cx': 2, 'unitary': 1})
+
+    def test_optimization_loop(self):
+        """ Each iteration only optimizes the qubits modified by the previous one. """
+        circuit = QuantumCircuit(self.qr)
+        circuit.u1(0.1, self.qr[0])
+        circuit.cx(self.qr[0], self.qr[1])
+        circuit.cx(self.qr[0], self.qr[1])
+        circuit.u1(0.2, self.qr[0])
+        circuit.u2(0.1, 0.2, self.qr[2])
+
+        dirty_qubits = []
+
+        def _record(property_set):
+            dirty_qubits.append(property_set['dirty_qubits'])
+            return len(dirty_qubits) < 3
+
+        pass_manager = PassManager()
+        pass_manager.append([TrackModifiedQubits(), Optimize1qGates(), CommutativeCancellation()],
+                            do_while=_record)
+        result = pass_manager.run(circuit)
+
+        self.assertEqual(dirty_qubits, [None, {self.qr[0], self.qr[1]}, set()])
+        self.assertEqual(result.count_ops(), {'u1': 1, 'u2': 1})
+
+    def test_passes_after_level3_loop(self):
+        """ The passes after the level 3 optimization loop optimize all the qubits. """
+
+        class _AddU1Pairs(TransformationPass):
+            """Add two u1 gates on every qubit, without recording them."""
+
+            def run(self, dag):
+                for qubit in dag.qubits:
+                    dag.apply_operation_back(U1Gate(0.1), [qubit])
+                    dag.apply_operation_back(U1Gate(0.2), [qubit])
+                return dag
+
+        circuit = QuantumCircuit(self.qr)
+        circuit.h(self.qr[0])
+        circuit.cx(self.qr[0], self.qr[1])
+        circuit.cx(self.qr[1], self.qr[2])
+
+        config = PassManagerConfig(basis_gates=['u1', 'u2', 'u3', 'cx'],
+                                   coupling_map=CouplingMap([[0, 1], [1, 2]]),
+                                   seed_transpiler=42)
+        pass_manager = level_3_pass_manager(config)
+        pass_manager.append([_AddU1Pairs(), Optimize1qGates()])
+        result = pass_manager.run(circuit)
+
+        self.assertIsNone(pass_manager.property_set['dirty_qubits'])
+        for qubit in result.qubits:
+            u1_gates = [inst for inst, qargs, _ in result.data
+                        if inst.name == 'u1' and qargs == [qubit]]
+            self.assertLessEqual(len(u1_gates), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
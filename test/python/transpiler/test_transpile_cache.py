@@ -0,0 +1,181 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the TranspileCache."""
+
+import os
+import tempfile
+
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit.circuit import Parameter
+from qiskit.compiler import transpile
+from qiskit.test import QiskitTestCase
+from qiskit.test.mock import FakeMelbourne
+from qiskit.transpiler import PassManager, TranspileCache
+from qiskit.transpiler.exceptions import TranspilerError
+
+
+def _circuit(theta, name='circuit', creg_name='c'):
+    qr = QuantumRegister(3, 'q')
+    cr = ClassicalRegister(3, creg_name)
+    circuit = QuantumCircuit(qr, cr, name=name)
+    circuit.h(qr[0])
+    circuit.rz(theta, qr[1])
+    circuit.cx(qr[0], qr[2])
+    circuit.cx(qr[1], qr[2])
+    circuit.measure(qr, cr)
+    return circuit
+
+
+class TestTranspileCache(QiskitTestCase):
+    """Tests for the TranspileCache."""
+
+    def setUp(self):
+        super().setUp()
+        self.backend = FakeMelbourne()
+
+    def test_hit_with_other_name(self):
+        """Test a circuit that only differs by its name is a cache hit."""
+        cache = TranspileCache()
+        first = transpile(_circuit(0.5, 'first'), self.backend, seed_transpiler=42, cache=cache)
+        second = transpile(_circuit(0.5, 'second'), self.backend, seed_transpiler=42,
+                           cache=cache)
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 1, 'size': 1})
+        self.assertEqual(second.name, 'second')
+        self.assertEqual(first, second)
+
+    def test_result_matches_transpile(self):
+        """Test cached circuits are the same as the transpiled ones."""
+        cache = TranspileCache()
+        transpile(_circuit(0.5), self.backend, seed_transpiler=42, cache=cache)
+        cached = transpile(_circuit(0.5), self.backend, seed_transpiler=42, cache=cache)
+        expected = transpile(_circuit(0.5), self.backend, seed_transpiler=42)
+        self.assertEqual(cached, expected)
+        qr = QuantumRegister(3, 'q')
+        self.assertEqual([cached._layout[qubit] for qubit in qr],
+                         [expected._layout[qubit] for qubit in qr])
+
+    def test_miss_on_other_values(self):
+        """Test circuits with other numeric parameters are not cache hits."""
+        cache = TranspileCache()
+        transpile(_circuit(0.5), self.backend, seed_transpiler=42, cache=cache)
+        transpile(_circuit(0.25), self.backend, seed_transpiler=42, cache=cache)
+        self.assertEqual(cache.stats(), {'hits': 0, 'misses': 2, 'size': 2})
+
+    def test_miss_on_other_registers(self):
+        """Test circuits with other register names are not cache hits."""
+        cache = TranspileCache()
+        transpile(_circuit(0.5), self.backend, seed_transpiler=42, cache=cache)
+        transpile(_circuit(0.5, creg_name='d'), self.backend, seed_transpiler=42, cache=cache)
+        self.assertEqual(cache.misses, 2)
+
+    def test_miss_on_other_options(self):
+        """Test the transpile options are part of the key."""
+        cache = TranspileCache()
+        transpile(_circuit(0.5), self.backend, seed_transpiler=42, cache=cache)
+        transpile(_circuit(0.5), self.backend, seed_transpiler=43, cache=cache)
+        transpile(_circuit(0.5), self.backend, seed_transpiler=42, optimization_level=2,
+                  cache=cache)
+        transpile(_circuit(0.5), basis_gates=['u3', 'cx'], coupling_map=[[0, 1], [1, 2]],
+                  seed_transpiler=42, cache=cache)
+        self.assertEqual(cache.stats(), {'hits': 0, 'misses': 4, 'size': 4})
+
+    def test_parameters_are_replaced(self):
+        """Test a hit returns the parameters of the circuit being transpiled."""
+        cache = TranspileCache()
+        theta, phi = Parameter('theta'), Parameter('phi')
+        transpile(_circuit(2 * theta), self.backend, seed_transpiler=42, cache=cache)
+        result = transpile(_circuit(2 * phi), self.backend, seed_transpiler=42, cache=cache)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(result.parameters, {phi})
+        expected = transpile(_circuit(1.0), self.backend, seed_transpiler=42)
+        self.assertEqual(result.bind_parameters({phi: 0.5}), expected)
+
+    def test_swapped_parameters(self):
+        """Test a hit with the cached parameters in another order."""
+        theta, phi = Parameter('theta'), Parameter('phi')
+        first = QuantumCircuit(2)
+        first.rx(theta, 0)
+        first.ry(phi, 1)
+        second = QuantumCircuit(2)
+        second.rx(phi, 0)
+        second.ry(theta, 1)
+        cache = TranspileCache()
+        transpile(first, basis_gates=['rx', 'ry'], cache=cache)
+        result = transpile(second, basis_gates=['rx', 'ry'], cache=cache)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(result, second)
+
+    def test_duplicates_in_batch(self):
+        """Test identical circuits in one batch are transpiled once."""
+        cache = TranspileCache()
+        circuits = [_circuit(0.5, 'a'), _circuit(0.5, 'b'), _circuit(0.25, 'c')]
+        result = transpile(circuits, self.backend, seed_transpiler=42, cache=cache)
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 2, 'size': 2})
+        self.assertEqual([circuit.name for circuit in result], ['a', 'b', 'c'])
+        self.assertEqual(result[0], result[1])
+
+    def test_duplicates_in_batch_evicted(self):
+        """Test duplicates are returned even if the cache evicted their first occurrence."""
+        cache = TranspileCache(max_size=1)
+        circuits = [_circuit(0.5, 'a'), _circuit(0.5, 'b'), _circuit(0.25, 'c')]
+        result = transpile(circuits, basis_gates=['u3', 'cx'], cache=cache)
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 2, 'size': 1})
+        self.assertEqual([circuit.name for circuit in result], ['a', 'b', 'c'])
+        self.assertEqual(result[0], result[1])
+        self.assertIsNot(result[0], result[1])
+
+    def test_lru_eviction(self):
+        """Test the least recently used circuit is evicted."""
+        cache = TranspileCache(max_size=2)
+        for theta in [0.1, 0.2, 0.1, 0.3, 0.1, 0.2]:
+            transpile(_circuit(theta), basis_gates=['u3', 'cx'], cache=cache)
+        self.assertEqual(cache.stats(), {'hits': 2, 'misses': 4, 'size': 2})
+
+    def test_callback_bypasses_cache(self):
+        """Test the cache is not used when a callback has to run."""
+        cache = TranspileCache()
+        calls = []
+        for _ in range(2):
+            transpile(_circuit(0.5), basis_gates=['u3', 'cx'], cache=cache,
+                      callback=lambda **kwargs: calls.append(kwargs['pass_']))
+        self.assertEqual(cache.stats(), {'hits': 0, 'misses': 0, 'size': 0})
+        self.assertTrue(calls)
+
+    def test_pass_manager_conflicts(self):
+        """Test the cache cannot be used with a pass manager."""
+        with self.assertRaises(TranspilerError):
+            transpile(_circuit(0.5), pass_manager=PassManager(), cache=TranspileCache())
+
+    def test_persistence(self):
+        """Test the cache can be saved and loaded from disk."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'cache.pickle')
+            cache = TranspileCache(filename=filename)
+            expected = transpile(_circuit(0.5), self.backend, seed_transpiler=42, cache=cache)
+            cache.save()
+
+            loaded = TranspileCache(filename=filename)
+            self.assertEqual(len(loaded), 1)
+            result = transpile(_circuit(0.5), self.backend, seed_transpiler=42, cache=loaded)
+            self.assertEqual(loaded.hits, 1)
+            self.assertEqual(result, expected)
+
+    def test_save_without_filename(self):
+        """Test saving a cache without a file name raises."""
+        with self.assertRaises(TranspilerError):
+            TranspileCache().save()
+
+    def test_invalid_size(self):
+        """Test the cache size must be positive."""
+        with self.assertRaises(TranspilerError):
+            TranspileCache(max_size=0)